@@ -0,0 +1,162 @@
+"""Benchmark: API-Latenz unter parallelen Clients, blockierend vs. AsyncDatabase.
+
+Startet die API per uvicorn in einem Subprozess gegen eine Temp-DB und
+laesst N parallele Clients (mit Denkpause) Requests schicken. Jeder
+zwanzigste Request ist eine teure Abfrage (Node-Statistik bzw. breite
+Volltextsuche), der Rest schnelle Einzelabrufe. Gemessen werden p50/p99
+der schnellen Requests, p50 der teuren und der Durchsatz:
+
+- inline: DB-Aufrufe laufen direkt im Event-Loop (Verhalten vor AsyncDatabase)
+- async:  DB-Aufrufe laufen im Thread-Pool der AsyncDatabase
+
+Verwendung:
+    python benchmarks/bench_async_api.py [--clients 100] [--duration 10] [--workflows 5000]
+"""
+import argparse
+import asyncio
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+from n8nManager.core.database import Database  # noqa: E402
+
+HEAVY = ("/api/nodes/usage", "/api/workflows/search?q=set&limit=50")
+
+
+class InlineDatabase:
+    """Awaitbar, fuehrt aber synchron im Event-Loop aus (Verhalten vor AsyncDatabase)."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def __getattr__(self, name):
+        attr = getattr(self.db, name)
+
+        async def call(*args, **kwargs):
+            return attr(*args, **kwargs)
+        return call
+
+    def close(self):
+        self.db.close()
+
+
+def _serve(db_path: str, mode: str, port: int, workers: int):
+    """Subprozess: API mit der gewuenschten DB-Fassade starten."""
+    import uvicorn
+    import n8nManager.api.server as server
+    from n8nManager.core.async_database import AsyncDatabase
+
+    server._db = Database(db_path)
+    server._adb = (AsyncDatabase(server._db, max_workers=workers) if mode == "async"
+                   else InlineDatabase(server._db))
+    uvicorn.run(server.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _sample_workflow(i: int) -> str:
+    nodes = [{"name": f"Node {n}", "type": f"n8n-nodes-base.set{n % 7}",
+              "parameters": {"value": f"set {i}-{n}"}} for n in range(15)]
+    return json.dumps({"name": f"Bench {i}", "nodes": nodes, "connections": {}})
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _client(http: httpx.AsyncClient, rng: random.Random, deadline: float,
+                  workflows: int, think: float, latencies: dict):
+    while time.perf_counter() < deadline:
+        kind = "heavy" if rng.random() < 0.05 else "fast"
+        if kind == "heavy":
+            url = rng.choice(HEAVY)
+        else:
+            url = f"/api/workflows/{rng.randint(1, workflows)}"
+        start = time.perf_counter()
+        resp = await http.get(url)
+        latencies[kind].append((time.perf_counter() - start) * 1000)
+        resp.raise_for_status()
+        await asyncio.sleep(rng.uniform(0, 2 * think))
+
+
+async def _load(port: int, clients: int, duration: float, workflows: int,
+                think: float) -> dict:
+    latencies = {"fast": [], "heavy": []}
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits,
+                                 timeout=60) as http:
+        for _ in range(100):  # warten bis der Server antwortet
+            try:
+                await http.get("/api/status")
+                break
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+        start = time.perf_counter()
+        await asyncio.gather(*(_client(http, random.Random(c), start + duration, workflows,
+                                       think, latencies) for c in range(clients)))
+        elapsed = time.perf_counter() - start
+    fast = sorted(latencies["fast"])
+    return {
+        "p50": statistics.median(fast),
+        "p99": fast[int(len(fast) * 0.99) - 1],
+        "heavy_p50": statistics.median(latencies["heavy"]),
+        "rps": (len(fast) + len(latencies["heavy"])) / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10, help="Sekunden pro Modus")
+    parser.add_argument("--workflows", type=int, default=5000)
+    parser.add_argument("--think", type=float, default=0.5,
+                        help="Mittlere Pause pro Client zwischen Requests (s)")
+    parser.add_argument("--workers", type=int, default=8, help="Threads der AsyncDatabase")
+    parser.add_argument("--serve", nargs=2, metavar=("DB", "MODUS"), help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve[0], args.serve[1], args.port, args.workers)
+        return 0
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        db = Database(db_path)
+        db.add_workflows_bulk([{"name": f"Bench {i}", "workflow_json": _sample_workflow(i)}
+                               for i in range(args.workflows)])
+        db.close()
+
+        for mode in ("inline", "async"):
+            port = _free_port()
+            proc = subprocess.Popen([sys.executable, __file__, "--serve", db_path, mode,
+                                     "--port", str(port), "--workers", str(args.workers)])
+            try:
+                results[mode] = asyncio.run(_load(port, args.clients, args.duration,
+                                                  args.workflows, args.think))
+            finally:
+                proc.terminate()
+                proc.wait()
+
+    print(f"\n{args.clients} Clients, {args.duration:.0f} s pro Modus, {args.workflows} Workflows\n")
+    print(f"{'Modus':<8} {'p50 schnell':>12} {'p99 schnell':>12} {'p50 teuer':>10} "
+          f"{'Requests/s':>11}")
+    for mode, r in results.items():
+        print(f"{mode:<8} {r['p50']:>9.1f} ms {r['p99']:>9.1f} ms {r['heavy_p50']:>7.1f} ms "
+              f"{r['rps']:>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Benchmark: Speicherbedarf und Lese-Latenz pro Kompressions-Codec.
+
+Legt fuer jeden verfuegbaren Codec eine DB mit identischen Workflows (plus
+Versionen) an und misst Dateigroesse nach VACUUM sowie get_workflow-Latenz.
+
+Verwendung:
+    python benchmarks/bench_compression.py [--workflows 500] [--versions 5]
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.compression import available_codecs  # noqa: E402
+from n8nManager.core.database import Database  # noqa: E402
+
+
+def _sample_workflow(i: int, nodes: int = 60) -> str:
+    wf_nodes = [{
+        "id": f"node-{i}-{n}",
+        "name": f"HTTP Request {n}",
+        "type": "n8n-nodes-base.httpRequest",
+        "typeVersion": 4,
+        "position": [250 + n * 200, 300],
+        "parameters": {
+            "url": f"https://api.example.com/v1/items/{n}",
+            "method": "POST",
+            "sendHeaders": True,
+            "headerParameters": {"parameters": [{"name": "Accept", "value": "application/json"}]},
+        },
+    } for n in range(nodes)]
+    connections = {f"HTTP Request {n}": {"main": [[{"node": f"HTTP Request {n + 1}",
+                                                    "type": "main", "index": 0}]]}
+                   for n in range(nodes - 1)}
+    return json.dumps({"name": f"Bench {i}", "nodes": wf_nodes, "connections": connections,
+                       "settings": {"executionOrder": "v1"}})
+
+
+def _run(path: Path, codec: str, workflows: int, versions: int) -> dict:
+    db = Database(path, compression=codec)
+    ids = []
+    for i in range(workflows):
+        wf_json = _sample_workflow(i)
+        wf_id = db.add_workflow(name=f"Bench {i}", workflow_json=wf_json)
+        for _ in range(versions):
+            db.add_version(wf_id, wf_json)
+        ids.append(wf_id)
+    db.vacuum()
+    size = path.stat().st_size
+
+    start = time.perf_counter()
+    for wf_id in ids:
+        db.get_workflow(wf_id)
+    read_us = (time.perf_counter() - start) / len(ids) * 1e6
+    db.close()
+    return {"size": size, "read_us": read_us}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=500)
+    parser.add_argument("--versions", type=int, default=5, help="Versionen pro Workflow")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec in available_codecs():
+            results[codec] = _run(Path(tmp) / f"{codec}.db", codec, args.workflows, args.versions)
+
+    base = results["none"]
+    print(f"{'Codec':<6} {'DB-Groesse':>12} {'Ersparnis':>10} {'get_workflow':>14}")
+    for codec, r in results.items():
+        saved = (1 - r["size"] / base["size"]) * 100
+        print(f"{codec:<6} {r['size'] / 1024:>9,.0f} KiB {saved:>9.0f}% {r['read_us']:>11.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
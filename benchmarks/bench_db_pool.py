@@ -0,0 +1,77 @@
+"""Benchmark: Verbindung pro Aufruf vs. gepoolte Verbindung.
+
+Vergleicht den Durchsatz von get_workflow und add_sync_entry.
+
+Verwendung:
+    python benchmarks/bench_db_pool.py [--ops 2000]
+"""
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.database import Database  # noqa: E402
+
+
+class PerCallDatabase(Database):
+    """Altes Verhalten: neue Verbindung + PRAGMAs bei jedem Aufruf."""
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+def _sample_workflow(i: int) -> str:
+    nodes = [{"name": f"Node {n}", "type": "n8n-nodes-base.set", "parameters": {"value": n}}
+             for n in range(20)]
+    return json.dumps({"name": f"Bench {i}", "nodes": nodes, "connections": {}})
+
+
+def _run(db: Database, ops: int) -> dict:
+    srv_id = db.add_server(name="bench", url="http://localhost:5678")
+    wf_id = db.add_workflow(name="Bench", workflow_json=_sample_workflow(0))
+
+    start = time.perf_counter()
+    for _ in range(ops):
+        db.get_workflow(wf_id)
+    read_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ops):
+        db.add_sync_entry(wf_id, srv_id, "push", "success", "bench")
+    write_s = time.perf_counter() - start
+
+    return {"get_workflow": ops / read_s, "add_sync_entry": ops / write_s}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=2000, help="Aufrufe pro Messung")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, cls in (("per-call", PerCallDatabase), ("pooled", Database)):
+            db = cls(Path(tmp) / f"{label}.db")
+            results[label] = _run(db, args.ops)
+            db.close()
+
+    print(f"{'Modus':<10} {'get_workflow/s':>16} {'add_sync_entry/s':>18}")
+    for label, r in results.items():
+        print(f"{label:<10} {r['get_workflow']:>16,.0f} {r['add_sync_entry']:>18,.0f}")
+    base, pooled = results["per-call"], results["pooled"]
+    print(f"\nSpeedup: get_workflow x{pooled['get_workflow'] / base['get_workflow']:.1f}, "
+          f"add_sync_entry x{pooled['add_sync_entry'] / base['add_sync_entry']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Benchmark: Lese-/Schreibdurchsatz der SQLite-Profile (safe, balanced, throughput).
+
+Pro Profil eine Temp-DB-Datei:
+- schreiben: einzelne add_workflow-Aufrufe (eine Transaktion pro Workflow)
+- lesen:     get_workflow auf zufaellige IDs und list_workflows_page
+- gemischt:  ein Schreib-Thread und mehrere Lese-Threads gleichzeitig
+
+Verwendung:
+    python benchmarks/bench_db_profiles.py [--workflows 2000] [--reads 20000] [--readers 4]
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.database import PROFILES, Database  # noqa: E402
+from n8nManager.core.workflow_parser import WorkflowAnalysis  # noqa: E402
+
+
+def _sample_workflow(i: int) -> WorkflowAnalysis:
+    nodes = [{"name": f"Node {n}", "type": "n8n-nodes-base.set",
+              "parameters": {"value": f"wert {i}-{n}"}} for n in range(10)]
+    return WorkflowAnalysis(json.dumps({"name": f"Bench {i}", "nodes": nodes,
+                                        "connections": {}}))
+
+
+def _rate(count: int, start: float) -> float:
+    return count / (time.perf_counter() - start)
+
+
+def _run(profile: str, payloads: list, reads: int, readers: int, duration: float) -> dict:
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "bench.db", profile=profile)
+        start = time.perf_counter()
+        for i, analysis in enumerate(payloads):
+            db.add_workflow(f"Bench {i}", analysis)
+        writes = _rate(len(payloads), start)
+
+        start = time.perf_counter()
+        for _ in range(reads):
+            db.get_workflow(rng.randint(1, len(payloads)))
+        point = _rate(reads, start)
+
+        start = time.perf_counter()
+        pages = reads // 20
+        for _ in range(pages):
+            db.list_workflows_page(limit=50)
+        page = _rate(pages, start)
+
+        # Gemischt: Lesende laufen, waehrend ein Thread weiter schreibt
+        stop = threading.Event()
+        counts = {"reads": 0, "writes": 0}
+        lock = threading.Lock()
+
+        def reader(seed: int):
+            local_rng, n = random.Random(seed), 0
+            while not stop.is_set():
+                db.get_workflow(local_rng.randint(1, len(payloads)))
+                n += 1
+            with lock:
+                counts["reads"] += n
+
+        def writer():
+            n = 0
+            while not stop.is_set():
+                db.update_workflow(rng.randint(1, len(payloads)), description=f"rev {n}")
+                n += 1
+            counts["writes"] = n
+
+        threads = [threading.Thread(target=reader, args=(r,)) for r in range(readers)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        time.sleep(duration)
+        stop.set()
+        for t in threads:
+            t.join()
+        db.close()
+    return {"writes": writes, "point": point, "page": page,
+            "mixed_reads": counts["reads"] / duration, "mixed_writes": counts["writes"] / duration}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=3, help="Sekunden gemischte Last")
+    args = parser.parse_args()
+
+    payloads = [_sample_workflow(i) for i in range(args.workflows)]
+    print(f"{args.workflows} Workflows, {args.reads} Lesezugriffe, "
+          f"gemischt: 1 Schreiber + {args.readers} Leser\n")
+    print(f"{'Profil':<11} {'Schreiben/s':>12} {'Lesen/s':>10} {'Seiten/s':>9} "
+          f"{'Mix lesen/s':>12} {'Mix schreiben/s':>16}")
+    for profile in PROFILES:
+        r = _run(profile, payloads, args.reads, args.readers, args.duration)
+        print(f"{profile:<11} {r['writes']:>12.0f} {r['point']:>10.0f} {r['page']:>9.0f} "
+              f"{r['mixed_reads']:>12.0f} {r['mixed_writes']:>16.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Benchmark: N8nClient mit gepooltem Client vs. neuem Client pro Request.
+
+Startet einen lokalen n8n-Stub (HTTP/1.1 Keep-Alive, optional TLS mit
+selbstsigniertem Zertifikat per openssl) und ruft N-mal get_workflow auf:
+
+- pro Request: neuer httpx.Client je Aufruf (Verhalten vor dem Pooling),
+  jeder Aufruf zahlt TCP- und ggf. TLS-Handshake
+- gepoolt:     ein langlebiger N8nClient mit Keep-Alive
+
+Verwendung:
+    python benchmarks/bench_n8n_client.py [--requests 500] [--tls]
+"""
+import argparse
+import json
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+from n8nManager.core.n8n_client import N8nClient  # noqa: E402
+
+WORKFLOW = json.dumps({"id": "1", "name": "Stub", "nodes": [], "connections": {}}).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive
+    disable_nagle_algorithm = True  # sonst 40 ms Delayed-ACK pro Antwort
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(WORKFLOW)))
+        self.end_headers()
+        self.wfile.write(WORKFLOW)
+
+    def log_message(self, *args):
+        pass
+
+
+class PerRequestClient(N8nClient):
+    """Neuer httpx.Client pro Request (Verhalten vor dem Pooling)."""
+
+    def _request(self, method: str, path: str, **kwargs) -> dict:
+        with httpx.Client(timeout=self.timeout, verify=False) as client:
+            resp = client.request(method, self._url(path), headers=self._headers, **kwargs)
+            resp.raise_for_status()
+            return resp.json() if resp.content else {}
+
+
+def _start_stub(tmp: str, tls: bool) -> tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    scheme = "http"
+    if tls:
+        cert, key = Path(tmp) / "cert.pem", Path(tmp) / "key.pem"
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+                        "-keyout", str(key), "-out", str(cert), "-days", "1",
+                        "-subj", "/CN=127.0.0.1"], check=True, capture_output=True)
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ctx.load_cert_chain(cert, key)
+        server.socket = ctx.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://127.0.0.1:{server.server_address[1]}"
+
+
+def _measure(client: N8nClient, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        result = client.get_workflow(str(i))
+        assert not result.get("error"), result
+    return (time.perf_counter() - start) * 1000 / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--tls", action="store_true", help="Stub per HTTPS (openssl noetig)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server, url = _start_stub(tmp, args.tls)
+        try:
+            results = {}
+            for label, cls in (("pro Request", PerRequestClient), ("gepoolt", N8nClient)):
+                with cls(url, "bench-key") as client:
+                    results[label] = _measure(client, args.requests)
+        finally:
+            server.shutdown()
+
+    print(f"\n{args.requests} Requests gegen {url.split(':')[0].upper()}-Stub\n")
+    print(f"{'Client':<12} {'ms/Request':>11} {'Requests/s':>11}")
+    for label, ms in results.items():
+        print(f"{label:<12} {ms:>11.2f} {1000 / ms:>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Benchmark: Retries und Circuit-Breaker des N8nClient gegen gestoerte Server.
+
+- wackelig: ein Stub antwortet zufaellig mit 502/503 (--error-rate).
+  Gemessen wird die Erfolgsquote ohne (retries=0) und mit Wiederholungen.
+- tot:      ein Socket nimmt Verbindungen an, antwortet aber nie. Gemessen
+  wird die Gesamtdauer von N Aufrufen mit Timeout -- mit Breaker warten nur
+  die ersten breaker_threshold Versuche den Timeout ab.
+
+Verwendung:
+    python benchmarks/bench_n8n_resilience.py [--calls 300] [--error-rate 0.2] [--timeout 1]
+"""
+import argparse
+import random
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.n8n_client import CircuitBreaker, N8nClient  # noqa: E402
+
+BODY = b'{"id": "1", "name": "Stub", "nodes": [], "connections": {}}'
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    error_rate = 0.0
+    rng = random.Random(1)
+
+    def do_GET(self):
+        code = self.rng.choice((502, 503)) if self.rng.random() < self.error_rate else 200
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _flaky(calls: int, error_rate: float) -> dict:
+    handler = type("Handler", (_FlakyHandler,), {"error_rate": error_rate})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    results = {}
+    try:
+        for retries in (0, 3):
+            # Eigener Breaker mit hoher Schwelle: hier zaehlen nur die Retries
+            breaker = CircuitBreaker(url, threshold=10 ** 6)
+            with N8nClient(url, "key", retries=retries, retry_backoff=0.01,
+                           breaker=breaker) as client:
+                ok = sum(not client.get_workflow("1").get("error") for _ in range(calls))
+            results[retries] = ok / calls
+    finally:
+        server.shutdown()
+    return results
+
+
+def _dead(calls: int, timeout: float) -> dict:
+    # Nimmt Verbindungen an (Backlog), liest aber nie: jeder Request laeuft in den Timeout
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(128)
+    url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+    results = {}
+    try:
+        for label, threshold in (("ohne Breaker", 10 ** 6), ("mit Breaker", 5)):
+            breaker = CircuitBreaker(url, threshold=threshold, cooldown=60)
+            with N8nClient(url, "key", timeout=timeout, retries=0, breaker=breaker) as client:
+                start = time.perf_counter()
+                for _ in range(calls):
+                    client.get_workflow("1")
+                results[label] = time.perf_counter() - start
+    finally:
+        sock.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--error-rate", type=float, default=0.2)
+    parser.add_argument("--dead-calls", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=1.0, help="Sekunden (Produktion: 15)")
+    args = parser.parse_args()
+
+    flaky = _flaky(args.calls, args.error_rate)
+    print(f"Wackeliger Server ({args.error_rate:.0%} 502/503), {args.calls} GETs")
+    for retries, rate in flaky.items():
+        print(f"  retries={retries}: {rate:.1%} erfolgreich")
+
+    dead = _dead(args.dead_calls, args.timeout)
+    print(f"\nToter Server, {args.dead_calls} GETs mit {args.timeout:.0f} s Timeout")
+    for label, elapsed in dead.items():
+        print(f"  {label:<13} {elapsed:>6.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
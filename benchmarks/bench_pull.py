@@ -0,0 +1,112 @@
+"""Benchmark: Pull grosser Server mit Cursor-Pagination und Streaming-Import.
+
+Startet einen n8n-Stub, der N Workflows seitenweise (limit/nextCursor)
+ausliefert, und zieht alle per pull_workflows() in eine Temp-DB. Gemessen
+werden Dauer, Anzahl importierter Workflows und der Spitzenwert des
+Python-Speichers (tracemalloc) -- er soll mit N nicht wachsen. Danach
+ein zweiter Pull ohne Aenderungen: inkrementell (Watermark) und mit full.
+
+Verwendung:
+    python benchmarks/bench_pull.py [--sizes 1000 5000] [--batch-size 200]
+"""
+import argparse
+import base64
+import json
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.database import Database  # noqa: E402
+from n8nManager.core.n8n_client import N8nClient  # noqa: E402
+from n8nManager.core.sync import pull_workflows  # noqa: E402
+
+
+def _workflow(i: int, seed: int = 0) -> dict:
+    nodes = [{"name": f"Node {n}", "type": "n8n-nodes-base.httpRequest",
+              "parameters": {"url": f"https://api{seed}.example.com/{i}/{n}", "method": "GET"}}
+             for n in range(15)]
+    return {"id": str(i), "name": f"Remote {i}", "nodes": nodes, "connections": {},
+            "updatedAt": f"2026-01-01T00:00:{i % 60:02d}.{i // 60:03d}Z"}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    total = 0
+    seed = 0  # unterscheidet die Workflows mehrerer Stubs
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        limit = int(query.get("limit", ["100"])[0])
+        # Cursor wie bei n8n: opak, base64 (mit + / =, muss URL-kodiert ankommen)
+        cursor = query.get("cursor", [""])[0]
+        offset = int(base64.b64decode(cursor).rstrip(b"+")) if cursor else 0
+        end = min(offset + limit, self.total)
+        page = {"data": [_workflow(i, self.seed) for i in range(offset, end)],
+                "nextCursor": base64.b64encode(f"{end:>08}+".encode()).decode()
+                if end < self.total else None}
+        body = json.dumps(page).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(size: int, batch_size: int) -> dict:
+    handler = type("Handler", (_StubHandler,), {"total": size})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(Path(tmp) / "pull.db")
+            server_id = db.add_server("stub", "http://stub")
+            with N8nClient(f"http://127.0.0.1:{server.server_address[1]}", "key") as client:
+                tracemalloc.start()
+                start = time.perf_counter()
+                result = pull_workflows(db, client, server_id, batch_size=batch_size)
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            assert not result["error"], result["error"]
+            stored = db.get_stats()["workflows"]
+            repull = {}
+            for label, full in (("incremental", False), ("full", True)):
+                with N8nClient(f"http://127.0.0.1:{server.server_address[1]}", "key") as client:
+                    start = time.perf_counter()
+                    pull_workflows(db, client, server_id, batch_size=batch_size, full=full)
+                    repull[label] = time.perf_counter() - start
+            db.close()
+    finally:
+        server.shutdown()
+    return {"elapsed": elapsed, "peak": peak, "imported": result["imported"],
+            "stored": stored, **repull}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'Workflows':>10} {'importiert':>11} {'in DB':>7} {'Dauer':>8} {'Spitze RAM':>11} "
+          f"{'erneut inkr.':>13} {'erneut full':>12}")
+    for size in args.sizes:
+        r = _run(size, args.batch_size)
+        print(f"{size:>10} {r['imported']:>11} {r['stored']:>7} {r['elapsed']:>6.1f} s "
+              f"{r['peak'] / 1e6:>8.1f} MB {r['incremental']:>11.2f} s {r['full']:>10.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Benchmark: pull --all ueber mehrere n8n-Server, sequentiell vs. gleichzeitig.
+
+Startet N n8n-Stubs mit kuenstlicher Latenz pro Seite und zieht alle per
+pull_all() in eine Temp-DB -- einmal mit concurrency=1 (entspricht einem
+Pull pro Server nacheinander) und mit hoeherer Parallelitaet. Geschrieben
+wird immer ueber den einen Writer-Thread.
+
+Verwendung:
+    python benchmarks/bench_pull_all.py [--servers 12] [--workflows 300] [--latency 150]
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_pull import _StubHandler  # noqa: E402
+from n8nManager.core.database import Database  # noqa: E402
+from n8nManager.core.n8n_client import aclose_clients  # noqa: E402
+from n8nManager.core.sync import pull_all  # noqa: E402
+
+
+class _SlowHandler(_StubHandler):
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)  # Netz + n8n-Antwortzeit
+        super().do_GET()
+
+
+def _start_stubs(count: int, workflows: int, latency: float) -> list[ThreadingHTTPServer]:
+    stubs = []
+    for s in range(count):
+        handler = type("Handler", (_SlowHandler,),
+                       {"total": workflows, "seed": s, "latency": latency})
+        stub = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=stub.serve_forever, daemon=True).start()
+        stubs.append(stub)
+    return stubs
+
+
+def _run(stubs: list, concurrency: int) -> tuple[float, list[dict]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "pull.db")
+        for i, stub in enumerate(stubs):
+            db.add_server(f"srv{i}", f"http://127.0.0.1:{stub.server_address[1]}", "key")
+
+        async def main():
+            try:
+                return await pull_all(db, db.list_servers(), concurrency=concurrency)
+            finally:
+                await aclose_clients()
+
+        start = time.perf_counter()
+        reports = asyncio.run(main())
+        elapsed = time.perf_counter() - start
+        assert db.get_stats()["workflows"] == sum(r["imported"] for r in reports)
+        db.close()
+    return elapsed, reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=12)
+    parser.add_argument("--workflows", type=int, default=300, help="Workflows pro Server")
+    parser.add_argument("--latency", type=float, default=150, help="ms pro Seite")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 12])
+    args = parser.parse_args()
+
+    stubs = _start_stubs(args.servers, args.workflows, args.latency / 1000)
+    try:
+        print(f"{args.servers} Server x {args.workflows} Workflows, "
+              f"{args.latency:.0f} ms Latenz pro Seite\n")
+        print(f"{'Parallel':>8} {'Dauer':>8} {'importiert':>11} {'Fehler':>7}")
+        for concurrency in args.concurrency:
+            elapsed, reports = _run(stubs, concurrency)
+            print(f"{concurrency:>8} {elapsed:>6.1f} s {sum(r['imported'] for r in reports):>11} "
+                  f"{sum(r['errors'] for r in reports):>7}")
+    finally:
+        for stub in stubs:
+            stub.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
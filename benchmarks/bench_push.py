@@ -0,0 +1,141 @@
+"""Benchmark: Batch-Push vieler Workflows vs. ein Push nach dem anderen.
+
+Startet einen n8n-Stub mit fester Antwortzeit pro Request (simuliert
+Netz-Latenz und n8n-Verarbeitung) und pusht N Workflows auf einen Server:
+
+- sequentiell: Verhalten von `push <id>` in einer Schleife -- ein Request,
+  update_workflow und add_sync_entry pro Workflow
+- Batch:       push_batch() mit Worker-Pool, record_pushes() je Batch
+
+Danach wird unveraendert erneut deployt: mit Remote-Cache (kein Request),
+mit verify (ein GET pro Workflow) und mit force (ein PUT pro Workflow).
+
+Verwendung:
+    python benchmarks/bench_push.py [--workflows 300] [--latency 0.05] [--concurrency 8]
+"""
+import argparse
+import itertools
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.database import Database  # noqa: E402
+from n8nManager.core.n8n_client import N8nClient  # noqa: E402
+from n8nManager.core.sync import run_push_batch, select_workflows  # noqa: E402
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.05
+    ids = itertools.count(1)
+    store: dict = {}
+    requests = 0
+
+    def _reply(self, workflow: dict):
+        type(self).requests += 1
+        time.sleep(self.latency)
+        body = json.dumps(workflow).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read(self) -> dict:
+        return json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+    def do_POST(self):
+        workflow_id = str(next(self.ids))
+        self.store[workflow_id] = {**self._read(), "id": workflow_id}
+        self._reply(self.store[workflow_id])
+
+    def do_PUT(self):
+        workflow_id = self.path.rsplit("/", 1)[1]
+        self.store[workflow_id] = {**self._read(), "id": workflow_id}
+        self._reply(self.store[workflow_id])
+
+    def do_GET(self):
+        self._reply(self.store[self.path.rsplit("/", 1)[1]])
+
+    def log_message(self, *args):
+        pass
+
+
+def _fill(db: Database, count: int):
+    for i in range(count):
+        nodes = [{"name": f"Node {n}", "type": "n8n-nodes-base.set", "parameters": {"n": n}}
+                 for n in range(10)]
+        wf = {"name": f"Deploy {i}", "nodes": nodes, "connections": {}}
+        db.add_workflow(wf["name"], json.dumps(wf))
+
+
+def _sequential(db: Database, server: dict) -> float:
+    start = time.perf_counter()
+    with N8nClient(server["url"], server["api_key"]) as client:
+        for wf in db.list_workflows():
+            result = client.create_workflow(json.loads(wf["workflow_json"]))
+            assert not result.get("error"), result
+            n8n_id = str(result["id"])
+            db.update_workflow(wf["id"], n8n_id=n8n_id, server_id=server["id"])
+            db.add_sync_entry(wf["id"], server["id"], "push", "success", f"n8n_id={n8n_id}",
+                              imported=1)
+    return time.perf_counter() - start
+
+
+def _batch(db: Database, server: dict, concurrency: int, **options) -> float:
+    start = time.perf_counter()
+    workflows, _ = select_workflows(db)
+    results = run_push_batch(db, workflows, [server], concurrency=concurrency, **options)
+    assert all(r["status"] == "success" for r in results), results
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05, help="Sekunden pro Stub-Request")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    handler = type("Handler", (_StubHandler,), {"latency": args.latency, "store": {}})
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{stub.server_address[1]}"
+    results = {}
+    try:
+        for label in ("sequentiell", "Batch"):
+            with tempfile.TemporaryDirectory() as tmp:
+                db = Database(Path(tmp) / "push.db")
+                server = db.get_server(db.add_server("stub", url, "key"))
+                _fill(db, args.workflows)
+                handler.requests = 0
+                if label == "Batch":
+                    results[label] = (_batch(db, server, args.concurrency), handler.requests)
+                    for again, options in (("erneut Cache", {}), ("erneut verify", {"verify": True}),
+                                           ("erneut force", {"force": True})):
+                        handler.requests = 0
+                        results[again] = (_batch(db, server, args.concurrency, **options),
+                                          handler.requests)
+                else:
+                    results[label] = (_sequential(db, server), handler.requests)
+                db.close()
+    finally:
+        stub.shutdown()
+
+    print(f"\n{args.workflows} Workflows, {args.latency * 1000:.0f} ms pro Request, "
+          f"Batch mit {args.concurrency} Workern\n")
+    print(f"{'Modus':<14} {'Dauer':>8} {'Workflows/s':>12} {'Requests':>9}")
+    for label, (elapsed, requests) in results.items():
+        print(f"{label:<14} {elapsed:>6.2f} s {args.workflows / elapsed:>12.0f} {requests:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
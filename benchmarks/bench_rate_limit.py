@@ -0,0 +1,120 @@
+"""Benchmark: Client-Rate-Limit gegen kleine n8n-Instanzen.
+
+Startet mehrere Stubs, die wie eine kleine n8n-Instanz hoechstens
+--capacity Requests gleichzeitig bearbeiten und darueber mit 503 antworten.
+Pro Server feuern --workers Threads GETs:
+
+- unbegrenzt:   der Client schiesst so schnell er kann (Retries fangen 503 ab)
+- max_in_flight: RateLimiter mit max_in_flight = capacity pro Server
+
+Gemessen: Gesamtdauer, Requests/s ueber die Flotte, 503 am Server, Fehler.
+
+Verwendung:
+    python benchmarks/bench_rate_limit.py [--servers 4] [--requests 150] [--workers 16]
+"""
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.n8n_client import CircuitBreaker, N8nClient, RateLimiter  # noqa: E402
+
+BODY = b'{"id": "1", "name": "Stub", "nodes": [], "connections": {}}'
+
+
+class _SmallInstance(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    capacity = 4
+    work = 0.02  # Sekunden pro Request
+
+    def do_GET(self):
+        state = self.server.state
+        with state["lock"]:
+            overloaded = state["active"] >= self.capacity
+            if overloaded:
+                state["rejected"] += 1
+            else:
+                state["active"] += 1
+        if overloaded:
+            self._send(503, b"{}")
+            return
+        time.sleep(self.work)
+        with state["lock"]:
+            state["active"] -= 1
+        self._send(200, BODY)
+
+    def _send(self, code: int, body: bytes):
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(servers: int, requests: int, workers: int, capacity: int, limited: bool) -> dict:
+    handler = type("Handler", (_SmallInstance,), {"capacity": capacity})
+    stubs, clients = [], []
+    for _ in range(servers):
+        stub = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        stub.request_queue_size = 256
+        stub.state = {"lock": threading.Lock(), "active": 0, "rejected": 0}
+        threading.Thread(target=stub.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{stub.server_address[1]}"
+        limiter = RateLimiter(url, max_in_flight=capacity if limited else 0)
+        clients.append(N8nClient(url, "key", retry_backoff=0.05, max_connections=workers,
+                                 breaker=CircuitBreaker(url, threshold=10 ** 6),
+                                 limiter=limiter))
+        stubs.append(stub)
+    errors = [0]
+    lock = threading.Lock()
+
+    def worker(client: N8nClient, count: int):
+        failed = sum(bool(client.get_workflow("1").get("error")) for _ in range(count))
+        with lock:
+            errors[0] += failed
+
+    per_worker = requests // workers
+    threads = [threading.Thread(target=worker, args=(client, per_worker))
+               for client in clients for _ in range(workers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    for stub, client in zip(stubs, clients):
+        client.close()
+        stub.shutdown()
+    total = per_worker * workers * servers
+    return {"elapsed": elapsed, "rate": (total - errors[0]) / elapsed,
+            "rejected": sum(s.state["rejected"] for s in stubs), "errors": errors[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=160, help="Requests pro Server")
+    parser.add_argument("--workers", type=int, default=16, help="Threads pro Server")
+    parser.add_argument("--capacity", type=int, default=4, help="Gleichzeitige Requests je Stub")
+    args = parser.parse_args()
+
+    print(f"{args.servers} Server, je {args.requests} GETs von {args.workers} Threads, "
+          f"Kapazitaet {args.capacity}\n")
+    print(f"{'Client':<15} {'Dauer':>8} {'Req/s':>7} {'503 am Server':>14} {'Fehler':>7}")
+    for label, limited in (("unbegrenzt", False), ("max_in_flight", True)):
+        r = _run(args.servers, args.requests, args.workers, args.capacity, limited)
+        print(f"{label:<15} {r['elapsed']:>6.2f} s {r['rate']:>7.0f} {r['rejected']:>14} "
+              f"{r['errors']:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Benchmark: Latenz der FTS5-Volltextsuche auf einem grossen Korpus.
+
+Importiert N synthetische Workflows per add_workflows_bulk und misst
+search_workflows fuer seltene, haeufige und Praefix-Begriffe (Median/p95).
+
+Verwendung:
+    python benchmarks/bench_search.py [--workflows 10000] [--repeat 50]
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.database import Database  # noqa: E402
+
+# Realistischere Verteilung: viele Node-Typen/Hosts, jeder Workflow nutzt wenige
+NODE_TYPES = tuple(f"n8n-nodes-base.{t}" for t in (
+    "httpRequest", "slack", "set", "code", "if", "postgres", "mysql", "googleSheets",
+    "gmail", "telegram", "discord", "notion", "airtable", "github", "jira", "trello",
+    "hubspot", "salesforce", "stripe", "shopify", "awsS3", "ftp", "ssh", "redis",
+    "mongoDb", "openAi", "merge", "splitInBatches", "wait", "switch", "emailSend",
+    "rssFeedRead", "xml", "html", "dateTime", "crypto", "compression", "spreadsheetFile",
+))
+HOSTS = tuple(f"{svc}.{dom}" for svc in ("api", "crm", "erp", "hooks", "files", "auth",
+                                            "billing", "search", "mail", "cdn")
+              for dom in ("example.com", "internal", "local", "corp.net", "partner.io",
+                          "vendor.de", "cloud.app", "eu.service", "us.service", "test"))
+
+
+def _sample_workflow(i: int, rng: random.Random) -> dict:
+    nodes = [{"name": "Webhook", "type": "n8n-nodes-base.webhook",
+              "parameters": {"path": f"hook-{i}"}}]
+    for n in range(rng.randint(4, 20)):
+        ntype = rng.choice(NODE_TYPES)
+        nodes.append({
+            "name": f"{ntype.rsplit('.', 1)[-1]} {n}",
+            "type": ntype,
+            "parameters": {
+                "url": f"https://{rng.choice(HOSTS)}/v1/items/{i}/{n}",
+                "channel": f"#team-{rng.randint(1, 200)}",
+                "options": {"timeout": rng.randint(1, 60) * 1000},
+            },
+        })
+    return {"name": f"Workflow {i}", "nodes": nodes, "connections": {}}
+
+
+def _measure(db: Database, query: str, repeat: int) -> tuple[float, float, int]:
+    timings = []
+    hits = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows, _ = db.search_workflows(query, limit=20)
+        timings.append((time.perf_counter() - start) * 1000)
+        hits = len(rows)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # Von sehr selektiv bis "trifft alles" (https: jeder Workflow, Worst Case)
+    queries = ("hook-4242", "#team-17", "crm.internal", "slack", "postg*",
+               "api.example.com items", "https")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "search.db")
+        start = time.perf_counter()
+        db.add_workflows_bulk([{"name": f"Workflow {i}",
+                                "workflow_json": json.dumps(_sample_workflow(i, rng))}
+                               for i in range(args.workflows)])
+        print(f"{args.workflows} Workflows indexiert in {time.perf_counter() - start:.1f} s\n")
+
+        print(f"{'Suche':<24} {'Treffer':>8} {'Median':>10} {'p95':>10}")
+        for query in queries:
+            median, p95, hits = _measure(db, query, args.repeat)
+            print(f"{query:<24} {hits:>8} {median:>7.2f} ms {p95:>7.2f} ms")
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
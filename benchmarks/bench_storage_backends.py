@@ -0,0 +1,85 @@
+"""Benchmark: parallele Schreiber pro Server auf den Storage-Backends.
+
+Ein Thread pro Server schreibt Workflows per upsert_workflow (eine
+Transaktion pro Workflow, wie beim Pull). Gemessen werden Durchsatz und
+p50/p99 der Schreiblatenz fuer sqlite (eine Datei), sharded (eine Datei
+pro Server) und memory.
+
+Verwendung:
+    python benchmarks/bench_storage_backends.py [--servers 8] [--workflows 300]
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from n8nManager.core.storage import BACKENDS, open_backend  # noqa: E402
+from n8nManager.core.workflow_parser import WorkflowAnalysis  # noqa: E402
+
+
+def _sample_workflow(server: int, i: int) -> WorkflowAnalysis:
+    nodes = [{"name": f"Node {n}", "type": "n8n-nodes-base.httpRequest",
+              "parameters": {"url": f"https://api{server}.example.com/{i}/{n}"}}
+             for n in range(12)]
+    return WorkflowAnalysis(json.dumps({"name": f"S{server} W{i}", "nodes": nodes,
+                                        "connections": {}}))
+
+
+def _run(backend: str, servers: int, workflows: int) -> dict:
+    # Parsen vorab, gemessen wird nur das Schreiben
+    payloads = [[_sample_workflow(s, i) for i in range(workflows)] for s in range(servers)]
+    with tempfile.TemporaryDirectory() as tmp:
+        db = open_backend(backend, Path(tmp) / "bench.db")
+        server_ids = [db.add_server(f"srv{s}", f"http://srv{s}") for s in range(servers)]
+        latencies = []
+        lock = threading.Lock()
+
+        def writer(s: int):
+            own = []
+            for i, analysis in enumerate(payloads[s]):
+                start = time.perf_counter()
+                db.upsert_workflow(f"S{s} W{i}", analysis, server_id=server_ids[s],
+                                   n8n_id=str(i))
+                own.append((time.perf_counter() - start) * 1000)
+            with lock:
+                latencies.extend(own)
+
+        threads = [threading.Thread(target=writer, args=(s,)) for s in range(servers)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        assert db.get_stats()["workflows"] == servers * workflows
+        db.close()
+    latencies.sort()
+    return {
+        "rate": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=8)
+    parser.add_argument("--workflows", type=int, default=300, help="Workflows pro Server")
+    args = parser.parse_args()
+
+    print(f"{args.servers} Server x {args.workflows} Workflows\n")
+    print(f"{'Backend':<8} {'Workflows/s':>12} {'p50':>10} {'p99':>10}")
+    for backend in BACKENDS:
+        r = _run(backend, args.servers, args.workflows)
+        print(f"{backend:<8} {r['rate']:>12.0f} {r['p50']:>7.2f} ms {r['p99']:>7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
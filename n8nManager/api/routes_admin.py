@@ -0,0 +1,52 @@
+"""API-Routen fuer Wartungsaufgaben (Reindex, Zaehler-Check)."""
+import asyncio
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+
+router = APIRouter()
+
+def _get_db():
+    from n8nManager.api.server import get_async_db
+    return get_async_db()
+
+# Zustand des laufenden bzw. letzten Reindex (ein Lauf pro Prozess)
+_reindex = {"running": False, "stats": None, "error": None}
+_task = None  # Referenz halten, sonst kann der Task eingesammelt werden
+
+async def _run_reindex(db, jobs: Optional[int], dry_run: bool, restart: bool):
+    from n8nManager.core.reindex import reindex
+
+    def progress(stats):
+        _reindex["stats"] = dict(stats, errors=list(stats["errors"]))
+
+    try:
+        # Eigener Thread statt DB-Pool: der Lauf blockiert sonst einen DB-Worker
+        stats = await asyncio.to_thread(reindex, db.db, jobs=jobs, dry_run=dry_run,
+                                        restart=restart, progress=progress)
+        _reindex["stats"] = stats
+    except Exception as e:
+        _reindex["error"] = str(e)
+    finally:
+        _reindex["running"] = False
+
+@router.post("/admin/reindex", status_code=202)
+async def start_reindex(dry_run: bool = False, restart: bool = False,
+                        jobs: Optional[int] = Query(None, ge=1)):
+    """Reindex im Hintergrund starten; Fortschritt via GET /api/admin/reindex."""
+    if _reindex["running"]:
+        raise HTTPException(status_code=409, detail="Reindex laeuft bereits")
+    global _task
+    _reindex.update(running=True, stats=None, error=None)
+    _task = asyncio.create_task(_run_reindex(_get_db(), jobs, dry_run, restart))
+    return {"message": "Reindex gestartet", "dry_run": dry_run}
+
+@router.get("/admin/reindex")
+async def reindex_status():
+    return _reindex
+
+@router.get("/admin/stats/check")
+async def check_stats(repair: bool = False):
+    """Materialisierte Zaehler gegen die Tabellen pruefen (voller Scan)."""
+    db = _get_db()
+    diffs = await db.check_stats(repair=repair)
+    return {"consistent": not diffs, "repaired": repair and bool(diffs), "diffs": diffs}
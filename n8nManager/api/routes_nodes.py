@@ -0,0 +1,33 @@
+"""API-Routen fuer Node-Abfragen (workflow_nodes, node_catalog)."""
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+
+router = APIRouter()
+
+def _get_db():
+    from n8nManager.api.server import get_async_db
+    return get_async_db()
+
+@router.get("/nodes/catalog")
+async def list_node_catalog():
+    db = _get_db()
+    catalog = await db.list_node_catalog()
+    return {"data": catalog, "count": len(catalog)}
+
+@router.get("/nodes/usage")
+async def node_usage():
+    """Nutzung pro Node-Typ (Nodes, Workflows) inkl. node_catalog-Infos."""
+    db = _get_db()
+    usage = await db.node_usage()
+    return {"data": usage, "count": len(usage)}
+
+@router.get("/nodes/workflows")
+async def find_workflows_by_node(type: Optional[str] = None, host: Optional[str] = None,
+                                 limit: Optional[int] = Query(None, ge=1, le=10000)):
+    """Workflows mit Node-Typ (Praefix mit *) und/oder HTTP-Host."""
+    db = _get_db()
+    try:
+        workflows = await db.find_workflows_by_node(node_type=type, host=host, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"data": workflows, "count": len(workflows)}
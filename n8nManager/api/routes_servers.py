@@ -1,52 +1,62 @@
 """API-Routen fuer Server-Verwaltung."""
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
 router = APIRouter()
 
 def _get_db():
-    from n8nManager.api.server import get_db
-    return get_db()
+    from n8nManager.api.server import get_async_db
+    return get_async_db()
 
 class ServerCreate(BaseModel):
     name: str
     url: str
     api_key: str = ""
     is_default: bool = False
+    rate_limit: float = Field(0, ge=0)  # Requests/s, 0 = unbegrenzt
+    max_in_flight: int = Field(0, ge=0)
 
 class ServerUpdate(BaseModel):
     name: Optional[str] = None
     url: Optional[str] = None
     api_key: Optional[str] = None
     is_default: Optional[bool] = None
+    rate_limit: Optional[float] = Field(None, ge=0)
+    max_in_flight: Optional[int] = Field(None, ge=0)
+
+def _with_live_state(srv: dict) -> dict:
+    """Server-Datensatz plus Circuit-Breaker (circuit) und RateLimiter (limiter)."""
+    from n8nManager.core.n8n_client import circuit_state, limiter_state
+    return {**srv, "circuit": circuit_state(srv["url"]), "limiter": limiter_state(srv["url"])}
 
 @router.get("/servers")
 async def list_servers():
     db = _get_db()
-    servers = db.list_servers()
+    servers = [_with_live_state(srv) for srv in await db.list_servers()]
     return {"data": servers, "count": len(servers)}
 
 @router.get("/servers/{server_id}")
 async def get_server(server_id: int):
     db = _get_db()
-    srv = db.get_server(server_id)
+    srv = await db.get_server(server_id)
     if not srv:
         raise HTTPException(status_code=404, detail="Server nicht gefunden")
-    return srv
+    return _with_live_state(srv)
 
 @router.post("/servers")
 async def create_server(body: ServerCreate):
     db = _get_db()
-    srv_id = db.add_server(
-        name=body.name, url=body.url, api_key=body.api_key, is_default=body.is_default
+    srv_id = await db.add_server(
+        name=body.name, url=body.url, api_key=body.api_key, is_default=body.is_default,
+        rate_limit=body.rate_limit, max_in_flight=body.max_in_flight
     )
     return {"id": srv_id, "message": "Server hinzugefuegt"}
 
 @router.put("/servers/{server_id}")
 async def update_server(server_id: int, body: ServerUpdate):
     db = _get_db()
-    srv = db.get_server(server_id)
+    srv = await db.get_server(server_id)
     if not srv:
         raise HTTPException(status_code=404, detail="Server nicht gefunden")
     updates = {}
@@ -56,28 +66,40 @@ async def update_server(server_id: int, body: ServerUpdate):
         updates["url"] = body.url
     if body.api_key is not None:
         updates["api_key"] = body.api_key
+    if body.rate_limit is not None:
+        updates["rate_limit"] = body.rate_limit
+    if body.max_in_flight is not None:
+        updates["max_in_flight"] = body.max_in_flight
     if body.is_default is not None:
         if body.is_default:
-            db.set_default_server(server_id)
+            await db.set_default_server(server_id)
         else:
             updates["is_default"] = 0
     if updates:
-        db.update_server(server_id, **updates)
+        await db.update_server(server_id, **updates)
+    if body.rate_limit is not None or body.max_in_flight is not None:
+        # Laufende Clients sofort auf die neuen Grenzen setzen
+        from n8nManager.core.n8n_client import get_limiter
+        srv = await db.get_server(server_id)
+        get_limiter(srv["url"], srv["rate_limit"], srv["max_in_flight"])
     return {"message": "Server aktualisiert"}
 
 @router.post("/servers/{server_id}/ping")
 async def ping_server(server_id: int):
     db = _get_db()
-    srv = db.get_server(server_id)
+    srv = await db.get_server(server_id)
     if not srv:
         raise HTTPException(status_code=404, detail="Server nicht gefunden")
     if not srv.get("api_key"):
         raise HTTPException(status_code=400, detail="Kein API-Key konfiguriert")
-    from n8nManager.core.n8n_client import N8nClient
-    client = N8nClient(base_url=srv["url"], api_key=srv["api_key"])
-    result = client.ping()
+    from n8nManager.core.n8n_client import get_async_client
+    client = await get_async_client(srv)
+    result = await client.ping()
     from datetime import datetime
     now = datetime.utcnow().isoformat()
-    status = "online" if result.get("ok") else "offline"
-    db.update_server(server_id, last_ping=now, status=status)
+    if result.get("ok"):
+        status = "online"
+    else:
+        status = "circuit_open" if result.get("circuit") == "open" else "offline"
+    await db.update_server(server_id, last_ping=now, status=status)
     return {"server_id": server_id, "status": status, "detail": result}
@@ -1,89 +1,154 @@
 """API-Routen fuer Sync (Push/Pull mit n8n-Servern)."""
-import json
-from fastapi import APIRouter, HTTPException
+import time
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+from typing import Optional
 
 router = APIRouter()
 
 def _get_db():
-    from n8nManager.api.server import get_db
-    return get_db()
+    from n8nManager.api.server import get_async_db
+    return get_async_db()
+
+class PushBatch(BaseModel):
+    workflow_ids: list[int] = []  # leer: alle (ggf. mit tag gefiltert)
+    tag: Optional[str] = None
+    server_ids: list[int] = []  # leer: Default-Server
+    concurrency: int = Field(0, ge=0, le=64)  # 0 = config n8n.push_concurrency
+    verify: bool = False  # Remote-Stand holen und vergleichen
+    force: bool = False  # auch unveraenderte Workflows pushen
 
 @router.post("/export/{workflow_id}/to-server")
-async def push_to_server(workflow_id: int, server_id: int = 0):
-    """Workflow auf n8n-Server pushen."""
+async def push_to_server(workflow_id: int, server_id: int = 0, verify: bool = False,
+                         force: bool = False):
+    """Workflow auf n8n-Server pushen (unveraendert laut Remote-Cache: kein Request)."""
     db = _get_db()
-    wf = db.get_workflow(workflow_id)
+    wf = await db.get_workflow(workflow_id)
     if not wf:
         raise HTTPException(status_code=404, detail="Workflow nicht gefunden")
     if server_id == 0:
-        srv = db.get_default_server()
+        srv = await db.get_default_server()
         if not srv:
             raise HTTPException(status_code=400, detail="Kein Default-Server konfiguriert")
-        server_id = srv["id"]
     else:
-        srv = db.get_server(server_id)
+        srv = await db.get_server(server_id)
         if not srv:
             raise HTTPException(status_code=404, detail="Server nicht gefunden")
     if not srv.get("api_key"):
         raise HTTPException(status_code=400, detail="Kein API-Key fuer diesen Server")
-    from n8nManager.core.n8n_client import N8nClient
-    client = N8nClient(base_url=srv["url"], api_key=srv["api_key"])
-    wf_data = json.loads(wf["workflow_json"])
-    if wf.get("n8n_id"):
-        result = client.update_workflow(wf["n8n_id"], wf_data)
-    else:
-        result = client.create_workflow(wf_data)
-    if result.get("error"):
-        db.add_sync_entry(workflow_id, server_id, "push", "error", json.dumps(result))
-        raise HTTPException(status_code=502, detail=result.get("detail", "Push fehlgeschlagen"))
-    n8n_id = str(result.get("id", ""))
-    if n8n_id:
-        db.update_workflow(workflow_id, n8n_id=n8n_id, server_id=server_id)
-    db.add_sync_entry(workflow_id, server_id, "push", "success", f"n8n_id={n8n_id}")
-    return {"message": "Workflow gepusht", "n8n_id": n8n_id}
+    from n8nManager.core.sync import push_batch
+    result = (await push_batch(db.db, [wf], [srv], verify=verify, force=force))[0]
+    if result["error"]:
+        raise HTTPException(status_code=502, detail=result["error"])
+    message = "Workflow unveraendert" if result["action"] == "skip" else "Workflow gepusht"
+    return {"message": message, "n8n_id": result["n8n_id"], "action": result["action"]}
+
+@router.post("/push/batch")
+async def push_batch_to_servers(req: PushBatch):
+    """Viele Workflows auf einen oder mehrere Server pushen, Ergebnis pro Push."""
+    db = _get_db()
+    servers = []
+    for server_id in dict.fromkeys(req.server_ids):
+        srv = await db.get_server(server_id)
+        if not srv:
+            raise HTTPException(status_code=404, detail=f"Server {server_id} nicht gefunden")
+        servers.append(srv)
+    if not servers:
+        srv = await db.get_default_server()
+        if not srv:
+            raise HTTPException(status_code=400, detail="Kein Default-Server konfiguriert")
+        servers.append(srv)
+    from n8nManager.core.config import load_config
+    from n8nManager.core.sync import DEFAULT_PUSH_CONCURRENCY, push_batch, select_workflows
+    workflows, missing = await db.run(select_workflows, db.db, req.workflow_ids or None, req.tag)
+    if missing:
+        raise HTTPException(status_code=404,
+                            detail=f"Workflows nicht gefunden: {', '.join(map(str, missing))}")
+    concurrency = req.concurrency or load_config().get("n8n", {}).get(
+        "push_concurrency", DEFAULT_PUSH_CONCURRENCY)
+    start = time.perf_counter()
+    results = await push_batch(db.db, workflows, servers, concurrency=concurrency,
+                               verify=req.verify, force=req.force)
+    failed = sum(r["status"] != "success" for r in results)
+    return {"results": results, "pushed": len(results) - failed, "errors": failed,
+            "unchanged": sum(r["action"] == "skip" for r in results),
+            "elapsed": round(time.perf_counter() - start, 3)}
+
+@router.post("/pull/all")
+async def pull_from_all_servers(concurrency: int = Query(0, ge=0, le=64),
+                                batch_size: int = Query(200, ge=1, le=5000),
+                                full: bool = False):
+    """Alle Server gleichzeitig ziehen (vor /pull/{server_id} registriert)."""
+    db = _get_db()
+    servers = await db.list_servers()
+    if not servers:
+        raise HTTPException(status_code=400, detail="Kein Server konfiguriert")
+    from n8nManager.core.config import load_config
+    from n8nManager.core.sync import DEFAULT_CONCURRENCY, DEFAULT_PER_SERVER, pull_all
+    n8n_cfg = load_config().get("n8n", {})
+    reports = await pull_all(
+        db.db, servers, batch_size=batch_size,
+        concurrency=concurrency or n8n_cfg.get("pull_concurrency", DEFAULT_CONCURRENCY),
+        per_server=n8n_cfg.get("pull_per_server", DEFAULT_PER_SERVER), full=full)
+    return {"servers": reports,
+            "imported": sum(r["imported"] for r in reports),
+            "updated": sum(r["updated"] for r in reports),
+            "errors": sum(r["errors"] for r in reports)}
 
 @router.post("/pull/{server_id}")
-async def pull_from_server(server_id: int):
-    """Alle Workflows vom n8n-Server ziehen."""
+async def pull_from_server(server_id: int, full: bool = False):
+    """Workflows vom n8n-Server ziehen (inkrementell ab der Watermark, full=true: alle)."""
     db = _get_db()
-    srv = db.get_server(server_id)
+    srv = await db.get_server(server_id)
     if not srv:
         raise HTTPException(status_code=404, detail="Server nicht gefunden")
-    from n8nManager.core.n8n_client import N8nClient
-    from n8nManager.core.workflow_parser import compute_content_hash
-    client = N8nClient(base_url=srv["url"], api_key=srv["api_key"])
-    result = client.list_workflows()
-    if result.get("error"):
-        raise HTTPException(status_code=502, detail=result.get("detail", "Pull fehlgeschlagen"))
-    workflows = result.get("data", [])
-    imported = 0
-    skipped = 0
-    for wf in workflows:
-        wf_json = json.dumps(wf, ensure_ascii=False)
-        content_hash = compute_content_hash(wf_json)
-        if db.workflow_exists_by_hash(content_hash):
-            skipped += 1
-            continue
-        db.add_workflow(
-            name=wf.get("name", "Import"),
-            workflow_json=wf_json,
-            n8n_id=str(wf.get("id", "")),
-            server_id=server_id,
-            source="pull",
-        )
-        imported += 1
-    db.add_sync_entry(None, server_id, "pull", "success", f"imported={imported}, skipped={skipped}")
-    return {"message": f"{imported} Workflows importiert, {skipped} uebersprungen"}
+    from n8nManager.core.n8n_client import get_async_client
+    from n8nManager.core.sync import PullIngest, error_text, finish_pull, watermark
+    # Streamend: alle Seiten, Batches im DB-Thread-Pool schreiben (Parsen inklusive)
+    ingest = PullIngest(db.db, server_id, since=watermark(srv, full))
+    try:
+        client = await get_async_client(srv)
+        async for wf in client.iter_workflows():
+            if ingest.add(wf):
+                await db.run(ingest.flush)
+    except Exception as e:  # wie pull_all: Gelesenes schreiben, Fehler buchen
+        await db.run(ingest.flush)
+        await db.run(finish_pull, db.db, ingest, error_text(e), errors=1)
+        raise HTTPException(status_code=502, detail=error_text(e))
+    await db.run(ingest.flush)
+    await db.run(finish_pull, db.db, ingest)
+    s = ingest.stats
+    message = (f"{s['imported']} Workflows importiert, {s['updated']} aktualisiert, "
+               f"{s['skipped']} uebersprungen, {s['unchanged']} unveraendert")
+    if s["failed"]:
+        message += f", {s['failed']} nicht gespeichert"
+    return {"message": message, **s, "failed_items": ingest.failed}
 
 @router.get("/sync/history")
-async def sync_history(workflow_id: int = 0, server_id: int = 0, limit: int = 50):
+async def sync_history(workflow_id: int = 0, server_id: int = 0,
+                       direction: Optional[str] = None,
+                       limit: int = Query(50, ge=1, le=1000), cursor: Optional[str] = None):
+    """Sync-Historie, neueste zuerst. Weitere Seiten mit cursor=<next_cursor>."""
+    db = _get_db()
+    try:
+        history, next_cursor = await db.get_sync_history_page(
+            workflow_id=workflow_id or None,
+            server_id=server_id or None,
+            direction=direction,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"data": history, "count": len(history), "next_cursor": next_cursor}
+
+@router.get("/sync/stats")
+async def sync_stats(server_id: int = 0, direction: Optional[str] = None,
+                     days: int = Query(30, ge=1, le=3650)):
+    """Tagesaggregate pro Server/Richtung (Anzahl, Fehlerquote, importiert/uebersprungen)."""
     db = _get_db()
-    history = db.get_sync_history(
-        workflow_id=workflow_id or None,
-        server_id=server_id or None,
-        limit=limit,
-    )
-    return {"data": history, "count": len(history)}
+    stats = await db.get_sync_stats(server_id=server_id or None, direction=direction, days=days)
+    return {"data": stats, "count": len(stats)}
 
 @router.post("/bach/register-workflow")
 async def bach_register_workflow(workflow_id: int):
@@ -94,7 +159,7 @@ async def bach_register_workflow(workflow_id: int):
     if not bach_cfg.get("enabled"):
         raise HTTPException(status_code=404, detail="BACH integration not enabled. Set bach.enabled=true in config.")
     db = _get_db()
-    wf = db.get_workflow(workflow_id)
+    wf = await db.get_workflow(workflow_id)
     if not wf:
         raise HTTPException(status_code=404, detail="Workflow not found")
     from n8nManager.export.bach_export import register_in_bach
@@ -7,8 +7,8 @@ from typing import Optional
 router = APIRouter()
 
 def _get_db():
-    from n8nManager.api.server import get_db
-    return get_db()
+    from n8nManager.api.server import get_async_db
+    return get_async_db()
 
 class TemplateCreate(BaseModel):
     name: str
@@ -20,13 +20,13 @@ class TemplateCreate(BaseModel):
 @router.get("/templates")
 async def list_templates(category: Optional[str] = None):
     db = _get_db()
-    templates = db.list_templates(category=category)
+    templates = await db.list_templates(category=category)
     return {"data": templates, "count": len(templates)}
 
 @router.get("/templates/{template_id}")
 async def get_template(template_id: int):
     db = _get_db()
-    tpl = db.get_template(template_id)
+    tpl = await db.get_template(template_id)
     if not tpl:
         raise HTTPException(status_code=404, detail="Template nicht gefunden")
     return tpl
@@ -34,7 +34,7 @@ async def get_template(template_id: int):
 @router.post("/templates")
 async def create_template(body: TemplateCreate):
     db = _get_db()
-    tpl_id = db.add_template(
+    tpl_id = await db.add_template(
         name=body.name,
         description=body.description,
         category=body.category,
@@ -47,12 +47,12 @@ async def create_template(body: TemplateCreate):
 async def instantiate_template(template_id: int, values: dict = {}):
     """Template mit Platzhalter-Werten fuellen und als Workflow speichern."""
     db = _get_db()
-    tpl = db.get_template(template_id)
+    tpl = await db.get_template(template_id)
     if not tpl:
         raise HTTPException(status_code=404, detail="Template nicht gefunden")
     tpl_json = tpl["template_json"]
     for key, val in values.items():
         tpl_json = tpl_json.replace(f"{{{{{key}}}}}", str(val))
     name = values.get("name", tpl["name"])
-    wf_id = db.add_workflow(name=name, workflow_json=tpl_json, source="template")
+    wf_id = await db.add_workflow(name=name, workflow_json=tpl_json, source="template")
     return {"id": wf_id, "message": f"Workflow aus Template '{tpl['name']}' erstellt"}
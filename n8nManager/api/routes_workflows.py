@@ -1,14 +1,14 @@
 """API-Routen fuer Workflows."""
 import json
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query
 from pydantic import BaseModel
 from typing import Optional
 
 router = APIRouter()
 
 def _get_db():
-    from n8nManager.api.server import get_db
-    return get_db()
+    from n8nManager.api.server import get_async_db
+    return get_async_db()
 
 class WorkflowCreate(BaseModel):
     name: str
@@ -29,15 +29,39 @@ class WorkflowBuild(BaseModel):
     connections: list  # [{from_node, to_node}]
 
 @router.get("/workflows")
-async def list_workflows(server_id: Optional[int] = None, source: Optional[str] = None):
+async def list_workflows(server_id: Optional[int] = None, source: Optional[str] = None,
+                         summary: bool = False,
+                         limit: Optional[int] = Query(None, ge=1, le=1000),
+                         cursor: Optional[str] = None):
+    """Workflows auflisten. Mit limit/cursor seitenweise (Keyset), summary=true ohne workflow_json."""
     db = _get_db()
-    workflows = db.list_workflows(server_id=server_id, source=source)
-    return {"data": workflows, "count": len(workflows)}
+    if limit is None and cursor is None:
+        workflows = await db.list_workflows(server_id=server_id, source=source, summary=summary)
+        return {"data": workflows, "count": len(workflows)}
+    try:
+        workflows, next_cursor = await db.list_workflows_page(
+            limit=limit or 50, cursor=cursor, server_id=server_id, source=source,
+            summary=summary,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"data": workflows, "count": len(workflows), "next_cursor": next_cursor}
+
+@router.get("/workflows/search")
+async def search_workflows(q: str, limit: int = Query(20, ge=1, le=100),
+                           offset: int = Query(0, ge=0)):
+    """Volltextsuche (FTS5, bm25-gerankt) ueber Name, Beschreibung, Nodes und Parameter."""
+    db = _get_db()
+    try:
+        results, next_offset = await db.search_workflows(q, limit=limit, offset=offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"data": results, "count": len(results), "next_offset": next_offset}
 
 @router.get("/workflows/{workflow_id}")
 async def get_workflow(workflow_id: int):
     db = _get_db()
-    wf = db.get_workflow(workflow_id)
+    wf = await db.get_workflow(workflow_id)
     if not wf:
         raise HTTPException(status_code=404, detail="Workflow nicht gefunden")
     return wf
@@ -45,7 +69,7 @@ async def get_workflow(workflow_id: int):
 @router.post("/workflows")
 async def create_workflow(body: WorkflowCreate):
     db = _get_db()
-    from n8nManager.core.workflow_parser import validate_workflow
+    from n8nManager.core.workflow_parser import validate_workflow, WorkflowAnalysis
     try:
         data = json.loads(body.workflow_json)
     except json.JSONDecodeError as e:
@@ -53,9 +77,9 @@ async def create_workflow(body: WorkflowCreate):
     valid, err = validate_workflow(data)
     if not valid:
         raise HTTPException(status_code=400, detail=err)
-    wf_id = db.add_workflow(
+    wf_id = await db.add_workflow(
         name=body.name,
-        workflow_json=body.workflow_json,
+        workflow_json=WorkflowAnalysis(body.workflow_json, data),
         description=body.description,
         source=body.source,
     )
@@ -64,7 +88,7 @@ async def create_workflow(body: WorkflowCreate):
 @router.put("/workflows/{workflow_id}")
 async def update_workflow(workflow_id: int, body: WorkflowUpdate):
     db = _get_db()
-    wf = db.get_workflow(workflow_id)
+    wf = await db.get_workflow(workflow_id)
     if not wf:
         raise HTTPException(status_code=404, detail="Workflow nicht gefunden")
     updates = {}
@@ -73,7 +97,7 @@ async def update_workflow(workflow_id: int, body: WorkflowUpdate):
     if body.description is not None:
         updates["description"] = body.description
     if body.workflow_json is not None:
-        from n8nManager.core.workflow_parser import validate_workflow
+        from n8nManager.core.workflow_parser import validate_workflow, WorkflowAnalysis
         try:
             data = json.loads(body.workflow_json)
         except json.JSONDecodeError as e:
@@ -81,20 +105,20 @@ async def update_workflow(workflow_id: int, body: WorkflowUpdate):
         valid, err = validate_workflow(data)
         if not valid:
             raise HTTPException(status_code=400, detail=err)
-        updates["workflow_json"] = body.workflow_json
+        updates["workflow_json"] = WorkflowAnalysis(body.workflow_json, data)
     if body.is_active is not None:
         updates["is_active"] = 1 if body.is_active else 0
     if updates:
-        db.update_workflow(workflow_id, **updates)
+        await db.update_workflow(workflow_id, **updates)
     return {"message": "Workflow aktualisiert"}
 
 @router.delete("/workflows/{workflow_id}")
 async def delete_workflow(workflow_id: int):
     db = _get_db()
-    wf = db.get_workflow(workflow_id)
+    wf = await db.get_workflow(workflow_id)
     if not wf:
         raise HTTPException(status_code=404, detail="Workflow nicht gefunden")
-    db.delete_workflow(workflow_id)
+    await db.delete_workflow(workflow_id)
     return {"message": "Workflow geloescht"}
 
 @router.post("/workflows/build")
@@ -117,9 +141,10 @@ async def build_workflow(body: WorkflowBuild):
         if source in node_names and target in node_names:
             builder.connect(node_names[source], node_names[target])
     wf_data = builder.build()
-    wf_json = json.dumps(wf_data, ensure_ascii=False)
+    from n8nManager.core.workflow_parser import WorkflowAnalysis
     db = _get_db()
-    wf_id = db.add_workflow(name=body.name, workflow_json=wf_json, source="api-build")
+    wf_id = await db.add_workflow(name=body.name, workflow_json=WorkflowAnalysis(wf_data),
+                                  source="api-build")
     return {"id": wf_id, "workflow": wf_data, "message": "Workflow erstellt via Builder"}
 
 @router.post("/import")
@@ -130,15 +155,14 @@ async def import_workflow(file: UploadFile = File(...)):
         data = json.loads(content.decode("utf-8"))
     except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise HTTPException(status_code=400, detail=f"Ungueltige Datei: {e}")
-    from n8nManager.core.workflow_parser import validate_workflow, compute_content_hash
+    from n8nManager.core.workflow_parser import validate_workflow, WorkflowAnalysis
     valid, err = validate_workflow(data)
     if not valid:
         raise HTTPException(status_code=400, detail=err)
-    wf_json = json.dumps(data, ensure_ascii=False)
-    content_hash = compute_content_hash(wf_json)
+    analysis = WorkflowAnalysis(data)
     db = _get_db()
-    if db.workflow_exists_by_hash(content_hash):
+    if await db.workflow_exists_by_hash(analysis.content_hash):
         raise HTTPException(status_code=409, detail="Workflow existiert bereits (Duplikat)")
     name = data.get("name", file.filename or "Import")
-    wf_id = db.add_workflow(name=name, workflow_json=wf_json, source="import")
+    wf_id = await db.add_workflow(name=name, workflow_json=analysis, source="import")
     return {"id": wf_id, "message": f"Workflow '{name}' importiert"}
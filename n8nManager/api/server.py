@@ -10,22 +10,48 @@ import uvicorn
 BASE_DIR = Path(__file__).resolve().parent.parent
 WEB_DIR = BASE_DIR / "web"
 
-# Lazy DB-Instanz
+# Lazy DB-Instanzen
 _db = None
+_adb = None
 
 def get_db():
     global _db
     if _db is None:
-        from n8nManager.core.config import load_config, get_db_path
-        config = load_config()
-        from n8nManager.core.database import Database
-        _db = Database(get_db_path(config))
+        from n8nManager.core.database import open_database
+        _db = open_database()
     return _db
 
+def get_async_db():
+    """AsyncDatabase um get_db() -- Routen awaiten diese statt die DB direkt zu nutzen."""
+    global _adb
+    if _adb is None:
+        from n8nManager.core.async_database import AsyncDatabase, DEFAULT_WORKERS
+        from n8nManager.core.config import load_config
+        workers = load_config().get("database", {}).get("async_workers", DEFAULT_WORKERS)
+        _adb = AsyncDatabase(get_db(), max_workers=workers)
+    return _adb
+
+def close_db():
+    """Schliesst Thread-Pool und Verbindungen der globalen DB-Instanz."""
+    global _adb, _db
+    if _adb is not None:
+        _adb.close()  # schliesst auch _db
+    elif _db is not None:
+        _db.close()
+    _adb = None
+    _db = None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    get_db()  # DB initialisieren
+    adb = get_async_db()  # DB initialisieren
+    from n8nManager.core.n8n_client import (aclose_clients, circuit_status_listener,
+                                            set_circuit_listener)
+    # Breaker-Wechsel der async Clients: Schreiben im DB-Thread-Pool, nicht im Event-Loop
+    set_circuit_listener(circuit_status_listener(get_db, submit=adb.submit))
     yield
+    set_circuit_listener(None)
+    await aclose_clients()
+    close_db()
 
 app = FastAPI(
     title="n8nManager API",
@@ -50,20 +76,20 @@ templates = Jinja2Templates(directory=str(WEB_DIR / "templates"))
 
 @app.get("/")
 async def web_dashboard(request: Request):
-    db = get_db()
-    workflows = db.list_workflows()
-    servers = db.list_servers()
+    db = get_async_db()
+    workflows = await db.list_workflows(summary=True)
+    servers = await db.list_servers()
     return templates.TemplateResponse("dashboard.html", {
         "request": request,
         "workflows": workflows,
         "servers": servers,
-        "stats": {"workflows": len(workflows), "servers": len(servers)},
+        "stats": await db.get_stats(),
     })
 
 @app.get("/viewer/{workflow_id}")
 async def web_viewer(request: Request, workflow_id: int):
-    db = get_db()
-    workflow = db.get_workflow(workflow_id)
+    db = get_async_db()
+    workflow = await db.get_workflow(workflow_id)
     if not workflow:
         return templates.TemplateResponse("dashboard.html", {
             "request": request, "workflows": [], "servers": [], "stats": {},
@@ -81,8 +107,8 @@ async def web_viewer(request: Request, workflow_id: int):
 
 @app.get("/editor/{workflow_id}")
 async def web_editor(request: Request, workflow_id: int):
-    db = get_db()
-    workflow = db.get_workflow(workflow_id)
+    db = get_async_db()
+    workflow = await db.get_workflow(workflow_id)
     if not workflow:
         return templates.TemplateResponse("dashboard.html", {
             "request": request, "workflows": [], "servers": [], "stats": {},
@@ -92,7 +118,7 @@ async def web_editor(request: Request, workflow_id: int):
     from n8nManager.core.workflow_parser import workflow_to_vis_graph
     wf_data = json.loads(workflow["workflow_json"])
     graph = workflow_to_vis_graph(wf_data)
-    node_catalog = db.list_node_catalog()
+    node_catalog = await db.list_node_catalog()
     return templates.TemplateResponse("editor.html", {
         "request": request,
         "workflow": workflow,
@@ -102,8 +128,8 @@ async def web_editor(request: Request, workflow_id: int):
 
 @app.get("/creator")
 async def web_creator(request: Request):
-    db = get_db()
-    node_catalog = db.list_node_catalog()
+    db = get_async_db()
+    node_catalog = await db.list_node_catalog()
     import json
     return templates.TemplateResponse("creator.html", {
         "request": request,
@@ -112,8 +138,8 @@ async def web_creator(request: Request):
 
 @app.get("/servers")
 async def web_servers(request: Request):
-    db = get_db()
-    servers = db.list_servers()
+    db = get_async_db()
+    servers = await db.list_servers()
     return templates.TemplateResponse("servers.html", {
         "request": request,
         "servers": servers,
@@ -128,21 +154,27 @@ from n8nManager.api.routes_workflows import router as workflows_router
 from n8nManager.api.routes_servers import router as servers_router
 from n8nManager.api.routes_templates import router as templates_router
 from n8nManager.api.routes_sync import router as sync_router
+from n8nManager.api.routes_nodes import router as nodes_router
+from n8nManager.api.routes_admin import router as admin_router
 
 app.include_router(workflows_router, prefix="/api", tags=["Workflows"])
 app.include_router(servers_router, prefix="/api", tags=["Servers"])
 app.include_router(templates_router, prefix="/api", tags=["Templates"])
 app.include_router(sync_router, prefix="/api", tags=["Sync"])
+app.include_router(nodes_router, prefix="/api", tags=["Nodes"])
+app.include_router(admin_router, prefix="/api", tags=["Admin"])
 
 # ── Status-Endpoint ──────────────────────────────────────────────────
 @app.get("/api/status")
 async def api_status():
-    db = get_db()
+    db = get_async_db()
+    stats = await db.get_stats()
     return {
         "status": "running",
         "version": "0.1.0",
-        "workflows": len(db.list_workflows()),
-        "servers": len(db.list_servers()),
+        "workflows": stats["workflows"],
+        "servers": stats["servers"],
+        "stats": stats,
     }
 
 def run_server(host: str = "127.0.0.1", port: int = 8100):
@@ -0,0 +1,56 @@
+"""Async-Zugriff auf die Database fuer die FastAPI-Routen.
+
+sqlite3 blockiert; AsyncDatabase fuehrt jeden Aufruf in einem eigenen,
+begrenzten Thread-Pool aus, damit der Event-Loop frei bleibt. Jeder
+Worker-Thread bekommt vom ConnectionPool seine eigene Verbindung, die
+Pool-Groesse begrenzt also auch die Anzahl offener SQLite-Verbindungen.
+"""
+import asyncio
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from n8nManager.core.storage import StorageBackend
+
+DEFAULT_WORKERS = 8
+
+
+class AsyncDatabase:
+    """Awaitbare Fassade um ein Storage-Backend (Database, ShardedDatabase, ...).
+
+    Jede oeffentliche Methode der Database ist hier als Coroutine verfuegbar
+    (``await adb.get_workflow(1)``), Attribute werden durchgereicht.
+    """
+
+    def __init__(self, db: StorageBackend, max_workers: int = DEFAULT_WORKERS):
+        self.db = db
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)),
+                                            thread_name_prefix="n8n-db")
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Beliebige blockierende Funktion im DB-Thread-Pool ausfuehren."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor,
+                                          functools.partial(func, *args, **kwargs))
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Wie run, ohne zu warten -- auch aus synchronen Callbacks im Event-Loop."""
+        return self._executor.submit(func, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.db, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        # Cachen: __getattr__ wird fuer diesen Namen nicht mehr aufgerufen
+        setattr(self, name, call)
+        return call
+
+    def close(self):
+        """Wartet laufende Aufrufe ab und schliesst Thread-Pool und Verbindungen."""
+        self._executor.shutdown(wait=True)
+        self.db.close()
@@ -0,0 +1,168 @@
+"""Bulk-Import vieler n8n Workflows (Verzeichnisse, Globs, Multi-Workflow-Dateien)."""
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from n8nManager.core.workflow_parser import validate_workflow, WorkflowAnalysis
+
+READ_CHUNK = 1 << 20  # 1 MiB pro Lesevorgang
+
+
+def expand_sources(patterns: Iterable[str]) -> list[Path]:
+    """Dateien, Verzeichnisse (rekursiv *.json) und Globs -> sortierte Dateiliste."""
+    files = []
+    seen = set()
+    for pattern in patterns:
+        p = Path(pattern)
+        if p.is_dir():
+            candidates = sorted(p.rglob("*.json"))
+        elif glob.has_magic(pattern):
+            candidates = sorted(Path(m) for m in glob.glob(pattern, recursive=True))
+        else:
+            candidates = [p]
+        for c in candidates:
+            key = c.resolve()
+            if key not in seen and not c.is_dir():
+                seen.add(key)
+                files.append(c)
+    return files
+
+
+def iter_json_documents(path: Path) -> Iterator[object]:
+    """Liefert die Workflows einer Datei einzeln.
+
+    Ein Top-Level-Array (n8n CLI ``export:workflow --all``) wird gestreamt:
+    es ist immer nur das aktuelle Element plus ein Lesepuffer im Speicher.
+    Einzelne Workflow-Objekte werden normal geladen.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = f.read(READ_CHUNK)
+        pos = _skip_ws(buf, 0)
+        if pos >= len(buf) or buf[pos] != "[":
+            yield json.loads(buf + f.read())
+            return
+        pos += 1
+        eof = False
+        while True:
+            pos = _skip_ws(buf, pos, extra=",")
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(READ_CHUNK)
+                eof = not chunk
+                # Verbrauchten Teil verwerfen, Rest um den neuen Chunk ergaenzen
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield obj
+            pos = end
+
+
+def _skip_ws(buf: str, pos: int, extra: str = "") -> int:
+    while pos < len(buf) and (buf[pos].isspace() or buf[pos] in extra):
+        pos += 1
+    return pos
+
+
+def _analyze_document(item: tuple) -> tuple:
+    """Worker: validieren + analysieren. Laeuft im Prozesspool.
+
+    Gibt (label, name, analysis, error) zurueck; das geparste dict wird
+    nicht zurueckgeschickt, der Hauptprozess braucht nur JSON + Metadaten.
+    """
+    label, default_name, data = item
+    valid, err = validate_workflow(data)
+    if not valid:
+        return label, default_name, None, err
+    try:
+        analysis = WorkflowAnalysis(data)
+    except Exception as e:  # ein kaputtes Dokument darf den Import nicht abbrechen
+        return label, default_name, None, f"{type(e).__name__}: {e}"
+    analysis.data = None
+    return label, data.get("name", default_name), analysis, ""
+
+
+def _iter_items(files: list[Path], stats: dict) -> Iterator[tuple]:
+    for path in files:
+        stats["files"] += 1
+        try:
+            for i, data in enumerate(iter_json_documents(path)):
+                default_name = path.stem if i == 0 else f"{path.stem}_{i + 1}"
+                yield f"{path}#{i}", default_name, data
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            stats["invalid"] += 1
+            stats["errors"].append(f"{path}: {e}")
+
+
+def _batches(items: Iterator[tuple], size: int) -> Iterator[list]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def bulk_import(db, patterns: Iterable[str], source: str = "import",
+                jobs: Optional[int] = None, batch_size: int = 500,
+                progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """Importiert alle Workflows aus patterns.
+
+    Pro Batch: Analyse (Hash, Validierung) im Prozesspool, ein gebuendelter
+    Hash-Lookup fuer Duplikate, dann executemany in einer Transaktion.
+    jobs=1 arbeitet ohne Prozesspool. Gibt eine Zusammenfassung zurueck.
+    """
+    files = expand_sources(patterns)
+    stats = {"files": 0, "documents": 0, "imported": 0, "duplicates": 0,
+             "invalid": 0, "errors": [], "elapsed": 0.0}
+    start = time.perf_counter()
+    jobs = jobs or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    seen_hashes = set()
+    try:
+        for batch in _batches(_iter_items(files, stats), batch_size):
+            stats["documents"] += len(batch)
+            if executor:
+                chunksize = max(1, len(batch) // (jobs * 4))
+                results = list(executor.map(_analyze_document, batch, chunksize=chunksize))
+            else:
+                results = [_analyze_document(item) for item in batch]
+
+            candidates = []
+            for label, name, analysis, err in results:
+                if analysis is None:
+                    stats["invalid"] += 1
+                    stats["errors"].append(f"{label}: {err}")
+                elif analysis.content_hash in seen_hashes:
+                    stats["duplicates"] += 1
+                else:
+                    seen_hashes.add(analysis.content_hash)
+                    candidates.append((name, analysis))
+
+            existing = db.existing_hashes(a.content_hash for _, a in candidates)
+            rows = []
+            for name, analysis in candidates:
+                if analysis.content_hash in existing:
+                    stats["duplicates"] += 1
+                else:
+                    rows.append({"name": name, "workflow_json": analysis, "source": source})
+            stats["imported"] += db.add_workflows_bulk(rows, chunk_size=batch_size)
+            stats["elapsed"] = time.perf_counter() - start
+            if progress:
+                progress(stats)
+    finally:
+        if executor:
+            executor.shutdown()
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
@@ -0,0 +1,64 @@
+"""Transparente Kompression fuer Workflow-JSON in der Datenbank.
+
+Jede Zeile traegt ihren Codec ('' = unkomprimiert, 'zlib', 'zstd'), damit
+komprimierte und unkomprimierte Zeilen nebeneinander existieren koennen.
+"""
+import zlib
+from typing import Union
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install n8n-workflow-manager[zstd]
+    zstandard = None
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def available_codecs() -> list[str]:
+    """Verfuegbare Codecs ('none' = unkomprimiert)."""
+    codecs = ["none", "zlib"]
+    if zstandard is not None:
+        codecs.append("zstd")
+    return codecs
+
+
+def resolve_codec(name: str) -> str:
+    """Config-Wert -> Codec-Marker der Zeile.
+
+    'none'/'' -> '', 'auto' -> zstd falls installiert sonst zlib.
+    Raises ValueError bei unbekanntem oder nicht installiertem Codec.
+    """
+    name = (name or "none").lower()
+    if name == "auto":
+        return "zstd" if zstandard is not None else "zlib"
+    if name == "none":
+        return ""
+    if name not in available_codecs():
+        raise ValueError(f"Codec '{name}' nicht verfuegbar (verfuegbar: {available_codecs()})")
+    return name
+
+
+def compress(text: str, codec: str) -> Union[str, bytes]:
+    """Text mit codec komprimieren; codec '' gibt den Text unveraendert zurueck."""
+    if not codec:
+        return text
+    raw = text.encode("utf-8")
+    if codec == "zlib":
+        return zlib.compress(raw, ZLIB_LEVEL)
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    raise ValueError(f"Unbekannter Codec: {codec}")
+
+
+def decompress(value: Union[str, bytes], codec: str) -> str:
+    """Gegenstueck zu compress()."""
+    if not codec:
+        return value
+    if codec == "zlib":
+        return zlib.decompress(value).decode("utf-8")
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("Zeile ist zstd-komprimiert, aber 'zstandard' ist nicht installiert")
+        return zstandard.ZstdDecompressor().decompress(value).decode("utf-8")
+    raise ValueError(f"Unbekannter Codec: {codec}")
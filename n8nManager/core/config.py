@@ -16,6 +16,29 @@ DEFAULT_CONFIG = {
     "n8n": {
         "default_port": 5678,
         "api_version": "v1",
+        "timeout": 15.0,
+        "max_connections": 10,  # Pool-Limits pro Server (N8nClient)
+        "max_keepalive": 10,
+        "keepalive_expiry": 30.0,
+        "http2": False,  # benoetigt h2 (pip install httpx[http2])
+        "pull_concurrency": 4,  # pull --all: Server gleichzeitig
+        "pull_per_server": 1,  # pull --all: gleichzeitige Pulls pro n8n-URL
+        "push_concurrency": 8,  # push --all/--tag/--ids: gleichzeitige Pushes
+        "retries": 3,  # Wiederholungen bei 429, 5xx, Netzfehlern
+        "retry_backoff": 0.5,  # Sekunden, exponentiell mit Jitter
+        "retry_max_backoff": 10.0,
+        "breaker_threshold": 5,  # Fehlschlaege in Folge bis Circuit offen
+        "breaker_cooldown": 30.0,
+    },
+    "database": {
+        "backend": "sqlite",  # sqlite | memory | sharded (core.storage)
+        "profile": "balanced",  # safe | balanced | throughput (PROFILES)
+        "pragmas": {},  # einzelne PRAGMAs des Profils ueberschreiben
+        "busy_retries": 3,
+        "compression": "none",
+        "version_snapshot_interval": 10,
+        "async_workers": 8,
+        "sync_history_retention_days": 0,  # > 0: aeltere Eintraege verdichten und loeschen
     },
 }
 
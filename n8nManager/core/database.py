@@ -1,10 +1,20 @@
 """Datenbankschicht fuer n8nManager (SQLite)."""
 import json
+import re
+import base64
+import functools
 import sqlite3
-import hashlib
+import threading
+import time
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union
+
+from n8nManager.core.compression import (
+    resolve_codec as _resolve_codec, compress as _compress, decompress as _decompress,
+)
+from n8nManager.core import json_delta
+from n8nManager.core.workflow_parser import WorkflowAnalysis
 
 
 def _now() -> str:
@@ -12,149 +22,771 @@ def _now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
 
+SCHEMA_VERSION = 13
+
+# Benannte Performance-Profile (database.profile), Werte sind SQLite-PRAGMAs.
+# mmap_size gilt nur fuer Lese-Verbindungen, busy_timeout in ms.
+# throughput: synchronous=OFF -- bei Stromausfall koennen die letzten
+# Transaktionen verloren gehen, ein Absturz des Prozesses ist unkritisch.
+PROFILES = {
+    "safe": {"synchronous": "FULL", "cache_size": -2000, "mmap_size": 0,
+             "temp_store": "DEFAULT", "busy_timeout": 5000},
+    "balanced": {"synchronous": "NORMAL", "cache_size": -16000, "mmap_size": 64 << 20,
+                 "temp_store": "MEMORY", "busy_timeout": 5000},
+    "throughput": {"synchronous": "OFF", "cache_size": -64000, "mmap_size": 256 << 20,
+                   "temp_store": "MEMORY", "busy_timeout": 10000},
+}
+DEFAULT_PROFILE = "balanced"
+
+# Wiederholungen einer Schreibtransaktion, wenn busy_timeout nicht reicht
+BUSY_RETRIES = 3
+BUSY_BACKOFF = 0.05  # Sekunden, verdoppelt sich pro Versuch
+
+
+def profile_pragmas(profile: Union[str, dict] = DEFAULT_PROFILE,
+                    read_only: bool = False) -> tuple[str, ...]:
+    """PRAGMA-Statements eines Profils (Name oder dict) fuer Schreib-/Lese-Verbindungen.
+
+    Raises ValueError bei unbekanntem Profilnamen.
+    """
+    if isinstance(profile, str):
+        if profile not in PROFILES:
+            raise ValueError(f"Unbekanntes DB-Profil: {profile} "
+                             f"(erlaubt: {', '.join(PROFILES)})")
+        profile = PROFILES[profile]
+    settings = dict(profile)
+    if read_only:
+        settings["query_only"] = "ON"
+    else:
+        settings.pop("mmap_size", None)
+    return tuple(f"PRAGMA {key}={value}" for key, value in settings.items())
+
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    code = getattr(error, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    return "locked" in str(error) or "busy" in str(error)
+
+
+def _retry_busy(method):
+    """Wiederholt eine Schreibtransaktion bei SQLITE_BUSY/LOCKED mit Backoff.
+
+    Nur fuer Methoden mit genau einer Transaktion -- die fehlgeschlagene wurde
+    per Context-Manager zurueckgerollt, ein erneuter Lauf ist also sicher.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        for attempt in range(self.busy_retries + 1):
+            try:
+                return method(self, *args, **kwargs)
+            except sqlite3.OperationalError as e:
+                if attempt == self.busy_retries or not _is_busy(e):
+                    raise
+                time.sleep(BUSY_BACKOFF * 2 ** attempt)
+    return wrapper
+
+
+def _run_script(conn: sqlite3.Connection, script: str):
+    """Fuehrt ein SQL-Skript innerhalb der laufenden Transaktion aus.
+
+    Anders als executescript() committet das nicht vorher.
+    """
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ""
+
+
+def _migration_1(conn: sqlite3.Connection):
+    """Basisschema + Default-Nodes."""
+    _run_script(conn, """
+        CREATE TABLE IF NOT EXISTS servers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            url TEXT NOT NULL,
+            api_key TEXT DEFAULT '',
+            is_default INTEGER DEFAULT 0,
+            n8n_version TEXT DEFAULT '',
+            last_ping TEXT,
+            status TEXT DEFAULT 'unknown',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS workflows (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            description TEXT DEFAULT '',
+            n8n_id TEXT DEFAULT '',
+            server_id INTEGER REFERENCES servers(id),
+            workflow_json TEXT NOT NULL,
+            content_hash TEXT DEFAULT '',
+            node_count INTEGER DEFAULT 0,
+            trigger_type TEXT DEFAULT '',
+            tags TEXT DEFAULT '[]',
+            is_active INTEGER DEFAULT 0,
+            source TEXT DEFAULT 'local',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS sync_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            workflow_id INTEGER REFERENCES workflows(id),
+            server_id INTEGER REFERENCES servers(id),
+            direction TEXT NOT NULL,
+            status TEXT DEFAULT 'success',
+            details TEXT DEFAULT '',
+            synced_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS templates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            description TEXT DEFAULT '',
+            category TEXT DEFAULT 'general',
+            template_json TEXT NOT NULL,
+            placeholders TEXT DEFAULT '[]',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS workflow_versions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            workflow_id INTEGER NOT NULL REFERENCES workflows(id),
+            version_number INTEGER NOT NULL,
+            workflow_json TEXT NOT NULL,
+            content_hash TEXT DEFAULT '',
+            change_note TEXT DEFAULT '',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(workflow_id, version_number)
+        );
+
+        CREATE TABLE IF NOT EXISTS node_catalog (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            node_type TEXT UNIQUE NOT NULL,
+            display_name TEXT DEFAULT '',
+            category TEXT DEFAULT '',
+            description TEXT DEFAULT '',
+            color TEXT DEFAULT '#666666',
+            icon TEXT DEFAULT ''
+        );
+    """)
+    default_nodes = [
+        ("n8n-nodes-base.manualTrigger",            "Manual Trigger",  "trigger",   "#ff6d5a"),
+        ("n8n-nodes-base.scheduleTrigger",          "Schedule Trigger","trigger",   "#ff6d5a"),
+        ("n8n-nodes-base.webhook",                  "Webhook",         "trigger",   "#ff6d5a"),
+        ("n8n-nodes-base.httpRequest",              "HTTP Request",    "action",    "#4285f4"),
+        ("n8n-nodes-base.if",                       "IF",              "logic",     "#ffcc00"),
+        ("n8n-nodes-base.switch",                   "Switch",          "logic",     "#ffcc00"),
+        ("n8n-nodes-base.set",                      "Set",             "transform", "#4285f4"),
+        ("n8n-nodes-base.code",                     "Code",            "transform", "#4285f4"),
+        ("n8n-nodes-base.emailSend",                "Send Email",      "action",    "#28a745"),
+        ("n8n-nodes-base.slack",                    "Slack",           "action",    "#28a745"),
+        ("@n8n/n8n-nodes-langchain.agent",          "AI Agent",        "ai",        "#9b59b6"),
+        ("@n8n/n8n-nodes-langchain.chainLlm",       "LLM Chain",       "ai",        "#9b59b6"),
+    ]
+    conn.executemany(
+        "INSERT OR IGNORE INTO node_catalog (node_type, display_name, category, color) VALUES (?, ?, ?, ?)",
+        default_nodes
+    )
+
+
+def _migration_2(conn: sqlite3.Connection):
+    """Sekundaerindizes fuer Duplikat-Check, gefilterte Listen und Sync-Historie.
+
+    Vor dem Unique-Index auf (server_id, n8n_id) werden bestehende Duplikate
+    (mehrfach gepullte Workflows) aufgeloest: nur die neueste Zeile behaelt
+    ihre n8n_id, aeltere Kopien bleiben als lokale Workflows erhalten.
+    """
+    _run_script(conn, """
+        UPDATE workflows SET n8n_id = ''
+        WHERE server_id IS NOT NULL AND n8n_id <> ''
+          AND id NOT IN (
+              SELECT MAX(id) FROM workflows
+              WHERE server_id IS NOT NULL AND n8n_id <> ''
+              GROUP BY server_id, n8n_id
+          );
+
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_workflows_server_n8n
+            ON workflows(server_id, n8n_id)
+            WHERE server_id IS NOT NULL AND n8n_id <> '';
+        CREATE INDEX IF NOT EXISTS idx_workflows_content_hash ON workflows(content_hash);
+        CREATE INDEX IF NOT EXISTS idx_workflows_updated ON workflows(updated_at, id);
+        CREATE INDEX IF NOT EXISTS idx_workflows_server_updated
+            ON workflows(server_id, updated_at, id);
+        CREATE INDEX IF NOT EXISTS idx_workflows_source_updated
+            ON workflows(source, updated_at, id);
+
+        CREATE INDEX IF NOT EXISTS idx_sync_history_synced ON sync_history(synced_at);
+        CREATE INDEX IF NOT EXISTS idx_sync_history_workflow
+            ON sync_history(workflow_id, synced_at);
+        CREATE INDEX IF NOT EXISTS idx_sync_history_server
+            ON sync_history(server_id, synced_at);
+    """)
+
+
+def _migration_3(conn: sqlite3.Connection):
+    """Codec-Marker fuer komprimiertes workflow_json ('' = Klartext)."""
+    _run_script(conn, """
+        ALTER TABLE workflows ADD COLUMN json_codec TEXT DEFAULT '';
+        ALTER TABLE workflow_versions ADD COLUMN json_codec TEXT DEFAULT '';
+    """)
+
+
+def _migration_4(conn: sqlite3.Connection):
+    """Versionen als Vollstand ('full') oder Delta zur Vorversion ('delta')."""
+    _run_script(conn, """
+        ALTER TABLE workflow_versions ADD COLUMN storage TEXT DEFAULT 'full';
+    """)
+
+
+def _migration_5(conn: sqlite3.Connection):
+    """Content-adressierter Blob-Store (Schluessel: normalisierter content_hash).
+
+    workflows, Versions-Vollstaende und templates referenzieren ihr JSON per
+    content_hash; die Spalten workflow_json/template_json bleiben leer.
+    refcount wird per Trigger gepflegt, unreferenzierte Blobs werden geloescht.
+    """
+    _run_script(conn, """
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash TEXT PRIMARY KEY,
+            data BLOB NOT NULL,
+            codec TEXT DEFAULT '',
+            size INTEGER DEFAULT 0,
+            refcount INTEGER NOT NULL DEFAULT 0
+        );
+        ALTER TABLE templates ADD COLUMN content_hash TEXT DEFAULT '';
+        CREATE INDEX IF NOT EXISTS idx_versions_content_hash
+            ON workflow_versions(content_hash);
+    """)
+
+    # Bestehende Inhalte (evtl. schon komprimiert) unveraendert umziehen
+    sources = (
+        ("workflows", "workflow_json", "json_codec", "1=1"),
+        ("workflow_versions", "workflow_json", "json_codec", "storage = 'full'"),
+        ("templates", "template_json", "''", "1=1"),
+    )
+    for table, data_col, codec_col, where in sources:
+        clear_codec = ", json_codec = ''" if codec_col != "''" else ""
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                f"""SELECT id, content_hash, {data_col} AS data, {codec_col} AS codec
+                    FROM {table} WHERE id > ? AND {where} AND {data_col} <> ''
+                    ORDER BY id LIMIT 500""",
+                (last_id,)
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            for r in rows:
+                text = _decompress(r["data"], r["codec"] or "")
+                content_hash = r["content_hash"] or WorkflowAnalysis(text).content_hash
+                conn.execute(
+                    "INSERT OR IGNORE INTO blobs (hash, data, codec, size) VALUES (?, ?, ?, ?)",
+                    (content_hash, r["data"], r["codec"] or "", len(text.encode("utf-8")))
+                )
+                conn.execute(
+                    f"UPDATE {table} SET content_hash = ?, {data_col} = ''{clear_codec} WHERE id = ?",
+                    (content_hash, r["id"])
+                )
+
+    _run_script(conn, """
+        UPDATE blobs SET refcount =
+              (SELECT COUNT(*) FROM workflows WHERE content_hash = blobs.hash)
+            + (SELECT COUNT(*) FROM workflow_versions
+               WHERE storage = 'full' AND content_hash = blobs.hash)
+            + (SELECT COUNT(*) FROM templates WHERE content_hash = blobs.hash);
+
+        CREATE TRIGGER IF NOT EXISTS trg_workflows_blob_insert AFTER INSERT ON workflows
+        BEGIN
+            UPDATE blobs SET refcount = refcount + 1 WHERE hash = NEW.content_hash;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_workflows_blob_update
+        AFTER UPDATE OF content_hash ON workflows
+        WHEN OLD.content_hash IS NOT NEW.content_hash
+        BEGIN
+            UPDATE blobs SET refcount = refcount + 1 WHERE hash = NEW.content_hash;
+            UPDATE blobs SET refcount = refcount - 1 WHERE hash = OLD.content_hash;
+            DELETE FROM blobs WHERE hash = OLD.content_hash AND refcount <= 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_workflows_blob_delete AFTER DELETE ON workflows
+        BEGIN
+            UPDATE blobs SET refcount = refcount - 1 WHERE hash = OLD.content_hash;
+            DELETE FROM blobs WHERE hash = OLD.content_hash AND refcount <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_versions_blob_insert AFTER INSERT ON workflow_versions
+        WHEN NEW.storage = 'full'
+        BEGIN
+            UPDATE blobs SET refcount = refcount + 1 WHERE hash = NEW.content_hash;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_versions_blob_delete AFTER DELETE ON workflow_versions
+        WHEN OLD.storage = 'full'
+        BEGIN
+            UPDATE blobs SET refcount = refcount - 1 WHERE hash = OLD.content_hash;
+            DELETE FROM blobs WHERE hash = OLD.content_hash AND refcount <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_templates_blob_insert AFTER INSERT ON templates
+        BEGIN
+            UPDATE blobs SET refcount = refcount + 1 WHERE hash = NEW.content_hash;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_templates_blob_update
+        AFTER UPDATE OF content_hash ON templates
+        WHEN OLD.content_hash IS NOT NEW.content_hash
+        BEGIN
+            UPDATE blobs SET refcount = refcount + 1 WHERE hash = NEW.content_hash;
+            UPDATE blobs SET refcount = refcount - 1 WHERE hash = OLD.content_hash;
+            DELETE FROM blobs WHERE hash = OLD.content_hash AND refcount <= 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_templates_blob_delete AFTER DELETE ON templates
+        BEGIN
+            UPDATE blobs SET refcount = refcount - 1 WHERE hash = OLD.content_hash;
+            DELETE FROM blobs WHERE hash = OLD.content_hash AND refcount <= 0;
+        END;
+    """)
+
+
+# bm25-Gewichte: name, description, node_names, node_types, params. Als
+# Ausdruck in der Query; die FTS5-Option 'rank' ist pro Zeile spuerbar langsamer.
+FTS_RANK = "bm25(workflows_fts, 10.0, 5.0, 3.0, 2.0, 1.0)"
+
+
+def _fts_row(workflow_id: int, name: str, description: str, wf: WorkflowAnalysis) -> tuple:
+    return (workflow_id, name or "", description or "", wf.node_names, wf.node_types,
+            wf.param_text)
+
+
+def _iter_workflow_batches(conn: sqlite3.Connection, batch_size: int = 500):
+    """Alle Workflows in Batches als Liste von (Zeile, WorkflowAnalysis) -- fuer Migrationen."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            """SELECT w.id, w.name, w.description, b.data, b.codec
+               FROM workflows w JOIN blobs b ON b.hash = w.content_hash
+               WHERE w.id > ? ORDER BY w.id LIMIT ?""",
+            (last_id, batch_size)
+        ).fetchall()
+        if not rows:
+            return
+        last_id = rows[-1]["id"]
+        yield [(r, WorkflowAnalysis(_decompress(r["data"], r["codec"] or ""))) for r in rows]
+
+
+def _migration_6(conn: sqlite3.Connection):
+    """FTS5-Volltextindex ueber Name, Beschreibung, Nodes und Parameterwerte.
+
+    name/description halten Trigger aktuell, die aus dem JSON abgeleiteten
+    Spalten schreibt der Database-Schreibpfad (das JSON liegt ggf. komprimiert
+    im Blob-Store und ist fuer SQL nicht lesbar).
+    """
+    _run_script(conn, """
+        CREATE VIRTUAL TABLE IF NOT EXISTS workflows_fts USING fts5(
+            name, description, node_names, node_types, params,
+            tokenize = 'unicode61 remove_diacritics 2'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_workflows_fts_update
+        AFTER UPDATE OF name, description ON workflows
+        BEGIN
+            UPDATE workflows_fts SET name = NEW.name, description = NEW.description
+            WHERE rowid = NEW.id;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_workflows_fts_delete AFTER DELETE ON workflows
+        BEGIN
+            DELETE FROM workflows_fts WHERE rowid = OLD.id;
+        END;
+    """)
+    for batch in _iter_workflow_batches(conn):
+        conn.executemany(
+            """INSERT INTO workflows_fts (rowid, name, description, node_names, node_types, params)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [_fts_row(r["id"], r["name"], r["description"], wf) for r, wf in batch]
+        )
+
+
+_INSERT_NODES = """INSERT INTO workflow_nodes
+    (workflow_id, position, name, node_type, type_version, host, params)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _migration_7(conn: sqlite3.Connection):
+    """Abgeleitete Node-Tabelle fuer "welche Workflows nutzen Node-Typ X / Host Y".
+
+    Eine Zeile pro Node, geschrieben vom Database-Schreibpfad; ON DELETE
+    CASCADE entfernt die Zeilen mit dem Workflow.
+    """
+    _run_script(conn, """
+        CREATE TABLE IF NOT EXISTS workflow_nodes (
+            workflow_id INTEGER NOT NULL REFERENCES workflows(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            name TEXT DEFAULT '',
+            node_type TEXT NOT NULL,
+            type_version NUMERIC,
+            host TEXT DEFAULT '',
+            params TEXT DEFAULT '{}',
+            PRIMARY KEY (workflow_id, position)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_workflow_nodes_type
+            ON workflow_nodes(node_type, workflow_id);
+        CREATE INDEX IF NOT EXISTS idx_workflow_nodes_host
+            ON workflow_nodes(host, workflow_id) WHERE host <> '';
+    """)
+    for batch in _iter_workflow_batches(conn):
+        conn.executemany(
+            _INSERT_NODES, [(r["id"], *node) for r, wf in batch for node in wf.nodes]
+        )
+
+
+def _migration_8(conn: sqlite3.Connection):
+    """Key/Value-Tabelle fuer interne Zustaende (z.B. Reindex-Checkpoint)."""
+    _run_script(conn, """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT DEFAULT ''
+        );
+    """)
+
+
+def _migration_9(conn: sqlite3.Connection):
+    """Strukturierte Zaehler in sync_history + Tagesaggregate (sync_rollup).
+
+    Bestehende Pull-Eintraege ("imported=N, skipped=M") und Pushes werden
+    in die neuen Spalten uebernommen.
+    """
+    _run_script(conn, """
+        ALTER TABLE sync_history ADD COLUMN imported INTEGER DEFAULT 0;
+        ALTER TABLE sync_history ADD COLUMN skipped INTEGER DEFAULT 0;
+        ALTER TABLE sync_history ADD COLUMN errors INTEGER DEFAULT 0;
+
+        UPDATE sync_history SET errors = 1 WHERE status = 'error';
+        UPDATE sync_history SET imported = 1 WHERE direction = 'push' AND status <> 'error';
+
+        CREATE TABLE IF NOT EXISTS sync_rollup (
+            day TEXT NOT NULL,
+            server_id INTEGER NOT NULL DEFAULT 0,
+            direction TEXT NOT NULL,
+            entries INTEGER DEFAULT 0,
+            error_entries INTEGER DEFAULT 0,
+            imported INTEGER DEFAULT 0,
+            skipped INTEGER DEFAULT 0,
+            errors INTEGER DEFAULT 0,
+            PRIMARY KEY (day, server_id, direction)
+        ) WITHOUT ROWID;
+    """)
+    pattern = re.compile(r"imported=(\d+), skipped=(\d+)")
+    rows = conn.execute(
+        "SELECT id, details FROM sync_history WHERE direction = 'pull' AND details LIKE 'imported=%'"
+    ).fetchall()
+    for r in rows:
+        m = pattern.search(r["details"] or "")
+        if m:
+            conn.execute("UPDATE sync_history SET imported = ?, skipped = ? WHERE id = ?",
+                         (int(m.group(1)), int(m.group(2)), r["id"]))
+
+
+# Zaehler in der stats-Tabelle: (kind, Ausdruck fuer key) pro Workflow-Zeile
+_WORKFLOW_STAT_KEYS = (
+    ("total", "''"),
+    ("source", "COALESCE({row}.source, '')"),
+    ("server", "CAST(COALESCE({row}.server_id, 0) AS TEXT)"),
+    ("trigger", "COALESCE({row}.trigger_type, '')"),
+    ("active", "CAST(COALESCE({row}.is_active, 0) AS TEXT)"),
+)
+
+# Ist-Werte aller Zaehler, fuer Erstbefuellung und Konsistenzcheck
+_STATS_ACTUAL = """
+    SELECT 'total' AS kind, '' AS key, COUNT(*) AS value FROM workflows
+    UNION ALL SELECT 'source', COALESCE(source, ''), COUNT(*) FROM workflows GROUP BY 2
+    UNION ALL SELECT 'server', CAST(COALESCE(server_id, 0) AS TEXT), COUNT(*)
+              FROM workflows GROUP BY 2
+    UNION ALL SELECT 'trigger', COALESCE(trigger_type, ''), COUNT(*) FROM workflows GROUP BY 2
+    UNION ALL SELECT 'active', CAST(COALESCE(is_active, 0) AS TEXT), COUNT(*)
+              FROM workflows GROUP BY 2
+    UNION ALL SELECT 'blob_bytes', '', COALESCE(SUM(size), 0) FROM blobs
+    UNION ALL SELECT 'blob_stored_bytes', '', COALESCE(SUM(length(CAST(data AS BLOB))), 0)
+              FROM blobs
+    UNION ALL SELECT 'last_sync', CAST(COALESCE(server_id, 0) AS TEXT), MAX(synced_at)
+              FROM sync_history GROUP BY 2
+"""
+
+
+def _stat_bump(kind: str, key: str, delta: str) -> str:
+    return (f"INSERT INTO stats (kind, key, value) VALUES ('{kind}', {key}, {delta}) "
+            f"ON CONFLICT(kind, key) DO UPDATE SET value = value + excluded.value;")
+
+
+def _migration_10(conn: sqlite3.Connection):
+    """Materialisierte Zaehler (stats) fuer Status und Dashboard, per Trigger gepflegt.
+
+    Workflows nach Quelle, Server, Trigger-Typ und Aktiv-Flag, Blob-Bytes
+    (roh und gespeichert) sowie letzter Sync pro Server.
+    """
+    insert = "\n".join(_stat_bump(k, e.format(row="NEW"), "1") for k, e in _WORKFLOW_STAT_KEYS)
+    delete = "\n".join(_stat_bump(k, e.format(row="OLD"), "-1") for k, e in _WORKFLOW_STAT_KEYS)
+    moved = "\n".join(_stat_bump(k, e.format(row=row), delta)
+                      for k, e in _WORKFLOW_STAT_KEYS[1:]
+                      for row, delta in (("OLD", "-1"), ("NEW", "1")))
+    _run_script(conn, f"""
+        CREATE TABLE IF NOT EXISTS stats (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL DEFAULT '',
+            value NOT NULL DEFAULT 0,
+            PRIMARY KEY (kind, key)
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS trg_workflows_stats_insert AFTER INSERT ON workflows
+        BEGIN
+            {insert}
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_workflows_stats_delete AFTER DELETE ON workflows
+        BEGIN
+            {delete}
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_workflows_stats_update
+        AFTER UPDATE OF source, server_id, trigger_type, is_active ON workflows
+        BEGIN
+            {moved}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_blobs_stats_insert AFTER INSERT ON blobs
+        BEGIN
+            {_stat_bump("blob_bytes", "''", "NEW.size")}
+            {_stat_bump("blob_stored_bytes", "''", "length(CAST(NEW.data AS BLOB))")}
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_blobs_stats_update AFTER UPDATE OF data, size ON blobs
+        BEGIN
+            {_stat_bump("blob_bytes", "''", "NEW.size - OLD.size")}
+            {_stat_bump("blob_stored_bytes", "''",
+                        "length(CAST(NEW.data AS BLOB)) - length(CAST(OLD.data AS BLOB))")}
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_blobs_stats_delete AFTER DELETE ON blobs
+        BEGIN
+            {_stat_bump("blob_bytes", "''", "-OLD.size")}
+            {_stat_bump("blob_stored_bytes", "''", "-length(CAST(OLD.data AS BLOB))")}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_sync_history_stats AFTER INSERT ON sync_history
+        BEGIN
+            INSERT OR REPLACE INTO stats (kind, key, value)
+            VALUES ('last_sync', CAST(COALESCE(NEW.server_id, 0) AS TEXT), NEW.synced_at);
+        END;
+    """)
+    conn.execute(f"INSERT OR REPLACE INTO stats (kind, key, value) SELECT * FROM ({_STATS_ACTUAL})")
+
+
+def _migration_11(conn: sqlite3.Connection):
+    """Pull-Watermark pro Server: groesstes updatedAt des letzten fehlerfreien Pulls."""
+    conn.execute("ALTER TABLE servers ADD COLUMN pull_watermark TEXT DEFAULT ''")
+
+
+def _migration_12(conn: sqlite3.Connection):
+    """Client-Grenzen pro Server: Requests pro Sekunde und gleichzeitige Requests (0 = frei)."""
+    _run_script(conn, """
+        ALTER TABLE servers ADD COLUMN rate_limit REAL DEFAULT 0;
+        ALTER TABLE servers ADD COLUMN max_in_flight INTEGER DEFAULT 0;
+    """)
+
+
+def _migration_13(conn: sqlite3.Connection):
+    """Remote-Cache: content_hash des zuletzt gepushten/gezogenen Stands pro (Server, n8n_id).
+
+    Kein Backfill -- ob lokale Zeilen noch dem Remote-Stand entsprechen, ist
+    unbekannt. Der Cache fuellt sich mit dem naechsten Push oder Pull.
+    """
+    _run_script(conn, """
+        CREATE TABLE IF NOT EXISTS remote_workflows (
+            server_id INTEGER NOT NULL REFERENCES servers(id) ON DELETE CASCADE,
+            n8n_id TEXT NOT NULL,
+            workflow_id INTEGER REFERENCES workflows(id) ON DELETE CASCADE,
+            content_hash TEXT NOT NULL,
+            synced_at TEXT NOT NULL,
+            PRIMARY KEY (server_id, n8n_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_remote_workflows_workflow
+            ON remote_workflows(workflow_id, server_id);
+    """)
+
+
+# Index i migriert von Version i auf i + 1
+_MIGRATIONS = (_migration_1, _migration_2, _migration_3, _migration_4, _migration_5,
+               _migration_6, _migration_7, _migration_8, _migration_9, _migration_10,
+               _migration_11, _migration_12, _migration_13)
+
+
+def _stored_size(value) -> int:
+    """Gespeicherte Groesse in Bytes (TEXT als UTF-8, BLOB roh)."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return len(value)
+
+
+class ConnectionPool:
+    """Thread-lokaler Verbindungspool: eine SQLite-Verbindung pro Thread.
+
+    PRAGMAs werden nur beim Oeffnen einer Verbindung gesetzt. Verbindungen
+    beendeter Threads werden beim naechsten Oeffnen aufgeraeumt, close()
+    schliesst alle (z.B. im FastAPI-lifespan). Nach close() oeffnet acquire()
+    bei Bedarf neue Verbindungen.
+    """
+
+    PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA foreign_keys=ON")
+
+    def __init__(self, db_path, uri: bool = False, pragmas: tuple[str, ...] = ()):
+        self.db_path = str(db_path)
+        self.uri = uri
+        self.pragmas = self.PRAGMAS + tuple(pragmas)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._connections: dict[sqlite3.Connection, threading.Thread] = {}
+
+    def _open(self) -> sqlite3.Connection:
+        # check_same_thread=False nur, damit close() fremde Verbindungen
+        # schliessen darf -- benutzt wird jede Verbindung nur von ihrem Thread.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, uri=self.uri)
+        for pragma in self.pragmas:
+            conn.execute(pragma)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Verbindung des aktuellen Threads (wird beim ersten Zugriff geoeffnet)."""
+        cached = getattr(self._local, "conn", None)
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]
+        conn = self._open()
+        with self._lock:
+            self._prune()
+            self._connections[conn] = threading.current_thread()
+            self._local.conn = (self._generation, conn)
+        return conn
+
+    def _prune(self):
+        """Schliesst Verbindungen von Threads, die nicht mehr laufen."""
+        for conn, thread in list(self._connections.items()):
+            if not thread.is_alive():
+                conn.close()
+                del self._connections[conn]
+
+    @property
+    def size(self) -> int:
+        """Anzahl offener Verbindungen."""
+        return len(self._connections)
+
+    def close(self):
+        """Schliesst alle Verbindungen des Pools."""
+        with self._lock:
+            self._generation += 1
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
 class Database:
     """SQLite-Datenbankzugriff fuer n8nManager."""
 
-    def __init__(self, db_path):
+    # Spalten fuer Listen-Ansichten -- alles ausser dem workflow_json-Blob
+    SUMMARY_COLUMNS = (
+        "id", "name", "description", "n8n_id", "server_id", "content_hash",
+        "node_count", "trigger_type", "tags", "is_active", "source",
+        "created_at", "updated_at",
+    )
+
+    def __init__(self, db_path, pool: Optional[ConnectionPool] = None,
+                 compression: str = "none", snapshot_interval: int = 10,
+                 sync_retention_days: int = 0, profile: Union[str, dict] = DEFAULT_PROFILE,
+                 read_pool: Optional[ConnectionPool] = None, busy_retries: int = BUSY_RETRIES):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.profile = profile
+        self._pool = pool or ConnectionPool(self.db_path, pragmas=profile_pragmas(profile))
+        # Lesen ueber eigene query_only-Verbindungen mit mmap (siehe _read)
+        self._read_pool = read_pool or ConnectionPool(
+            self._pool.db_path, uri=self._pool.uri,
+            pragmas=profile_pragmas(profile, read_only=True))
+        self.busy_retries = max(0, int(busy_retries))
+        self.codec = _resolve_codec(compression)
+        self.snapshot_interval = max(1, int(snapshot_interval))
+        # 0 = sync_history unbegrenzt behalten
+        self.sync_retention_days = max(0, int(sync_retention_days))
+        self._last_rollup_day = None
         self._ensure_tables()
 
     def _connect(self) -> sqlite3.Connection:
-        """Verbindung mit WAL-Modus, foreign_keys und row_factory=Row."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Gepoolte Verbindung (WAL, foreign_keys, row_factory=Row) des aktuellen Threads.
+
+        Als Context-Manager genutzt committet sie bzw. rollt zurueck, bleibt
+        aber fuer den naechsten Aufruf offen.
+        """
+        return self._pool.acquire()
+
+    def _read(self) -> sqlite3.Connection:
+        """Lese-Verbindung des aktuellen Threads (query_only, mmap laut Profil).
+
+        Sieht alles, was ueber _connect committet wurde (WAL). Schreibversuche
+        schlagen mit sqlite3.OperationalError fehl.
+        """
+        return self._read_pool.acquire()
+
+    def close(self):
+        """Schliesst alle gepoolten Verbindungen."""
+        self._pool.close()
+        self._read_pool.close()
 
     def _ensure_tables(self):
-        """Erstellt alle Tabellen falls nicht vorhanden."""
-        with self._connect() as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS servers (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    url TEXT NOT NULL,
-                    api_key TEXT DEFAULT '',
-                    is_default INTEGER DEFAULT 0,
-                    n8n_version TEXT DEFAULT '',
-                    last_ping TEXT,
-                    status TEXT DEFAULT 'unknown',
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS workflows (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    description TEXT DEFAULT '',
-                    n8n_id TEXT DEFAULT '',
-                    server_id INTEGER REFERENCES servers(id),
-                    workflow_json TEXT NOT NULL,
-                    content_hash TEXT DEFAULT '',
-                    node_count INTEGER DEFAULT 0,
-                    trigger_type TEXT DEFAULT '',
-                    tags TEXT DEFAULT '[]',
-                    is_active INTEGER DEFAULT 0,
-                    source TEXT DEFAULT 'local',
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS sync_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    workflow_id INTEGER REFERENCES workflows(id),
-                    server_id INTEGER REFERENCES servers(id),
-                    direction TEXT NOT NULL,
-                    status TEXT DEFAULT 'success',
-                    details TEXT DEFAULT '',
-                    synced_at TEXT DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS templates (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    description TEXT DEFAULT '',
-                    category TEXT DEFAULT 'general',
-                    template_json TEXT NOT NULL,
-                    placeholders TEXT DEFAULT '[]',
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS workflow_versions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    workflow_id INTEGER NOT NULL REFERENCES workflows(id),
-                    version_number INTEGER NOT NULL,
-                    workflow_json TEXT NOT NULL,
-                    content_hash TEXT DEFAULT '',
-                    change_note TEXT DEFAULT '',
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(workflow_id, version_number)
-                );
-
-                CREATE TABLE IF NOT EXISTS node_catalog (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    node_type TEXT UNIQUE NOT NULL,
-                    display_name TEXT DEFAULT '',
-                    category TEXT DEFAULT '',
-                    description TEXT DEFAULT '',
-                    color TEXT DEFAULT '#666666',
-                    icon TEXT DEFAULT ''
-                );
-            """)
-            # Default-Nodes einfuegen
-            default_nodes = [
-                ("n8n-nodes-base.manualTrigger",            "Manual Trigger",  "trigger",   "#ff6d5a"),
-                ("n8n-nodes-base.scheduleTrigger",          "Schedule Trigger","trigger",   "#ff6d5a"),
-                ("n8n-nodes-base.webhook",                  "Webhook",         "trigger",   "#ff6d5a"),
-                ("n8n-nodes-base.httpRequest",              "HTTP Request",    "action",    "#4285f4"),
-                ("n8n-nodes-base.if",                       "IF",              "logic",     "#ffcc00"),
-                ("n8n-nodes-base.switch",                   "Switch",          "logic",     "#ffcc00"),
-                ("n8n-nodes-base.set",                      "Set",             "transform", "#4285f4"),
-                ("n8n-nodes-base.code",                     "Code",            "transform", "#4285f4"),
-                ("n8n-nodes-base.emailSend",                "Send Email",      "action",    "#28a745"),
-                ("n8n-nodes-base.slack",                    "Slack",           "action",    "#28a745"),
-                ("@n8n/n8n-nodes-langchain.agent",          "AI Agent",        "ai",        "#9b59b6"),
-                ("@n8n/n8n-nodes-langchain.chainLlm",       "LLM Chain",       "ai",        "#9b59b6"),
-            ]
-            conn.executemany(
-                "INSERT OR IGNORE INTO node_catalog (node_type, display_name, category, color) VALUES (?, ?, ?, ?)",
-                default_nodes
-            )
+        """Bringt das Schema auf SCHEMA_VERSION (PRAGMA user_version).
+
+        Ist die DB aktuell, kostet das nur ein PRAGMA -- DDL und node_catalog-
+        Inserts laufen nur bei fehlenden Migrationen.
+        """
+        conn = self._connect()
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        # IMMEDIATE: parallel startende Prozesse migrieren nacheinander
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for target, migrate in enumerate(_MIGRATIONS[version:], start=version + 1):
+                migrate(conn)
+                conn.execute(f"PRAGMA user_version = {target}")
             conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
 
     # ── Hilfsfunktionen ──────────────────────────────────────────────────────
 
+    @staticmethod
+    def _analyze(workflow: Union[str, dict, WorkflowAnalysis]) -> WorkflowAnalysis:
+        """JSON-String/dict -> WorkflowAnalysis; vorhandene Analysen unveraendert."""
+        if isinstance(workflow, WorkflowAnalysis):
+            return workflow
+        return WorkflowAnalysis(workflow)
+
     @staticmethod
     def _compute_hash(workflow_json: str) -> str:
         """SHA-256 des normalisierten Workflow-JSON."""
-        try:
-            normalized = json.dumps(json.loads(workflow_json), sort_keys=True, ensure_ascii=False)
-        except (json.JSONDecodeError, TypeError):
-            normalized = workflow_json
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return WorkflowAnalysis(workflow_json).content_hash
 
     @staticmethod
-    def _extract_node_count(workflow_json: str) -> int:
-        """Anzahl Nodes aus JSON."""
-        try:
-            data = json.loads(workflow_json)
-            return len(data.get("nodes", []))
-        except (json.JSONDecodeError, TypeError):
-            return 0
+    def _encode_cursor(updated_at: str, row_id: int) -> str:
+        """Keyset-Cursor (updated_at, id) als URL-sicherer String."""
+        raw = f"{updated_at}|{row_id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
 
     @staticmethod
-    def _extract_trigger_type(workflow_json: str) -> str:
-        """Erster Trigger-Node-Typ aus JSON."""
+    def _decode_cursor(cursor: str) -> tuple[str, int]:
+        """Cursor -> (updated_at, id). Raises ValueError bei ungueltigem Cursor."""
         try:
-            data = json.loads(workflow_json)
-            for node in data.get("nodes", []):
-                ntype = node.get("type", "")
-                if "trigger" in ntype.lower() or "webhook" in ntype.lower():
-                    return ntype
-        except (json.JSONDecodeError, TypeError):
-            pass
-        return ""
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            updated_at, row_id = raw.rsplit("|", 1)
+            return updated_at, int(row_id)
+        except (ValueError, UnicodeError) as e:
+            raise ValueError(f"Ungueltiger Cursor: {cursor}") from e
 
     @staticmethod
     def _row_to_dict(row) -> Optional[dict]:
@@ -163,70 +795,236 @@ class Database:
             return None
         return dict(row)
 
+    def _encode_json(self, text: str):
+        """workflow_json fuer die Speicherung -> (Wert, Codec-Marker)."""
+        return _compress(text, self.codec), self.codec
+
+    @staticmethod
+    def _decode_row(row) -> Optional[dict]:
+        """Wie _row_to_dict, entpackt workflow_json und entfernt json_codec.
+
+        Zeilen ohne workflow_json (Summary-Projektion) bleiben unangetastet.
+        """
+        if row is None:
+            return None
+        d = dict(row)
+        codec = d.pop("json_codec", "")
+        if codec and d.get("workflow_json") is not None:
+            d["workflow_json"] = _decompress(d["workflow_json"], codec)
+        return d
+
+    # ── Blobs ────────────────────────────────────────────────────────────────
+
+    def _put_blob(self, conn: sqlite3.Connection, content_hash: str, text: str):
+        """Legt den Blob zu content_hash an, falls noch nicht vorhanden.
+
+        refcount startet bei 0; die Trigger der referenzierenden Tabellen
+        zaehlen hoch, sobald die Zeile in derselben Transaktion geschrieben wird.
+        """
+        if conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (content_hash,)).fetchone():
+            return
+        stored, codec = self._encode_json(text)
+        conn.execute(
+            "INSERT INTO blobs (hash, data, codec, size, refcount) VALUES (?, ?, ?, ?, 0)",
+            (content_hash, stored, codec, len(text.encode("utf-8")))
+        )
+
+    def _drop_orphan_blob(self, conn: sqlite3.Connection, content_hash: str):
+        conn.execute("DELETE FROM blobs WHERE hash = ? AND refcount <= 0", (content_hash,))
+
+    def _workflow_select(self, summary: bool) -> str:
+        """SELECT ... FROM workflows w (mit Blob-Join wenn nicht summary)."""
+        columns = ", ".join(f"w.{c}" for c in self.SUMMARY_COLUMNS)
+        if summary:
+            return f"SELECT {columns} FROM workflows w"
+        return (f"SELECT {columns}, b.data AS workflow_json, b.codec AS json_codec "
+                f"FROM workflows w LEFT JOIN blobs b ON b.hash = w.content_hash")
+
+    @staticmethod
+    def _index_workflows(conn: sqlite3.Connection, items: list[tuple]):
+        """Schreibt/ersetzt die abgeleiteten Zeilen (workflows_fts, workflow_nodes).
+
+        items: (workflow_id, name, description, WorkflowAnalysis).
+        """
+        ids = [(item[0],) for item in items]
+        conn.executemany("DELETE FROM workflows_fts WHERE rowid = ?", ids)
+        conn.executemany(
+            """INSERT INTO workflows_fts (rowid, name, description, node_names, node_types, params)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [_fts_row(*item) for item in items]
+        )
+        conn.executemany("DELETE FROM workflow_nodes WHERE workflow_id = ?", ids)
+        conn.executemany(
+            _INSERT_NODES, [(item[0], *node) for item in items for node in item[3].nodes]
+        )
+
     # ── CRUD: Workflows ──────────────────────────────────────────────────────
 
-    def add_workflow(self, name: str, workflow_json: str, description: str = "",
-                     server_id: Optional[int] = None, n8n_id: str = "",
-                     source: str = "local") -> int:
-        """Fuegt Workflow ein. Berechnet content_hash, node_count, trigger_type. Gibt workflow_id zurueck."""
-        content_hash = self._compute_hash(workflow_json)
-        node_count = self._extract_node_count(workflow_json)
-        trigger_type = self._extract_trigger_type(workflow_json)
-        now = _now()
+    @_retry_busy
+    def add_workflow(self, name: str, workflow_json: Union[str, WorkflowAnalysis],
+                     description: str = "", server_id: Optional[int] = None,
+                     n8n_id: str = "", source: str = "local") -> int:
+        """Fuegt Workflow ein. Berechnet content_hash, node_count, trigger_type, tags.
 
+        workflow_json darf eine WorkflowAnalysis sein, dann wird nicht erneut
+        geparst. Das JSON landet im Blob-Store unter content_hash. Gibt
+        workflow_id zurueck.
+        """
+        wf = self._analyze(workflow_json)
         with self._connect() as conn:
-            cur = conn.execute(
-                """INSERT INTO workflows
-                   (name, description, n8n_id, server_id, workflow_json, content_hash,
-                    node_count, trigger_type, source, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (name, description, n8n_id, server_id, workflow_json, content_hash,
-                 node_count, trigger_type, source, now, now)
-            )
+            workflow_id = self._insert_row(conn, name, wf, description, server_id, n8n_id,
+                                           source, _now())
+            self._index_workflows(conn, [(workflow_id, name, description, wf)])
             conn.commit()
-            return cur.lastrowid
+            return workflow_id
+
+    def _insert_row(self, conn: sqlite3.Connection, name: str, wf: WorkflowAnalysis,
+                    description: str, server_id: Optional[int], n8n_id: str, source: str,
+                    now: str) -> int:
+        """Blob + workflows-Zeile schreiben (ohne Index, ohne Commit). Gibt id zurueck."""
+        self._put_blob(conn, wf.content_hash, wf.json)
+        cur = conn.execute(
+            """INSERT INTO workflows
+               (name, description, n8n_id, server_id, workflow_json, content_hash,
+                node_count, trigger_type, tags, source, created_at, updated_at)
+               VALUES (?, ?, ?, ?, '', ?, ?, ?, ?, ?, ?, ?)""",
+            (name, description, n8n_id, server_id, wf.content_hash,
+             wf.node_count, wf.trigger_type, json.dumps(wf.tags, ensure_ascii=False),
+             source, now, now)
+        )
+        return cur.lastrowid
+
+    def _upsert_row(self, conn: sqlite3.Connection, name: str, wf: WorkflowAnalysis,
+                    server_id: int, n8n_id: str, description: str, source: str,
+                    now: str) -> tuple[int, str]:
+        """Insert oder Update auf (server_id, n8n_id), ohne Index und Commit.
+
+        Gibt (id, description) zurueck -- bei einem Update die gespeicherte.
+        """
+        self._put_blob(conn, wf.content_hash, wf.json)
+        conn.execute(
+            """INSERT INTO workflows
+               (name, description, n8n_id, server_id, workflow_json, content_hash,
+                node_count, trigger_type, tags, source, created_at, updated_at)
+               VALUES (?, ?, ?, ?, '', ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(server_id, n8n_id)
+                   WHERE server_id IS NOT NULL AND n8n_id <> ''
+               DO UPDATE SET name = excluded.name,
+                             content_hash = excluded.content_hash,
+                             node_count = excluded.node_count,
+                             trigger_type = excluded.trigger_type,
+                             tags = excluded.tags,
+                             updated_at = excluded.updated_at""",
+            (name, description, n8n_id, server_id, wf.content_hash,
+             wf.node_count, wf.trigger_type, json.dumps(wf.tags, ensure_ascii=False),
+             source, now, now)
+        )
+        row = conn.execute(
+            "SELECT id, description FROM workflows WHERE server_id = ? AND n8n_id = ?",
+            (server_id, n8n_id)
+        ).fetchone()
+        self._remember_remote(conn, [(server_id, n8n_id, row["id"], wf.content_hash, now)])
+        return row["id"], row["description"]
+
+    @staticmethod
+    def _remember_remote(conn: sqlite3.Connection, rows: list[tuple]):
+        """remote_workflows setzen: (server_id, n8n_id, workflow_id, content_hash, synced_at)."""
+        conn.executemany(
+            """INSERT INTO remote_workflows (server_id, n8n_id, workflow_id, content_hash,
+                                             synced_at)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(server_id, n8n_id) DO UPDATE SET
+                   workflow_id = excluded.workflow_id,
+                   content_hash = excluded.content_hash,
+                   synced_at = excluded.synced_at""",
+            rows)
 
     def get_workflow(self, workflow_id: int) -> Optional[dict]:
         """Gibt Workflow-dict oder None zurueck."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
-                "SELECT * FROM workflows WHERE id = ?", (workflow_id,)
+                self._workflow_select(summary=False) + " WHERE w.id = ?", (workflow_id,)
             ).fetchone()
-            return self._row_to_dict(row)
+            return self._decode_row(row)
 
     def list_workflows(self, server_id: Optional[int] = None,
-                       source: Optional[str] = None) -> list[dict]:
-        """Listet alle Workflows mit optionalem Filter."""
-        query = "SELECT * FROM workflows WHERE 1=1"
+                       source: Optional[str] = None, summary: bool = False) -> list[dict]:
+        """Listet alle Workflows mit optionalem Filter.
+
+        summary=True liest nur SUMMARY_COLUMNS (ohne workflow_json).
+        """
+        query = self._workflow_select(summary) + " WHERE 1=1"
         params = []
         if server_id is not None:
-            query += " AND server_id = ?"
+            query += " AND w.server_id = ?"
             params.append(server_id)
         if source is not None:
-            query += " AND source = ?"
+            query += " AND w.source = ?"
             params.append(source)
-        query += " ORDER BY updated_at DESC"
-        with self._connect() as conn:
+        query += " ORDER BY w.updated_at DESC, w.id DESC"
+        with self._read() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [dict(r) for r in rows]
+            return [self._decode_row(r) for r in rows]
+
+    def list_workflows_page(self, limit: int = 50, cursor: Optional[str] = None,
+                            server_id: Optional[int] = None, source: Optional[str] = None,
+                            summary: bool = True) -> tuple[list[dict], Optional[str]]:
+        """Eine Seite Workflows per Keyset-Pagination auf (updated_at, id).
 
+        Gibt (workflows, next_cursor) zurueck; next_cursor ist None auf der
+        letzten Seite. Raises ValueError bei ungueltigem Cursor.
+        """
+        query = self._workflow_select(summary) + " WHERE 1=1"
+        params = []
+        if server_id is not None:
+            query += " AND w.server_id = ?"
+            params.append(server_id)
+        if source is not None:
+            query += " AND w.source = ?"
+            params.append(source)
+        if cursor:
+            query += " AND (w.updated_at, w.id) < (?, ?)"
+            params.extend(self._decode_cursor(cursor))
+        # Eine Zeile mehr lesen, um zu wissen ob eine weitere Seite existiert
+        query += f" ORDER BY w.updated_at DESC, w.id DESC LIMIT {int(limit) + 1}"
+        with self._read() as conn:
+            rows = [self._decode_row(r) for r in conn.execute(query, params).fetchall()]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(rows[-1]["updated_at"], rows[-1]["id"])
+        return rows, next_cursor
+
+    @_retry_busy
     def update_workflow(self, workflow_id: int, **kwargs):
         """Updated angegebene Felder, setzt updated_at automatisch."""
         if not kwargs:
             return
         kwargs["updated_at"] = _now()
+        wf = None
         # Wenn workflow_json geaendert wird, Hash und Metadaten neu berechnen
         if "workflow_json" in kwargs:
-            wj = kwargs["workflow_json"]
-            kwargs.setdefault("content_hash", self._compute_hash(wj))
-            kwargs.setdefault("node_count", self._extract_node_count(wj))
-            kwargs.setdefault("trigger_type", self._extract_trigger_type(wj))
+            wf = self._analyze(kwargs.pop("workflow_json"))
+            kwargs["content_hash"] = wf.content_hash
+            kwargs.setdefault("node_count", wf.node_count)
+            kwargs.setdefault("trigger_type", wf.trigger_type)
+            kwargs.setdefault("tags", json.dumps(wf.tags, ensure_ascii=False))
         fields = ", ".join(f"{k} = ?" for k in kwargs)
         values = list(kwargs.values()) + [workflow_id]
         with self._connect() as conn:
+            if wf is not None:
+                self._put_blob(conn, wf.content_hash, wf.json)
             conn.execute(f"UPDATE workflows SET {fields} WHERE id = ?", values)
+            if wf is not None:
+                self._drop_orphan_blob(conn, wf.content_hash)
+                row = conn.execute("SELECT name, description FROM workflows WHERE id = ?",
+                                   (workflow_id,)).fetchone()
+                if row is not None:
+                    self._index_workflows(
+                        conn, [(workflow_id, row["name"], row["description"], wf)])
             conn.commit()
 
+    @_retry_busy
     def delete_workflow(self, workflow_id: int):
         """Loescht Workflow anhand ID."""
         with self._connect() as conn:
@@ -235,32 +1033,457 @@ class Database:
 
     def workflow_exists_by_hash(self, content_hash: str) -> bool:
         """Duplikat-Check anhand content_hash."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT id FROM workflows WHERE content_hash = ? LIMIT 1", (content_hash,)
             ).fetchone()
             return row is not None
 
+    def existing_hashes(self, hashes) -> set[str]:
+        """Welche der content_hashes existieren bereits? Ein Lookup pro 500 Hashes."""
+        hashes = list(dict.fromkeys(hashes))
+        found = set()
+        with self._read() as conn:
+            for i in range(0, len(hashes), 500):
+                chunk = hashes[i:i + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT DISTINCT content_hash FROM workflows WHERE content_hash IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update(r["content_hash"] for r in rows)
+        return found
+
+    def server_workflow_hashes(self, server_id: int, n8n_ids) -> dict[str, str]:
+        """content_hash der lokalen Zeilen eines Servers: {n8n_id: content_hash}."""
+        n8n_ids = [i for i in dict.fromkeys(n8n_ids) if i]
+        found = {}
+        with self._read() as conn:
+            for i in range(0, len(n8n_ids), 500):
+                chunk = n8n_ids[i:i + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT n8n_id, content_hash FROM workflows "
+                    f"WHERE server_id = ? AND n8n_id IN ({placeholders})",
+                    [server_id, *chunk]
+                ).fetchall()
+                found.update((r["n8n_id"], r["content_hash"]) for r in rows)
+        return found
+
+    def add_workflows_bulk(self, workflows: list[dict], chunk_size: int = 500) -> int:
+        """Fuegt viele Workflows per executemany ein, eine Transaktion pro Chunk.
+
+        Jedes dict enthaelt die Argumente von add_workflow (name, workflow_json,
+        optional description, server_id, n8n_id, source). Gibt Anzahl zurueck.
+        """
+        now = _now()
+        analyses = [self._analyze(item["workflow_json"]) for item in workflows]
+        rows = []
+        for item, wf in zip(workflows, analyses):
+            rows.append((item["name"], item.get("description", ""), item.get("n8n_id", ""),
+                         item.get("server_id"), wf.content_hash, wf.node_count,
+                         wf.trigger_type, json.dumps(wf.tags, ensure_ascii=False),
+                         item.get("source", "local"), now, now))
+        for i in range(0, len(rows), chunk_size):
+            self._insert_chunk(rows[i:i + chunk_size], analyses[i:i + chunk_size])
+        return len(rows)
+
+    @_retry_busy
+    def _insert_chunk(self, chunk: list[tuple], analyses: list[WorkflowAnalysis]):
+        """Ein Chunk von add_workflows_bulk in einer Transaktion."""
+        blobs = {}
+        for wf in analyses:
+            if wf.content_hash not in blobs:
+                stored, codec = self._encode_json(wf.json)
+                blobs[wf.content_hash] = (wf.content_hash, stored, codec,
+                                          len(wf.json.encode("utf-8")))
+        with self._connect() as conn:
+            conn.executemany(
+                """INSERT OR IGNORE INTO blobs (hash, data, codec, size, refcount)
+                   VALUES (?, ?, ?, ?, 0)""",
+                blobs.values()
+            )
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM workflows").fetchone()[0]
+            conn.executemany(
+                """INSERT INTO workflows
+                   (name, description, n8n_id, server_id, workflow_json, content_hash,
+                    node_count, trigger_type, tags, source, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, '', ?, ?, ?, ?, ?, ?, ?)""",
+                chunk
+            )
+            # Neue IDs in Einfuegereihenfolge (Schreibsperre ist gehalten)
+            new_ids = [r[0] for r in conn.execute(
+                "SELECT id FROM workflows WHERE id > ? ORDER BY id", (last_id,))]
+            self._index_workflows(conn, [
+                (row_id, row[0], row[1], wf)
+                for row_id, row, wf in zip(new_ids, chunk, analyses)
+            ])
+
+    @_retry_busy
+    def upsert_workflow(self, name: str, workflow_json: Union[str, WorkflowAnalysis],
+                        server_id: int, n8n_id: str, description: str = "",
+                        source: str = "pull") -> int:
+        """Fuegt Workflow ein oder aktualisiert die Zeile mit gleichem (server_id, n8n_id).
+
+        Nutzt den Unique-Index idx_workflows_server_n8n. Gibt workflow_id zurueck.
+        """
+        if not n8n_id:
+            return self.add_workflow(name=name, workflow_json=workflow_json,
+                                     description=description, server_id=server_id,
+                                     source=source)
+        wf = self._analyze(workflow_json)
+        with self._connect() as conn:
+            workflow_id, stored_description = self._upsert_row(
+                conn, name, wf, server_id, n8n_id, description, source, _now())
+            self._index_workflows(conn, [(workflow_id, name, stored_description, wf)])
+            conn.commit()
+            return workflow_id
+
+    @_retry_busy
+    def upsert_workflows_bulk(self, server_id: int, workflows: list[dict]) -> list[int]:
+        """Mehrere upsert_workflow in einer Transaktion (z.B. ein Batch beim Pull).
+
+        Jedes dict enthaelt name, workflow_json (str/dict/WorkflowAnalysis),
+        n8n_id und optional description und source. Ohne n8n_id wird wie bei
+        add_workflow eingefuegt. Gibt die workflow_ids in Eingabereihenfolge zurueck.
+        """
+        now = _now()
+        ids, index = [], {}
+        with self._connect() as conn:
+            for item in workflows:
+                wf = self._analyze(item["workflow_json"])
+                description = item.get("description", "")
+                source = item.get("source", "pull")
+                if item.get("n8n_id"):
+                    workflow_id, description = self._upsert_row(
+                        conn, item["name"], wf, server_id, item["n8n_id"], description,
+                        source, now)
+                else:
+                    workflow_id = self._insert_row(conn, item["name"], wf, description,
+                                                   server_id, "", source, now)
+                ids.append(workflow_id)
+                index[workflow_id] = (workflow_id, item["name"], description, wf)
+            # Doppelte n8n_id im Batch: nur der letzte Stand wird indexiert
+            self._index_workflows(conn, list(index.values()))
+            conn.commit()
+        return ids
+
+    # ── Suche ────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Suchbegriffe -> FTS5-MATCH-Ausdruck.
+
+        Jeder Begriff wird als Phrase gequotet (URLs, Punkte und Bindestriche
+        sind so keine Syntaxfehler), Begriffe werden UND-verknuepft. Ein
+        abschliessendes * macht den Begriff zur Praefix-Suche.
+        Raises ValueError bei leerer Suche.
+        """
+        terms = []
+        for term in query.split():
+            prefix = term.endswith("*")
+            term = term.rstrip("*")
+            if term:
+                terms.append('"' + term.replace('"', '""') + '"' + ("*" if prefix else ""))
+        if not terms:
+            raise ValueError("Leere Suchanfrage")
+        return " ".join(terms)
+
+    def search_workflows(self, query: str, limit: int = 20,
+                         offset: int = 0) -> tuple[list[dict], Optional[int]]:
+        """Volltextsuche (bm25-gerankt) ueber Name, Beschreibung, Nodes und Parameter.
+
+        Liefert Summary-Zeilen mit rank und snippet sowie den Offset der naechsten
+        Seite (None auf der letzten Seite). Raises ValueError bei leerer Suche.
+        """
+        match = self._fts_query(query)
+        columns = ", ".join(f"w.{c}" for c in self.SUMMARY_COLUMNS)
+        ranked = f"""
+            SELECT {columns}, f.score AS rank
+            FROM (SELECT rowid, {FTS_RANK} AS score
+                  FROM workflows_fts WHERE workflows_fts MATCH ?
+                  ORDER BY score LIMIT ? OFFSET ?) f
+            JOIN workflows w ON w.id = f.rowid
+            ORDER BY f.score"""
+        with self._read() as conn:
+            rows = [dict(r) for r in conn.execute(ranked, (match, int(limit) + 1, int(offset)))]
+            next_offset = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_offset = offset + limit
+            # Snippets erst fuer die Seite berechnen, nicht fuer alle Treffer
+            if rows:
+                ids = [r["id"] for r in rows]
+                snippets = dict(conn.execute(
+                    f"""SELECT rowid, snippet(workflows_fts, -1, '[', ']', '...', 12)
+                        FROM workflows_fts WHERE workflows_fts MATCH ?
+                        AND rowid IN ({", ".join("?" * len(ids))})""",
+                    [match, *ids]
+                ).fetchall())
+                for r in rows:
+                    r["snippet"] = snippets.get(r["id"], "")
+        return rows, next_offset
+
+    # ── Nodes ────────────────────────────────────────────────────────────────
+
+    def list_node_catalog(self) -> list[dict]:
+        """Bekannte Node-Typen (node_catalog) sortiert nach Kategorie und Name."""
+        with self._read() as conn:
+            rows = conn.execute(
+                "SELECT * FROM node_catalog ORDER BY category, display_name"
+            ).fetchall()
+            return [dict(r) for r in rows]
+
+    def find_workflows_by_node(self, node_type: Optional[str] = None,
+                               host: Optional[str] = None,
+                               limit: Optional[int] = None) -> list[dict]:
+        """Workflows mit Nodes eines Typs und/oder mit URL-Host (workflow_nodes).
+
+        node_type mit abschliessendem * sucht nach Praefix (z.B.
+        '@n8n/n8n-nodes-langchain.*'). Liefert Summary-Zeilen plus
+        matching_nodes. Raises ValueError ohne Filter.
+        """
+        where, params = [], []
+        if node_type:
+            if node_type.endswith("*"):
+                where.append("node_type GLOB ?")
+                params.append(node_type.rstrip("*").replace("[", "[[]").replace("?", "[?]") + "*")
+            else:
+                where.append("node_type = ?")
+                params.append(node_type)
+        if host:
+            where.append("host = ?")
+            params.append(host.lower())
+        if not where:
+            raise ValueError("node_type oder host angeben")
+        columns = ", ".join(f"w.{c}" for c in self.SUMMARY_COLUMNS)
+        query = f"""
+            SELECT {columns}, m.matching_nodes
+            FROM (SELECT workflow_id, COUNT(*) AS matching_nodes FROM workflow_nodes
+                  WHERE {" AND ".join(where)} GROUP BY workflow_id) m
+            JOIN workflows w ON w.id = m.workflow_id
+            ORDER BY w.updated_at DESC, w.id DESC"""
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        with self._read() as conn:
+            return [dict(r) for r in conn.execute(query, params).fetchall()]
+
+    def node_usage(self) -> list[dict]:
+        """Nutzung pro Node-Typ (Anzahl Nodes und Workflows) mit node_catalog-Infos."""
+        with self._read() as conn:
+            rows = conn.execute(
+                """SELECT u.node_type, u.nodes, u.workflows,
+                          COALESCE(c.display_name, '') AS display_name,
+                          COALESCE(c.category, '') AS category,
+                          COALESCE(c.color, '#666666') AS color
+                   FROM (SELECT node_type, COUNT(*) AS nodes,
+                                COUNT(DISTINCT workflow_id) AS workflows
+                         FROM workflow_nodes GROUP BY node_type) u
+                   LEFT JOIN node_catalog c ON c.node_type = u.node_type
+                   ORDER BY u.workflows DESC, u.node_type"""
+            ).fetchall()
+            return [dict(r) for r in rows]
+
+    # ── Wartung ──────────────────────────────────────────────────────────────
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._read() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+            return row["value"] if row else None
+
+    @_retry_busy
+    def set_meta(self, key: str, value: Optional[str]):
+        """Setzt einen meta-Wert; None loescht den Schluessel."""
+        with self._connect() as conn:
+            if value is None:
+                conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                             (key, value))
+            conn.commit()
+
+    def get_stats(self) -> dict:
+        """Zaehler aus der stats-Tabelle -- konstante Kosten, unabhaengig von der Korpusgroesse.
+
+        Liefert workflows, servers, active, by_source, by_server, by_trigger,
+        blob_bytes, blob_stored_bytes und last_sync (server_id -> Zeitstempel).
+        """
+        with self._read() as conn:
+            rows = conn.execute("SELECT kind, key, value FROM stats").fetchall()
+            servers = conn.execute("SELECT COUNT(*) FROM servers").fetchone()[0]
+        groups = {}
+        for r in rows:
+            if r["kind"] != "last_sync" and not r["value"]:
+                continue
+            groups.setdefault(r["kind"], {})[r["key"]] = r["value"]
+        return {
+            "workflows": groups.get("total", {}).get("", 0),
+            "servers": servers,
+            "active": groups.get("active", {}).get("1", 0),
+            "by_source": groups.get("source", {}),
+            "by_server": {int(k): v for k, v in groups.get("server", {}).items()},
+            "by_trigger": groups.get("trigger", {}),
+            "blob_bytes": groups.get("blob_bytes", {}).get("", 0),
+            "blob_stored_bytes": groups.get("blob_stored_bytes", {}).get("", 0),
+            "last_sync": {int(k): v for k, v in groups.get("last_sync", {}).items()},
+        }
+
+    def check_stats(self, repair: bool = False) -> list[dict]:
+        """Vergleicht stats mit den tatsaechlichen Werten (voller Scan).
+
+        Gibt Abweichungen als {kind, key, stored, actual} zurueck; repair=True
+        schreibt die Ist-Werte zurueck. last_sync wird nur fuer Server mit
+        Eintraegen in sync_history geprueft (aeltere sind verdichtet).
+        """
+        with self._connect() as conn:
+            actual = {(r["kind"], r["key"]): r["value"]
+                      for r in conn.execute(_STATS_ACTUAL).fetchall()}
+            stored = {(r["kind"], r["key"]): r["value"]
+                      for r in conn.execute("SELECT kind, key, value FROM stats").fetchall()}
+            diffs = []
+            for key in sorted(set(actual) | set(stored)):
+                want = actual.get(key, 0)
+                have = stored.get(key, 0)
+                if key[0] == "last_sync" and key not in actual:
+                    continue
+                if want != have:
+                    diffs.append({"kind": key[0], "key": key[1], "stored": have, "actual": want})
+            if repair and diffs:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO stats (kind, key, value) VALUES (?, ?, ?)",
+                    [(d["kind"], d["key"], d["actual"]) for d in diffs]
+                )
+                conn.commit()
+        return diffs
+
+    def iter_workflow_payloads(self, after_id: int = 0, batch_size: int = 500):
+        """Workflows in id-Reihenfolge als Batches von dicts (inkl. gepacktem Blob).
+
+        Jeder Batch ist ein eigener kurzer Lesezugriff, es bleibt keine
+        Transaktion ueber den ganzen Scan offen. Felder: id, name, description,
+        content_hash, node_count, trigger_type, tags, data, codec.
+        """
+        while True:
+            with self._read() as conn:
+                rows = conn.execute(
+                    """SELECT w.id, w.name, w.description, w.content_hash, w.node_count,
+                              w.trigger_type, w.tags, b.data, b.codec
+                       FROM workflows w LEFT JOIN blobs b ON b.hash = w.content_hash
+                       WHERE w.id > ? ORDER BY w.id LIMIT ?""",
+                    (after_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            after_id = rows[-1]["id"]
+            yield [dict(r) for r in rows]
+
+    @_retry_busy
+    def apply_reindex(self, items: list[tuple], checkpoint_key: Optional[str] = None,
+                      checkpoint: Optional[int] = None):
+        """Schreibt neu berechnete Metadaten + Indizes in einer Transaktion.
+
+        items: (workflow_id, name, description, WorkflowAnalysis, changed).
+        Bei changed=True werden content_hash/node_count/trigger_type/tags
+        aktualisiert (updated_at bleibt, es ist keine inhaltliche Aenderung);
+        ein neuer Hash zieht den Blob unter den neuen Schluessel um.
+        workflows_fts/workflow_nodes werden fuer alle items neu geschrieben.
+        checkpoint wird in derselben Transaktion unter checkpoint_key gespeichert.
+        """
+        with self._connect() as conn:
+            for workflow_id, _, _, wf, changed in items:
+                if not changed:
+                    continue
+                if wf.json is not None:
+                    self._put_blob(conn, wf.content_hash, wf.json)
+                conn.execute(
+                    """UPDATE workflows SET content_hash = ?, node_count = ?, trigger_type = ?,
+                       tags = ? WHERE id = ?""",
+                    (wf.content_hash, wf.node_count, wf.trigger_type,
+                     json.dumps(wf.tags, ensure_ascii=False), workflow_id)
+                )
+            self._index_workflows(conn, [item[:4] for item in items])
+            if checkpoint_key is not None:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                             (checkpoint_key, str(checkpoint)))
+            conn.commit()
+
+    def recompress(self, compression: Optional[str] = None, batch_size: int = 500) -> dict:
+        """Schreibt alle Blobs und Versions-Deltas mit neuem Codec um.
+
+        compression=None nutzt den konfigurierten Codec, 'none' entpackt alles.
+        Arbeitet in Batches (eine Transaktion pro Batch), damit die Schreibsperre
+        kurz bleibt. Gibt {rows, changed, bytes_before, bytes_after} zurueck.
+        """
+        target = self.codec if compression is None else _resolve_codec(compression)
+        result = {"rows": 0, "changed": 0, "bytes_before": 0, "bytes_after": 0}
+        conn = self._connect()
+        # (Tabelle, Schluessel, Datenspalte, Codec-Spalte, Filter)
+        targets = (
+            ("blobs", "rowid", "data", "codec", "1=1"),
+            ("workflow_versions", "id", "workflow_json", "json_codec", "storage = 'delta'"),
+        )
+        for table, key, data_col, codec_col, where in targets:
+            last_id = 0
+            while True:
+                rows = conn.execute(
+                    f"""SELECT {key} AS k, {data_col} AS data, {codec_col} AS codec FROM {table}
+                        WHERE {key} > ? AND {where} ORDER BY {key} LIMIT ?""",
+                    (last_id, batch_size)
+                ).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1]["k"]
+                updates = []
+                for r in rows:
+                    before = _stored_size(r["data"])
+                    result["rows"] += 1
+                    result["bytes_before"] += before
+                    if (r["codec"] or "") == target:
+                        result["bytes_after"] += before
+                        continue
+                    stored = _compress(_decompress(r["data"], r["codec"] or ""), target)
+                    result["bytes_after"] += _stored_size(stored)
+                    updates.append((stored, target, r["k"]))
+                if updates:
+                    with conn:
+                        conn.executemany(
+                            f"UPDATE {table} SET {data_col} = ?, {codec_col} = ? WHERE {key} = ?",
+                            updates
+                        )
+                    result["changed"] += len(updates)
+        return result
+
+    def vacuum(self):
+        """Gibt freie Seiten an das Dateisystem zurueck (z.B. nach recompress)."""
+        self._connect().execute("VACUUM")
+
     # ── CRUD: Servers ────────────────────────────────────────────────────────
 
+    @_retry_busy
     def add_server(self, name: str, url: str, api_key: str = "",
-                   is_default: bool = False) -> int:
-        """Fuegt Server ein. Gibt server_id zurueck."""
+                   is_default: bool = False, rate_limit: float = 0,
+                   max_in_flight: int = 0) -> int:
+        """Fuegt Server ein. Gibt server_id zurueck.
+
+        rate_limit (Requests/s) und max_in_flight begrenzen den n8n-Client,
+        0 = unbegrenzt.
+        """
         now = _now()
         with self._connect() as conn:
             if is_default:
                 conn.execute("UPDATE servers SET is_default = 0")
             cur = conn.execute(
-                """INSERT INTO servers (name, url, api_key, is_default, created_at)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (name, url, api_key, 1 if is_default else 0, now)
+                """INSERT INTO servers (name, url, api_key, is_default, rate_limit,
+                                        max_in_flight, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (name, url, api_key, 1 if is_default else 0, rate_limit, max_in_flight, now)
             )
             conn.commit()
             return cur.lastrowid
 
     def get_server(self, server_id: int) -> Optional[dict]:
         """Gibt Server-dict oder None zurueck."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM servers WHERE id = ?", (server_id,)
             ).fetchone()
@@ -268,7 +1491,7 @@ class Database:
 
     def get_server_by_name(self, name: str) -> Optional[dict]:
         """Gibt Server-dict anhand Name oder None zurueck."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM servers WHERE name = ?", (name,)
             ).fetchone()
@@ -276,10 +1499,11 @@ class Database:
 
     def list_servers(self) -> list[dict]:
         """Listet alle Server."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute("SELECT * FROM servers ORDER BY name").fetchall()
             return [dict(r) for r in rows]
 
+    @_retry_busy
     def update_server(self, server_id: int, **kwargs):
         """Updated angegebene Felder eines Servers."""
         if not kwargs:
@@ -292,12 +1516,13 @@ class Database:
 
     def get_default_server(self) -> Optional[dict]:
         """Gibt den Default-Server zurueck (WHERE is_default=1 LIMIT 1)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM servers WHERE is_default = 1 LIMIT 1"
             ).fetchone()
             return self._row_to_dict(row)
 
+    @_retry_busy
     def set_default_server(self, server_id: int):
         """Setzt server_id als Default, alle anderen auf 0."""
         with self._connect() as conn:
@@ -307,41 +1532,292 @@ class Database:
 
     # ── Sync-History ─────────────────────────────────────────────────────────
 
-    def add_sync_entry(self, workflow_id: int, server_id: int, direction: str,
-                       status: str = "success", details: str = "") -> int:
-        """Fuegt Sync-Eintrag ein. Gibt id zurueck."""
+    def add_sync_entry(self, workflow_id: Optional[int], server_id: Optional[int],
+                       direction: str, status: str = "success", details: str = "",
+                       imported: int = 0, skipped: int = 0, errors: int = 0) -> int:
+        """Fuegt Sync-Eintrag ein. Gibt id zurueck.
+
+        Mit sync_retention_days > 0 werden hoechstens einmal pro Tag alte
+        Eintraege in sync_rollup verdichtet.
+        """
         now = _now()
+        entry_id = self._insert_sync_entry((workflow_id, server_id, direction, status, details,
+                                            imported, skipped, errors, now))
+        if self.sync_retention_days and self._last_rollup_day != now[:10]:
+            self._last_rollup_day = now[:10]
+            self.rollup_sync_history()
+        return entry_id
+
+    @_retry_busy
+    def _insert_sync_entry(self, row: tuple) -> int:
         with self._connect() as conn:
             cur = conn.execute(
-                """INSERT INTO sync_history (workflow_id, server_id, direction, status, details, synced_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (workflow_id, server_id, direction, status, details, now)
+                """INSERT INTO sync_history
+                   (workflow_id, server_id, direction, status, details, imported, skipped,
+                    errors, synced_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                row
             )
             conn.commit()
             return cur.lastrowid
 
-    def get_sync_history(self, workflow_id: Optional[int] = None,
-                         server_id: Optional[int] = None, limit: int = 50) -> list[dict]:
-        """Gibt Sync-Historie zurueck, optional gefiltert."""
-        query = "SELECT * FROM sync_history WHERE 1=1"
-        params = []
+    def remote_workflows(self, server_id: int, workflow_ids) -> dict[int, dict]:
+        """Remote-Cache eines Servers fuer workflow_ids -> {workflow_id: {n8n_id, content_hash}}.
+
+        Bei mehreren Kopien auf dem Server gilt die zuletzt synchronisierte.
+        """
+        ids = list(dict.fromkeys(workflow_ids))
+        found: dict[int, dict] = {}
+        with self._read() as conn:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                rows = conn.execute(
+                    f"""SELECT workflow_id, n8n_id, content_hash FROM remote_workflows
+                        WHERE server_id = ? AND workflow_id IN ({",".join("?" * len(chunk))})
+                        ORDER BY synced_at""",
+                    [server_id, *chunk]).fetchall()
+                for r in rows:
+                    found[r["workflow_id"]] = {"n8n_id": r["n8n_id"],
+                                               "content_hash": r["content_hash"]}
+        return found
+
+    @_retry_busy
+    def record_pushes(self, entries: list[dict]) -> int:
+        """Ergebnisse mehrerer Pushes in einer Transaktion (z.B. ein Batch von push --all).
+
+        Jedes dict enthaelt workflow_id, server_id, status, details und
+        optional imported, skipped, errors. Mit n8n_id wird der Workflow an
+        diesen Server gebunden (n8n_id, server_id); mit remote_id und
+        content_hash wird der Remote-Cache gesetzt. Gibt die Anzahl
+        Eintraege zurueck.
+        """
+        if not entries:
+            return 0
+        now = _now()
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE workflows SET n8n_id = ?, server_id = ?, updated_at = ? WHERE id = ?",
+                [(e["n8n_id"], e["server_id"], now, e["workflow_id"])
+                 for e in entries if e.get("n8n_id")])
+            conn.executemany(
+                """INSERT INTO sync_history
+                   (workflow_id, server_id, direction, status, details, imported, skipped,
+                    errors, synced_at)
+                   VALUES (?, ?, 'push', ?, ?, ?, ?, ?, ?)""",
+                [(e["workflow_id"], e["server_id"], e["status"], e.get("details", ""),
+                  e.get("imported", 0), e.get("skipped", 0), e.get("errors", 0), now)
+                 for e in entries])
+            self._remember_remote(conn, [
+                (e["server_id"], e["remote_id"], e["workflow_id"], e["content_hash"], now)
+                for e in entries if e.get("remote_id")])
+            conn.commit()
+        if self.sync_retention_days and self._last_rollup_day != now[:10]:
+            self._last_rollup_day = now[:10]
+            self.rollup_sync_history()
+        return len(entries)
+
+    @staticmethod
+    def _sync_filters(workflow_id: Optional[int], server_id: Optional[int],
+                      direction: Optional[str]) -> tuple[str, list]:
+        query, params = "", []
         if workflow_id is not None:
             query += " AND workflow_id = ?"
             params.append(workflow_id)
         if server_id is not None:
             query += " AND server_id = ?"
             params.append(server_id)
-        query += f" ORDER BY synced_at DESC LIMIT {int(limit)}"
+        if direction is not None:
+            query += " AND direction = ?"
+            params.append(direction)
+        return query, params
+
+    def get_sync_history(self, workflow_id: Optional[int] = None,
+                         server_id: Optional[int] = None, limit: int = 50,
+                         direction: Optional[str] = None) -> list[dict]:
+        """Gibt Sync-Historie zurueck, optional gefiltert."""
+        rows, _ = self.get_sync_history_page(workflow_id=workflow_id, server_id=server_id,
+                                             direction=direction, limit=limit)
+        return rows
+
+    def get_sync_history_page(self, workflow_id: Optional[int] = None,
+                              server_id: Optional[int] = None,
+                              direction: Optional[str] = None, limit: int = 50,
+                              cursor: Optional[str] = None) -> tuple[list[dict], Optional[str]]:
+        """Eine Seite Sync-Historie, neueste zuerst (Keyset auf synced_at, id).
+
+        Nutzt idx_sync_history_synced/_workflow/_server. Gibt (eintraege,
+        next_cursor) zurueck. Raises ValueError bei ungueltigem Cursor.
+        """
+        filters, params = self._sync_filters(workflow_id, server_id, direction)
+        query = "SELECT * FROM sync_history WHERE 1=1" + filters
+        if cursor:
+            query += " AND (synced_at, id) < (?, ?)"
+            params.extend(self._decode_cursor(cursor))
+        query += f" ORDER BY synced_at DESC, id DESC LIMIT {int(limit) + 1}"
+        with self._read() as conn:
+            rows = [dict(r) for r in conn.execute(query, params).fetchall()]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(rows[-1]["synced_at"], rows[-1]["id"])
+        return rows, next_cursor
+
+    def rollup_sync_history(self, retention_days: Optional[int] = None) -> dict:
+        """Verdichtet Eintraege aelter als retention_days in sync_rollup und loescht sie.
+
+        Ein Tag pro Transaktion, damit die Schreibsperre kurz bleibt.
+        retention_days=None nutzt sync_retention_days. Gibt {days, entries} zurueck.
+        """
+        days = self.sync_retention_days if retention_days is None else int(retention_days)
+        result = {"days": 0, "entries": 0}
+        if days <= 0:
+            return result
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+        conn = self._connect()
+        while True:
+            row = conn.execute(
+                "SELECT MIN(synced_at) AS oldest FROM sync_history WHERE synced_at < ?",
+                (cutoff,)
+            ).fetchone()
+            if row["oldest"] is None:
+                return result
+            day = row["oldest"][:10]
+            next_day = (datetime.strptime(day, "%Y-%m-%d")
+                        + timedelta(days=1)).strftime("%Y-%m-%d")
+            with conn:
+                conn.execute(
+                    """INSERT INTO sync_rollup
+                       (day, server_id, direction, entries, error_entries, imported, skipped, errors)
+                       SELECT ?, COALESCE(server_id, 0), direction, COUNT(*),
+                              SUM(status = 'error'), SUM(imported), SUM(skipped), SUM(errors)
+                       FROM sync_history WHERE synced_at >= ? AND synced_at < ?
+                       GROUP BY COALESCE(server_id, 0), direction
+                       ON CONFLICT(day, server_id, direction) DO UPDATE SET
+                           entries = entries + excluded.entries,
+                           error_entries = error_entries + excluded.error_entries,
+                           imported = imported + excluded.imported,
+                           skipped = skipped + excluded.skipped,
+                           errors = errors + excluded.errors""",
+                    (day, day, next_day)
+                )
+                cur = conn.execute(
+                    "DELETE FROM sync_history WHERE synced_at >= ? AND synced_at < ?",
+                    (day, next_day)
+                )
+            result["days"] += 1
+            result["entries"] += cur.rowcount
+
+    def get_sync_stats(self, server_id: Optional[int] = None, direction: Optional[str] = None,
+                       days: int = 30) -> list[dict]:
+        """Tagesaggregate pro Server und Richtung (Rollups + noch nicht verdichtete Eintraege).
+
+        Liefert day, server_id, direction, entries, error_entries, error_rate,
+        imported, skipped, errors -- neueste Tage zuerst.
+        """
+        since = (datetime.now(timezone.utc) - timedelta(days=int(days))).strftime("%Y-%m-%d")
+        filters, params = self._sync_filters(None, server_id, direction)
+        query = f"""
+            SELECT day, server_id, direction, SUM(entries) AS entries,
+                   SUM(error_entries) AS error_entries, SUM(imported) AS imported,
+                   SUM(skipped) AS skipped, SUM(errors) AS errors
+            FROM (
+                SELECT day, server_id, direction, entries, error_entries, imported, skipped,
+                       errors
+                FROM sync_rollup WHERE day >= ?{filters}
+                UNION ALL
+                SELECT substr(synced_at, 1, 10), COALESCE(server_id, 0), direction, 1,
+                       status = 'error', imported, skipped, errors
+                FROM sync_history WHERE synced_at >= ?{filters}
+            )
+            GROUP BY day, server_id, direction
+            ORDER BY day DESC, server_id, direction"""
+        with self._read() as conn:
+            rows = [dict(r) for r in conn.execute(query, [since, *params, since, *params])]
+        for r in rows:
+            r["error_rate"] = round(r["error_entries"] / r["entries"], 4) if r["entries"] else 0.0
+        return rows
+
+    # ── Templates ────────────────────────────────────────────────────────────
+
+    def _template_select(self) -> str:
+        return ("SELECT t.id, t.name, t.description, t.category, t.placeholders, "
+                "t.content_hash, t.created_at, b.data AS template_json, b.codec AS json_codec "
+                "FROM templates t LEFT JOIN blobs b ON b.hash = t.content_hash")
+
+    @staticmethod
+    def _template_row(row) -> Optional[dict]:
+        """Template-Zeile -> dict mit entpacktem template_json und placeholders-Liste."""
+        if row is None:
+            return None
+        d = dict(row)
+        codec = d.pop("json_codec") or ""
+        if d["template_json"] is not None:
+            d["template_json"] = _decompress(d["template_json"], codec)
+        d["placeholders"] = json.loads(d["placeholders"] or "[]")
+        return d
+
+    @_retry_busy
+    def add_template(self, name: str, template_json: str, description: str = "",
+                     category: str = "general", placeholders: Optional[list] = None) -> int:
+        """Fuegt Vorlage ein (JSON im Blob-Store). Gibt template_id zurueck."""
+        content_hash = self._compute_hash(template_json)
+        now = _now()
         with self._connect() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [dict(r) for r in rows]
+            self._put_blob(conn, content_hash, template_json)
+            cur = conn.execute(
+                """INSERT INTO templates
+                   (name, description, category, template_json, content_hash,
+                    placeholders, created_at)
+                   VALUES (?, ?, ?, '', ?, ?, ?)""",
+                (name, description, category, content_hash,
+                 json.dumps(placeholders or [], ensure_ascii=False), now)
+            )
+            conn.commit()
+            return cur.lastrowid
+
+    def get_template(self, template_id: int) -> Optional[dict]:
+        """Gibt Vorlage oder None zurueck."""
+        with self._read() as conn:
+            row = conn.execute(
+                self._template_select() + " WHERE t.id = ?", (template_id,)
+            ).fetchone()
+            return self._template_row(row)
+
+    def list_templates(self, category: Optional[str] = None) -> list[dict]:
+        """Listet Vorlagen, optional nach Kategorie."""
+        query = self._template_select()
+        params = []
+        if category is not None:
+            query += " WHERE t.category = ?"
+            params.append(category)
+        query += " ORDER BY t.name"
+        with self._read() as conn:
+            return [self._template_row(r) for r in conn.execute(query, params).fetchall()]
 
     # ── Versionen ────────────────────────────────────────────────────────────
 
-    def add_version(self, workflow_id: int, workflow_json: str,
+    VERSION_COLUMNS = (
+        "id", "workflow_id", "version_number", "content_hash", "change_note",
+        "storage", "created_at",
+    )
+
+    # Payload einer Version: Vollstand aus blobs, Delta aus workflow_json
+    _VERSION_PAYLOAD_SELECT = """
+        SELECT v.id, v.storage,
+               COALESCE(b.data, v.workflow_json) AS workflow_json,
+               COALESCE(b.codec, v.json_codec) AS json_codec
+        FROM workflow_versions v
+        LEFT JOIN blobs b ON v.storage = 'full' AND b.hash = v.content_hash"""
+
+    @_retry_busy
+    def add_version(self, workflow_id: int, workflow_json: Union[str, WorkflowAnalysis],
                     change_note: str = "") -> int:
-        """Fuegt neue Version ein. version_number wird automatisch erhoeht. Gibt id zurueck."""
-        content_hash = self._compute_hash(workflow_json)
+        """Fuegt neue Version ein. version_number wird automatisch erhoeht. Gibt id zurueck.
+
+        Gespeichert wird ein Delta zur Vorversion; alle snapshot_interval
+        Versionen (und wenn das Delta nicht kleiner ist) ein Vollstand.
+        """
+        wf = self._analyze(workflow_json)
         now = _now()
         with self._connect() as conn:
             row = conn.execute(
@@ -349,21 +1825,121 @@ class Database:
                 (workflow_id,)
             ).fetchone()
             next_version = (row["max_v"] or 0) + 1
+
+            # Vollstaende liegen im Blob-Store, Deltas inline in workflow_json
+            stored, codec, storage = "", "", "full"
+            if (next_version - 1) % self.snapshot_interval and wf.data is not None:
+                previous = self._materialize_version(conn, workflow_id, next_version - 1)
+                if previous is not None:
+                    delta_json = json.dumps(json_delta.diff(previous, wf.data),
+                                            ensure_ascii=False)
+                    if len(delta_json) < len(wf.json):
+                        (stored, codec), storage = self._encode_json(delta_json), "delta"
+            if storage == "full":
+                self._put_blob(conn, wf.content_hash, wf.json)
+
             cur = conn.execute(
                 """INSERT INTO workflow_versions
-                   (workflow_id, version_number, workflow_json, content_hash, change_note, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (workflow_id, next_version, workflow_json, content_hash, change_note, now)
+                   (workflow_id, version_number, workflow_json, json_codec, storage,
+                    content_hash, change_note, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (workflow_id, next_version, stored, codec, storage, wf.content_hash,
+                 change_note, now)
             )
             conn.commit()
             return cur.lastrowid
 
+    def _materialize_version(self, conn: sqlite3.Connection, workflow_id: int,
+                             version_number: int):
+        """Rekonstruiert die Daten einer Version: letzter Vollstand + Deltas.
+
+        Gibt das geparste JSON zurueck, None wenn die Version fehlt oder der
+        Vollstand kein gueltiges JSON ist.
+        """
+        rows = conn.execute(
+            self._VERSION_PAYLOAD_SELECT + """
+               WHERE v.workflow_id = ? AND v.version_number <= ?
+                 AND v.version_number >= (
+                     SELECT MAX(version_number) FROM workflow_versions
+                     WHERE workflow_id = ? AND version_number <= ? AND storage = 'full')
+               ORDER BY v.version_number""",
+            (workflow_id, version_number, workflow_id, version_number)
+        ).fetchall()
+        if not rows:
+            return None
+        data = None
+        for r in rows:
+            text = _decompress(r["workflow_json"], r["json_codec"] or "")
+            try:
+                parsed = json.loads(text)
+            except json.JSONDecodeError:
+                return None
+            data = parsed if r["storage"] == "full" else json_delta.apply(data, parsed)
+        return data
+
     def get_versions(self, workflow_id: int) -> list[dict]:
-        """Gibt alle Versionen eines Workflows zurueck, absteigend sortiert."""
-        with self._connect() as conn:
+        """Metadaten aller Versionen eines Workflows (ohne JSON), absteigend sortiert."""
+        columns = ", ".join(self.VERSION_COLUMNS)
+        with self._read() as conn:
             rows = conn.execute(
-                """SELECT * FROM workflow_versions WHERE workflow_id = ?
-                   ORDER BY version_number DESC""",
+                f"""SELECT {columns} FROM workflow_versions WHERE workflow_id = ?
+                    ORDER BY version_number DESC""",
                 (workflow_id,)
             ).fetchall()
             return [dict(r) for r in rows]
+
+    def get_version(self, workflow_id: int, version_number: int) -> Optional[dict]:
+        """Eine Version inkl. rekonstruiertem workflow_json oder None.
+
+        Kosten: hoechstens snapshot_interval Deltas ab dem letzten Vollstand.
+        """
+        columns = ", ".join(self.VERSION_COLUMNS)
+        with self._read() as conn:
+            row = conn.execute(
+                f"""SELECT {columns} FROM workflow_versions
+                    WHERE workflow_id = ? AND version_number = ?""",
+                (workflow_id, version_number)
+            ).fetchone()
+            if row is None:
+                return None
+            version = dict(row)
+            if row["storage"] == "full":
+                payload = conn.execute(
+                    self._VERSION_PAYLOAD_SELECT + " WHERE v.id = ?", (row["id"],)
+                ).fetchone()
+                version["workflow_json"] = self._decode_row(payload)["workflow_json"]
+                return version
+            data = self._materialize_version(conn, workflow_id, version_number)
+        version["workflow_json"] = json.dumps(data, ensure_ascii=False)
+        return version
+
+
+def open_database(config: Optional[dict] = None):
+    """Storage-Backend (database.backend) mit Pfad und Optionen aus der Konfiguration.
+
+    'sqlite' (Default) liefert eine Database, 'memory' und 'sharded' die
+    Implementierungen aus core.storage. database.profile waehlt das
+    PRAGMA-Profil, database.pragmas ueberschreibt einzelne Werte daraus.
+    Raises ValueError bei unbekanntem Backend oder Profil.
+    """
+    from n8nManager.core.config import load_config, get_db_path
+    if config is None:
+        config = load_config()
+    db_cfg = config.get("database", {})
+    profile = db_cfg.get("profile", DEFAULT_PROFILE)
+    if db_cfg.get("pragmas"):
+        # Einzelne PRAGMAs des Profils ueberschreiben
+        profile_pragmas(profile)
+        profile = {**PROFILES[profile], **db_cfg["pragmas"]}
+    options = {
+        "compression": db_cfg.get("compression", "none"),
+        "snapshot_interval": db_cfg.get("version_snapshot_interval", 10),
+        "sync_retention_days": db_cfg.get("sync_history_retention_days", 0),
+        "profile": profile,
+        "busy_retries": db_cfg.get("busy_retries", BUSY_RETRIES),
+    }
+    backend = db_cfg.get("backend", "sqlite")
+    if backend == "sqlite":
+        return Database(get_db_path(config), **options)
+    from n8nManager.core.storage import open_backend
+    return open_backend(backend, get_db_path(config), **options)
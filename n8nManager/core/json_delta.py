@@ -0,0 +1,73 @@
+"""Strukturelle Deltas zwischen zwei JSON-Werten (fuer die Versionshistorie).
+
+Ein Delta ist ein dict mit genau einer Form:
+    {"v": wert}                      -- Wert ersetzen
+    {"d": {key: delta}, "r": [keys]} -- Objekt: Schluessel aendern/entfernen
+    {"l": {index: delta}, "n": len}  -- Liste: Elemente aendern/anhaengen, kuerzen
+None bedeutet "unveraendert".
+"""
+from typing import Any, Optional
+
+
+def diff(old: Any, new: Any) -> Optional[dict]:
+    """Delta von old nach new oder None wenn beide gleich sind."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key, value in new.items():
+            if key in old:
+                sub = diff(old[key], value)
+                if sub is not None:
+                    changes[key] = sub
+            else:
+                changes[key] = {"v": value}
+        removed = [key for key in old if key not in new]
+        if not changes and not removed:
+            return None
+        delta = {}
+        if changes:
+            delta["d"] = changes
+        if removed:
+            delta["r"] = removed
+        return delta
+
+    if isinstance(old, list) and isinstance(new, list):
+        changes = {}
+        for i, value in enumerate(new):
+            sub = diff(old[i], value) if i < len(old) else {"v": value}
+            if sub is not None:
+                changes[str(i)] = sub
+        if not changes and len(old) == len(new):
+            return None
+        delta = {"l": changes}
+        if len(old) != len(new):
+            delta["n"] = len(new)
+        return delta
+
+    # Skalare: Typ mitvergleichen, sonst gilt 1 == True
+    if type(old) is type(new) and old == new:
+        return None
+    return {"v": new}
+
+
+def apply(old: Any, delta: Optional[dict]) -> Any:
+    """Wendet ein Delta aus diff() auf old an. old wird nicht veraendert."""
+    if delta is None:
+        return old
+    if "v" in delta:
+        return delta["v"]
+    if "l" in delta:
+        result = list(old)
+        del result[delta.get("n", len(result)):]
+        for index, sub in sorted(delta["l"].items(), key=lambda item: int(item[0])):
+            i = int(index)
+            if i < len(result):
+                result[i] = apply(result[i], sub)
+            else:
+                result.append(apply(None, sub))
+        return result
+    result = dict(old)
+    for key in delta.get("r", ()):
+        result.pop(key, None)
+    for key, sub in delta.get("d", {}).items():
+        result[key] = apply(result.get(key), sub)
+    return result
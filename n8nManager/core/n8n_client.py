@@ -1,48 +1,515 @@
 """REST-Client fuer die n8n API."""
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
 import httpx
-from typing import Optional
 
+try:
+    import h2  # noqa: F401
+except ImportError:  # optional: pip install httpx[http2]
+    h2 = None
+
+# Pool-Defaults, ueberschreibbar per config.json (Abschnitt n8n)
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Wiederholungen und Circuit-Breaker, ueberschreibbar per config.json (Abschnitt n8n)
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5  # Basis in Sekunden, verdoppelt pro Versuch
+DEFAULT_RETRY_MAX_BACKOFF = 10.0  # laengeres Retry-After: nicht warten, Fehler melden
+DEFAULT_BREAKER_THRESHOLD = 5  # Fehlschlaege in Folge bis "open"
+DEFAULT_BREAKER_COOLDOWN = 30.0
+
+# Nur diese Methoden werden nach Timeouts und 5xx wiederholt (PATCH setzt hier
+# nur absolute Werte wie active). Verbindungsfehler und 429 erreichen den
+# Server nicht bzw. wurden abgelehnt -- die gelten fuer jede Methode.
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "PATCH"))
+RETRY_STATUSES = frozenset((502, 503, 504))
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+logger = logging.getLogger(__name__)
+
+# Maximale Seitengroesse der n8n Public API
+MAX_PAGE_SIZE = 250
+
+
+class N8nApiError(Exception):
+    """Fehler beim Iterieren (iter_workflows); result ist das Fehler-dict von _request."""
+
+    def __init__(self, result: dict):
+        super().__init__(result.get("detail") or "n8n API-Fehler")
+        self.result = result
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After-Header (Sekunden oder HTTP-Datum) -> Sekunden, None wenn fehlend."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# ── Circuit-Breaker ──────────────────────────────────────────────────────
+
+
+class CircuitBreaker:
+    """Circuit-Breaker pro n8n-Server (Basis-URL), geteilt von sync und async Client.
+
+    closed: Requests laufen. Nach threshold Fehlschlaegen in Folge (Netzfehler,
+    5xx) -> open: Requests scheitern sofort, ohne Netzwerk. Nach cooldown
+    Sekunden -> half_open: genau ein Probe-Request; Erfolg schliesst, Fehler
+    oeffnet erneut. Zustandswechsel gehen an den Listener (set_circuit_listener).
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, name: str, threshold: int = DEFAULT_BREAKER_THRESHOLD,
+                 cooldown: float = DEFAULT_BREAKER_COOLDOWN):
+        self.name = name
+        self.threshold = max(1, int(threshold))
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Darf ein Request raus? Im Zustand open nach Ablauf des cooldown als Probe."""
+        return self.enter() is not None
+
+    def enter(self) -> Optional[str]:
+        """Wie allow(), gibt aber die Rolle zurueck: None (abgelehnt), "request" oder "probe".
+
+        Eine Probe muss mit success(), failure() oder release() enden.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return "request"
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return None
+                changed = self._set(self.HALF_OPEN)
+            elif self._probing:
+                return None
+            else:
+                changed = False
+            self._probing = True
+        if changed:
+            _notify(self)
+        return "probe"
+
+    def release(self, role: Optional[str]):
+        """Request ohne Ergebnis (abgebrochen, unerwarteter Fehler): Probe wieder freigeben."""
+        if role == "probe":
+            with self._lock:
+                self._probing = False
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            changed = self._set(self.CLOSED)
+        if changed:
+            _notify(self)
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            changed = False
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                self._opened_at = time.monotonic()
+                changed = self._set(self.OPEN)
+        if changed:
+            _notify(self)
+
+    def _set(self, state: str) -> bool:
+        changed, self.state = self.state != state, state
+        return changed
+
+    def snapshot(self) -> dict:
+        """Zustand fuer /api/servers: state, failures, retry_in (Sekunden bis zur Probe)."""
+        with self._lock:
+            retry_in = 0.0
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+            return {"state": self.state, "failures": self.failures,
+                    "retry_in": round(retry_in, 1)}
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+_circuit_listener: Optional[Callable[[str, str], None]] = None
+
+
+def get_breaker(base_url: str, threshold: Optional[int] = None,
+                cooldown: Optional[float] = None) -> CircuitBreaker:
+    """Circuit-Breaker einer n8n-Instanz; alle Clients mit gleicher URL teilen ihn.
+
+    Angegebene threshold/cooldown gelten auch fuer einen bestehenden Breaker.
+    """
+    name = base_url.rstrip("/")
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name)
+        if threshold is not None:
+            breaker.threshold = max(1, int(threshold))
+        if cooldown is not None:
+            breaker.cooldown = cooldown
+        return breaker
+
+
+def circuit_state(base_url: str) -> dict:
+    """Zustand des Breakers einer URL (closed, falls noch nie angesprochen)."""
+    with _registry_lock:
+        breaker = _breakers.get(base_url.rstrip("/"))
+    if breaker is None:
+        return {"state": CircuitBreaker.CLOSED, "failures": 0, "retry_in": 0.0}
+    return breaker.snapshot()
+
+
+def set_circuit_listener(listener: Optional[Callable[[str, str], None]]):
+    """Registriert listener(base_url, state) fuer Zustandswechsel (None = keiner)."""
+    global _circuit_listener
+    _circuit_listener = listener
+
+
+def _notify(breaker: CircuitBreaker):
+    if _circuit_listener is None:
+        return
+    try:
+        _circuit_listener(breaker.name, breaker.state)
+    except Exception as e:  # Status-Anzeige darf keinen Request scheitern lassen
+        logger.warning("Circuit-Status nicht gespeichert: %s", e)
+
+
+def _warn_failed(future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Circuit-Status nicht gespeichert: %s", future.exception())
+
+
+def circuit_status_listener(get_db: Callable,
+                            submit: Optional[Callable] = None) -> Callable[[str, str], None]:
+    """Listener, der Zustandswechsel in servers.status schreibt.
+
+    open -> 'circuit_open', closed -> 'online'; half_open aendert nichts.
+    Betrifft alle Server mit der URL des Breakers. Im Event-Loop (async
+    Clients) wird nicht geschrieben, sondern an submit(func, *args) (z.B.
+    AsyncDatabase.submit) bzw. den Default-Executor des Loops abgegeben;
+    geschrieben wird dann der aktuelle Zustand, damit spaete Writes keinen
+    neueren Wechsel ueberschreiben.
+    """
+    def write(base_url: str, state: Optional[str] = None):
+        state = state or circuit_state(base_url)["state"]
+        status = {CircuitBreaker.OPEN: "circuit_open", CircuitBreaker.CLOSED: "online"}.get(state)
+        if status is None:
+            return
+        db = get_db()
+        for srv in db.list_servers():
+            if srv["url"].rstrip("/") == base_url:
+                db.update_server(srv["id"], status=status)
+
+    def listener(base_url: str, state: str):
+        if state == CircuitBreaker.HALF_OPEN:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # Thread eines synchronen Clients: direkt schreiben
+            write(base_url, state)
+            return
+        if submit is not None:
+            future = submit(write, base_url)
+        else:
+            future = loop.run_in_executor(None, write, base_url)
+        future.add_done_callback(_warn_failed)
+    return listener
+
+
+# ── Rate-Limit ───────────────────────────────────────────────────────────
+
+
+class RateLimiter:
+    """Token-Bucket und In-Flight-Grenze pro n8n-Server, fuer sync und async Clients.
+
+    rate: Requests pro Sekunde (0 = unbegrenzt), Burst bis zu einer Sekunde.
+    Jeder Request reserviert ein Token; fehlt es, wartet er, bis es
+    nachgefuellt ist (die Reservierungen reihen sich ein, kein Polling).
+    max_in_flight: gleichzeitig laufende Requests (0 = unbegrenzt); weitere
+    warten in einer FIFO-Schlange, egal ob Thread oder Coroutine.
+    """
+
+    def __init__(self, name: str, rate: float = 0.0, max_in_flight: int = 0):
+        self.name = name
+        self._lock = threading.Lock()
+        self._waiters: deque = deque()  # threading.Event oder (loop, Future)
+        self._in_flight = 0
+        self._throttled = 0
+        self._totals = {"requests": 0, "throttled": 0, "queued": 0, "wait_seconds": 0.0}
+        self.configure(rate, max_in_flight)
+
+    def configure(self, rate: float, max_in_flight: int):
+        """Aendert die Grenzen zur Laufzeit (z.B. nach Aenderung der Server-Zeile)."""
+        with self._lock:
+            self.rate = max(0.0, float(rate or 0))
+            self.max_in_flight = max(0, int(max_in_flight or 0))
+            self._capacity = max(1.0, self.rate)
+            self._tokens = self._capacity
+            self._stamp = time.monotonic()
+            self._wake()
+
+    def _reserve(self) -> float:
+        """Reserviert ein Token; Sekunden, die bis zu seiner Verfuegbarkeit zu warten sind."""
+        with self._lock:
+            self._totals["requests"] += 1
+            if not self.rate:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            delay = -self._tokens / self.rate
+            self._totals["throttled"] += 1
+            self._totals["wait_seconds"] += delay
+            self._throttled += 1
+            return delay
+
+    def _enter(self, waiter) -> bool:
+        """Belegt einen Slot oder reiht waiter ein (False). Aufruf unter _lock."""
+        if not self._waiters and (not self.max_in_flight or self._in_flight < self.max_in_flight):
+            self._in_flight += 1
+            return True
+        self._waiters.append(waiter)
+        self._totals["queued"] += 1
+        return False
+
+    def _wake(self):
+        """Gibt freie Slots an Wartende weiter (FIFO). Aufruf unter _lock."""
+        while self._waiters and (not self.max_in_flight or self._in_flight < self.max_in_flight):
+            self._in_flight += 1
+            waiter = self._waiters.popleft()
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(_resolve, future)
+
+    def acquire(self):
+        """Blockierend: wartet auf Token und Slot (N8nClient)."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+            self._untrottle()
+        event = threading.Event()
+        with self._lock:
+            if self._enter(event):
+                return
+        event.wait()
+
+    async def acquire_async(self):
+        """Wie acquire, ohne den Event-Loop zu blockieren (AsyncN8nClient)."""
+        delay = self._reserve()
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._untrottle()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._enter((loop, future)):
+                return
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+                    handed = False
+                except ValueError:
+                    handed = True  # Slot war schon uebergeben
+            if handed:
+                self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._wake()
+
+    def _untrottle(self):
+        with self._lock:
+            self._throttled -= 1
+
+    def snapshot(self) -> dict:
+        """Live-Zustand: in_flight, queued (wartet auf Slot), throttled (wartet auf Token)."""
+        with self._lock:
+            return {"rate": self.rate, "max_in_flight": self.max_in_flight,
+                    "in_flight": self._in_flight, "queued": len(self._waiters),
+                    "throttled": self._throttled,
+                    "totals": {**self._totals,
+                               "wait_seconds": round(self._totals["wait_seconds"], 3)}}
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
 
-class N8nClient:
-    """Synchroner httpx-Client fuer n8n REST API v1."""
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 15.0):
+_limiters: dict[str, RateLimiter] = {}
+
+
+def get_limiter(base_url: str, rate: Optional[float] = None,
+                max_in_flight: Optional[int] = None) -> RateLimiter:
+    """RateLimiter einer n8n-Instanz; angegebene Grenzen werden uebernommen."""
+    name = base_url.rstrip("/")
+    with _registry_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = _limiters[name] = RateLimiter(name)
+    rate = limiter.rate if rate is None else max(0.0, float(rate or 0))
+    max_in_flight = limiter.max_in_flight if max_in_flight is None else max(0, int(max_in_flight or 0))
+    if (rate, max_in_flight) != (limiter.rate, limiter.max_in_flight):
+        limiter.configure(rate, max_in_flight)
+    return limiter
+
+
+def limiter_state(base_url: str) -> dict:
+    """Live-Zustand des Limiters einer URL (unbegrenzt, falls noch nie angesprochen)."""
+    with _registry_lock:
+        limiter = _limiters.get(base_url.rstrip("/"))
+    return (limiter or RateLimiter(base_url)).snapshot()
+
+
+class _N8nApi:
+    """Gemeinsame Basis von N8nClient und AsyncN8nClient.
+
+    Die Endpunkt-Methoden geben das Ergebnis von _request zurueck -- beim
+    AsyncN8nClient ist das eine Coroutine, die awaited werden muss.
+    """
+
+    def __init__(self, base_url: str, api_key: str, timeout: float = DEFAULT_TIMEOUT,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+                 keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY, http2: bool = False,
+                 retries: int = DEFAULT_RETRIES, retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+                 retry_max_backoff: float = DEFAULT_RETRY_MAX_BACKOFF,
+                 breaker: Optional[CircuitBreaker] = None,
+                 limiter: Optional[RateLimiter] = None):
+        if http2 and h2 is None:
+            raise ValueError("HTTP/2 benoetigt das Paket h2 (pip install httpx[http2])")
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.retries = max(0, int(retries))
+        self.retry_backoff = retry_backoff
+        self.retry_max_backoff = retry_max_backoff
+        self.breaker = breaker or get_breaker(self.base_url)
+        self.limiter = limiter or get_limiter(self.base_url)
         self._headers = {
             "X-N8N-API-KEY": api_key,
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        self._client_options = {
+            "timeout": timeout, "verify": False, "headers": self._headers, "http2": http2,
+            "limits": httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive,
+                                   keepalive_expiry=keepalive_expiry),
+        }
+
+    @classmethod
+    def from_config(cls, base_url: str, api_key: str, config: Optional[dict] = None):
+        """Client mit Timeout und Pool-Limits aus config.json (Abschnitt n8n)."""
+        if config is None:
+            from n8nManager.core.config import load_config
+            config = load_config()
+        n8n_cfg = config.get("n8n", {})
+        return cls(base_url, api_key,
+                   timeout=n8n_cfg.get("timeout", DEFAULT_TIMEOUT),
+                   max_connections=n8n_cfg.get("max_connections", DEFAULT_MAX_CONNECTIONS),
+                   max_keepalive=n8n_cfg.get("max_keepalive", DEFAULT_MAX_KEEPALIVE),
+                   keepalive_expiry=n8n_cfg.get("keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY),
+                   http2=n8n_cfg.get("http2", False),
+                   retries=n8n_cfg.get("retries", DEFAULT_RETRIES),
+                   retry_backoff=n8n_cfg.get("retry_backoff", DEFAULT_RETRY_BACKOFF),
+                   retry_max_backoff=n8n_cfg.get("retry_max_backoff", DEFAULT_RETRY_MAX_BACKOFF),
+                   breaker=get_breaker(base_url,
+                                       n8n_cfg.get("breaker_threshold", DEFAULT_BREAKER_THRESHOLD),
+                                       n8n_cfg.get("breaker_cooldown", DEFAULT_BREAKER_COOLDOWN)))
 
     def _url(self, path: str) -> str:
         return f"{self.base_url}/api/v1{path}"
 
-    def _request(self, method: str, path: str, **kwargs) -> dict:
-        """Fuehrt HTTP-Request aus. Gibt dict zurueck oder raises."""
-        try:
-            with httpx.Client(timeout=self.timeout, verify=False) as client:
-                resp = client.request(method, self._url(path), headers=self._headers, **kwargs)
-                resp.raise_for_status()
-                return resp.json() if resp.content else {}
-        except httpx.HTTPStatusError as e:
+    @staticmethod
+    def _error(e: httpx.HTTPError) -> dict:
+        if isinstance(e, httpx.HTTPStatusError):
             return {"error": True, "status_code": e.response.status_code, "detail": str(e)}
-        except httpx.RequestError as e:
-            return {"error": True, "detail": str(e)}
+        return {"error": True, "detail": str(e)}
 
-    def ping(self) -> dict:
-        """Health-Check: GET /api/v1/workflows?limit=1"""
-        result = self._request("GET", "/workflows?limit=1")
+    def _circuit_open(self) -> dict:
+        retry_in = self.breaker.snapshot()["retry_in"]
+        return {"error": True, "circuit": CircuitBreaker.OPEN,
+                "detail": f"Circuit offen fuer {self.base_url} (naechster Versuch in {retry_in:.0f} s)"}
+
+    def _retry_delay(self, method: str, error: httpx.HTTPError, attempt: int) -> Optional[float]:
+        """Meldet den Fehlschlag an den Breaker; Wartezeit bis zum naechsten Versuch oder None.
+
+        Exponentielles Backoff mit Full Jitter; ein Retry-After des Servers
+        geht vor, wird aber nicht laenger als retry_max_backoff abgewartet.
+        """
+        retry_after = None
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status >= 500:
+                self.breaker.failure()
+            else:
+                self.breaker.success()  # Server antwortet (4xx)
+            if status != 429 and not (status in RETRY_STATUSES and method in IDEMPOTENT_METHODS):
+                return None
+            retry_after = _retry_after(error.response)
+        else:
+            self.breaker.failure()
+            if not isinstance(error, _NOT_SENT) and (
+                    method not in IDEMPOTENT_METHODS or not isinstance(error, httpx.TransportError)):
+                return None
+        if attempt >= self.retries or self.breaker.state == CircuitBreaker.OPEN:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.retry_max_backoff else None
+        return random.uniform(0, min(self.retry_max_backoff, self.retry_backoff * 2 ** attempt))
+
+    @staticmethod
+    def _ping_result(result: dict) -> dict:
         if "error" in result:
             return {"ok": False, **result}
         return {"ok": True, "message": "n8n erreichbar"}
 
     def list_workflows(self, limit: int = 100, cursor: str = "") -> dict:
-        path = f"/workflows?limit={limit}"
+        """Eine Seite Workflows ({data, nextCursor}); der Cursor wird URL-kodiert."""
+        params = {"limit": limit}
         if cursor:
-            path += f"&cursor={cursor}"
-        return self._request("GET", path)
+            params["cursor"] = cursor
+        return self._request("GET", "/workflows", params=params)
 
     def get_workflow(self, workflow_id: str) -> dict:
         return self._request("GET", f"/workflows/{workflow_id}")
@@ -69,3 +536,214 @@ class N8nClient:
 
     def deactivate_workflow(self, workflow_id: str) -> dict:
         return self._request("PATCH", f"/workflows/{workflow_id}", json={"active": False})
+
+
+class N8nClient(_N8nApi):
+    """Synchroner httpx-Client fuer n8n REST API v1.
+
+    Haelt einen langlebigen, gepoolten httpx.Client (Keep-Alive, optional
+    HTTP/2): nur der erste Request zahlt TCP- und TLS-Handshake. Thread-sicher;
+    close() bzw. der Context-Manager gibt die Verbindungen frei.
+    """
+
+    def __init__(self, base_url: str, api_key: str, **options):
+        super().__init__(base_url, api_key, **options)
+        self._client = httpx.Client(**self._client_options)
+
+    def close(self):
+        """Schliesst die gepoolten Verbindungen."""
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _request(self, method: str, path: str, **kwargs) -> dict:
+        """Fuehrt HTTP-Request aus. Gibt dict zurueck, Fehler als {error: True, ...}.
+
+        Wiederholt voruebergehende Fehler (siehe _retry_delay); bei offenem
+        Circuit sofort {error: True, circuit: "open"}. Jeder Versuch wartet
+        vorher auf den RateLimiter des Servers.
+        """
+        attempt = 0
+        while True:
+            role = self.breaker.enter()
+            if role is None:
+                return self._circuit_open()
+            try:
+                self.limiter.acquire()
+                try:
+                    resp = self._client.request(method, self._url(path), **kwargs)
+                    resp.raise_for_status()
+                except httpx.HTTPError as e:
+                    error = e
+                else:
+                    error = None
+                finally:
+                    self.limiter.release()
+            except BaseException:  # ohne Ergebnis: eine Probe darf nicht haengen bleiben
+                self.breaker.release(role)
+                raise
+            if error is None:
+                self.breaker.success()
+                return resp.json() if resp.content else {}
+            delay = self._retry_delay(method, error, attempt)
+            if delay is None:
+                return self._error(error)
+            attempt += 1
+            time.sleep(delay)
+
+    def ping(self) -> dict:
+        """Health-Check: GET /api/v1/workflows?limit=1"""
+        return self._ping_result(self._request("GET", "/workflows?limit=1"))
+
+    def iter_workflows(self, page_size: int = MAX_PAGE_SIZE):
+        """Alle Workflows einzeln, folgt nextCursor ueber alle Seiten.
+
+        Es liegt immer nur eine Seite im Speicher. Raises N8nApiError, wenn
+        eine Seite fehlschlaegt.
+        """
+        cursor = ""
+        while True:
+            page = self.list_workflows(limit=page_size, cursor=cursor)
+            if page.get("error"):
+                raise N8nApiError(page)
+            yield from page.get("data", [])
+            cursor = page.get("nextCursor") or ""
+            if not cursor:
+                return
+
+
+class AsyncN8nClient(_N8nApi):
+    """Asynchroner Client (httpx.AsyncClient) fuer die FastAPI-Routen.
+
+    Gleiche Methoden wie N8nClient, aber als Coroutinen: ein langsamer
+    n8n-Server blockiert den Event-Loop nicht.
+    """
+
+    def __init__(self, base_url: str, api_key: str, **options):
+        super().__init__(base_url, api_key, **options)
+        self._client = httpx.AsyncClient(**self._client_options)
+
+    async def aclose(self):
+        """Schliesst die gepoolten Verbindungen."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        """Wie N8nClient._request; gewartet wird mit asyncio.sleep."""
+        attempt = 0
+        while True:
+            role = self.breaker.enter()
+            if role is None:
+                return self._circuit_open()
+            try:
+                await self.limiter.acquire_async()
+                try:
+                    resp = await self._client.request(method, self._url(path), **kwargs)
+                    resp.raise_for_status()
+                except httpx.HTTPError as e:
+                    error = e
+                else:
+                    error = None
+                finally:
+                    self.limiter.release()
+            except BaseException:  # z.B. CancelledError: Probe freigeben
+                self.breaker.release(role)
+                raise
+            if error is None:
+                self.breaker.success()
+                return resp.json() if resp.content else {}
+            delay = self._retry_delay(method, error, attempt)
+            if delay is None:
+                return self._error(error)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def ping(self) -> dict:
+        """Health-Check: GET /api/v1/workflows?limit=1"""
+        return self._ping_result(await self._request("GET", "/workflows?limit=1"))
+
+    async def iter_workflows(self, page_size: int = MAX_PAGE_SIZE):
+        """Wie N8nClient.iter_workflows, als async Generator (async for)."""
+        cursor = ""
+        while True:
+            page = await self.list_workflows(limit=page_size, cursor=cursor)
+            if page.get("error"):
+                raise N8nApiError(page)
+            for wf in page.get("data", []):
+                yield wf
+            cursor = page.get("nextCursor") or ""
+            if not cursor:
+                return
+
+
+# ── Registry ─────────────────────────────────────────────────────────────
+# Ein Client pro Server-ID, geteilt von API-Routen und CLI-Befehlen.
+
+_clients: dict[int, N8nClient] = {}
+_async_clients: dict[int, AsyncN8nClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _cached(cache: dict, cls, server: dict, config: Optional[dict]):
+    """Client aus cache oder neu; None als zweiter Wert, sonst der ersetzte Client.
+
+    Die Grenzen des RateLimiters kommen aus der Server-Zeile (rate_limit,
+    max_in_flight) und werden bei jedem Aufruf abgeglichen.
+    """
+    get_limiter(server["url"], server.get("rate_limit") or 0, server.get("max_in_flight") or 0)
+    client = cache.get(server["id"])
+    if client is not None and (client.base_url, client.api_key) == (
+            server["url"].rstrip("/"), server.get("api_key", "")):
+        return client, None
+    cache[server["id"]] = cls.from_config(server["url"], server.get("api_key", ""), config)
+    return cache[server["id"]], client
+
+
+def get_client(server: dict, config: Optional[dict] = None) -> N8nClient:
+    """Gecachter Client fuer einen Server-Datensatz (id, url, api_key).
+
+    Aendern sich URL oder API-Key des Servers, wird der alte Client
+    geschlossen und ein neuer angelegt.
+    """
+    with _clients_lock:
+        client, replaced = _cached(_clients, N8nClient, server, config)
+    if replaced is not None:
+        replaced.close()
+    return client
+
+
+async def get_async_client(server: dict, config: Optional[dict] = None) -> AsyncN8nClient:
+    """Wie get_client, fuer die async Routen (an den laufenden Event-Loop gebunden)."""
+    with _clients_lock:
+        client, replaced = _cached(_async_clients, AsyncN8nClient, server, config)
+    if replaced is not None:
+        await replaced.aclose()
+    return client
+
+
+def close_clients():
+    """Schliesst alle synchronen Clients der Registry (z.B. am Ende eines CLI-Befehls)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_clients():
+    """Schliesst alle Clients der Registry (FastAPI-lifespan)."""
+    close_clients()
+    with _clients_lock:
+        clients = list(_async_clients.values())
+        _async_clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,107 @@
+"""Reindex: abgeleitete Workflow-Metadaten und Indizes neu berechnen.
+
+content_hash, node_count, trigger_type, tags sowie workflows_fts und
+workflow_nodes entstehen nur beim Schreiben. Aendern sich die Regeln in
+workflow_parser, bringt reindex() den Bestand wieder auf Stand.
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+from n8nManager.core.compression import decompress
+from n8nManager.core.workflow_parser import WorkflowAnalysis
+
+CHECKPOINT_KEY = "reindex_last_id"
+
+
+def _reindex_row(item: tuple) -> tuple:
+    """Worker: Blob entpacken und analysieren. Laeuft im Prozesspool.
+
+    Gibt (id, analysis, error) zurueck. Das JSON geht nur zurueck, wenn sich
+    der Hash geaendert hat (dann muss der Blob umziehen).
+    """
+    row_id, data, codec, old_hash = item
+    try:
+        analysis = WorkflowAnalysis(decompress(data, codec or ""))
+    except (ValueError, UnicodeDecodeError) as e:
+        return row_id, None, str(e)
+    except Exception as e:  # eine kaputte Zeile darf den Lauf (und den Checkpoint) nicht stoppen
+        return row_id, None, f"{type(e).__name__}: {e}"
+    analysis.data = None
+    if analysis.content_hash == old_hash:
+        analysis.json = None
+    return row_id, analysis, ""
+
+
+def _changed(row: dict, analysis: WorkflowAnalysis) -> bool:
+    return (row["content_hash"] != analysis.content_hash
+            or row["node_count"] != analysis.node_count
+            or (row["trigger_type"] or "") != analysis.trigger_type
+            or row["tags"] != json.dumps(analysis.tags, ensure_ascii=False))
+
+
+def reindex(db, jobs: Optional[int] = None, batch_size: int = 500, dry_run: bool = False,
+            restart: bool = False, progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """Berechnet Metadaten und Indizes aller Workflows neu.
+
+    Liest in Batches (kurze Lesezugriffe), analysiert im Prozesspool und
+    schreibt pro Batch eine kurze Transaktion inkl. Checkpoint. Ein
+    abgebrochener Lauf setzt beim naechsten Aufruf hinter dem Checkpoint
+    fort (restart=True beginnt von vorn). dry_run schreibt nichts und zaehlt
+    nur, wie viele Zeilen sich aendern wuerden.
+    """
+    stats = {"rows": 0, "changed": 0, "errors": [], "resumed_from": 0,
+             "dry_run": dry_run, "elapsed": 0.0}
+    start = time.perf_counter()
+    after_id = 0
+    if not dry_run:
+        if restart:
+            db.set_meta(CHECKPOINT_KEY, None)
+        after_id = int(db.get_meta(CHECKPOINT_KEY) or 0)
+        stats["resumed_from"] = after_id
+
+    jobs = jobs or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        for batch in db.iter_workflow_payloads(after_id=after_id, batch_size=batch_size):
+            work = [(r["id"], r["data"], r["codec"], r["content_hash"])
+                    for r in batch if r["data"] is not None]
+            if executor:
+                chunksize = max(1, len(work) // (jobs * 4))
+                results = executor.map(_reindex_row, work, chunksize=chunksize)
+            else:
+                results = map(_reindex_row, work)
+            analyses = {}
+            for row_id, analysis, err in results:
+                if analysis is None:
+                    stats["errors"].append(f"Workflow {row_id}: {err}")
+                else:
+                    analyses[row_id] = analysis
+
+            items = []
+            for row in batch:
+                analysis = analyses.get(row["id"])
+                if analysis is None:
+                    if row["data"] is None:
+                        stats["errors"].append(f"Workflow {row['id']}: Blob fehlt")
+                    continue
+                changed = _changed(row, analysis)
+                stats["changed"] += changed
+                items.append((row["id"], row["name"], row["description"], analysis, changed))
+            stats["rows"] += len(batch)
+            if not dry_run:
+                db.apply_reindex(items, checkpoint_key=CHECKPOINT_KEY,
+                                 checkpoint=batch[-1]["id"])
+            stats["elapsed"] = time.perf_counter() - start
+            if progress:
+                progress(stats)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    if not dry_run:
+        db.set_meta(CHECKPOINT_KEY, None)
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
@@ -0,0 +1,635 @@
+"""Storage-Backends: Protokoll der Datenbank-API und ihre Implementierungen.
+
+- sqlite:  Database -- eine SQLite-Datei (Standard)
+- memory:  MemoryDatabase -- SQLite im Arbeitsspeicher (Tests, Benchmarks)
+- sharded: ShardedDatabase -- Workflow-Daten pro server_id in eigener SQLite-Datei
+
+Gewaehlt wird per config.json (database.backend), siehe open_database().
+"""
+import sqlite3
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional, Protocol, Union, runtime_checkable
+
+from n8nManager.core.database import (
+    DEFAULT_PROFILE, ConnectionPool, Database, profile_pragmas,
+)
+from n8nManager.core.workflow_parser import WorkflowAnalysis
+
+
+@runtime_checkable
+class StorageBackend(Protocol):
+    """Die Datenbank-API, die CLI, API-Routen und Sync-Code nutzen."""
+
+    sync_retention_days: int
+
+    def close(self): ...
+
+    # Workflows
+    def add_workflow(self, name: str, workflow_json: Union[str, WorkflowAnalysis],
+                     description: str = "", server_id: Optional[int] = None,
+                     n8n_id: str = "", source: str = "local") -> int: ...
+    def get_workflow(self, workflow_id: int) -> Optional[dict]: ...
+    def list_workflows(self, server_id: Optional[int] = None, source: Optional[str] = None,
+                       summary: bool = False) -> list[dict]: ...
+    def list_workflows_page(self, limit: int = 50, cursor: Optional[str] = None,
+                            server_id: Optional[int] = None, source: Optional[str] = None,
+                            summary: bool = True) -> tuple[list[dict], Optional[str]]: ...
+    def update_workflow(self, workflow_id: int, **kwargs): ...
+    def delete_workflow(self, workflow_id: int): ...
+    def workflow_exists_by_hash(self, content_hash: str) -> bool: ...
+    def existing_hashes(self, hashes) -> set[str]: ...
+    def server_workflow_hashes(self, server_id: int, n8n_ids) -> dict[str, str]: ...
+    def add_workflows_bulk(self, workflows: list[dict], chunk_size: int = 500) -> int: ...
+    def upsert_workflow(self, name: str, workflow_json: Union[str, WorkflowAnalysis],
+                        server_id: int, n8n_id: str, description: str = "",
+                        source: str = "pull") -> int: ...
+    def upsert_workflows_bulk(self, server_id: int, workflows: list[dict]) -> list[int]: ...
+
+    # Suche, Nodes
+    def search_workflows(self, query: str, limit: int = 20,
+                         offset: int = 0) -> tuple[list[dict], Optional[int]]: ...
+    def list_node_catalog(self) -> list[dict]: ...
+    def find_workflows_by_node(self, node_type: Optional[str] = None,
+                               host: Optional[str] = None,
+                               limit: Optional[int] = None) -> list[dict]: ...
+    def node_usage(self) -> list[dict]: ...
+
+    # Wartung
+    def get_meta(self, key: str) -> Optional[str]: ...
+    def set_meta(self, key: str, value: Optional[str]): ...
+    def get_stats(self) -> dict: ...
+    def check_stats(self, repair: bool = False) -> list[dict]: ...
+    def iter_workflow_payloads(self, after_id: int = 0, batch_size: int = 500): ...
+    def apply_reindex(self, items: list[tuple], checkpoint_key: Optional[str] = None,
+                      checkpoint: Optional[int] = None): ...
+    def recompress(self, compression: Optional[str] = None, batch_size: int = 500) -> dict: ...
+    def vacuum(self): ...
+
+    # Server
+    def add_server(self, name: str, url: str, api_key: str = "",
+                   is_default: bool = False, rate_limit: float = 0,
+                   max_in_flight: int = 0) -> int: ...
+    def get_server(self, server_id: int) -> Optional[dict]: ...
+    def get_server_by_name(self, name: str) -> Optional[dict]: ...
+    def list_servers(self) -> list[dict]: ...
+    def update_server(self, server_id: int, **kwargs): ...
+    def get_default_server(self) -> Optional[dict]: ...
+    def set_default_server(self, server_id: int): ...
+
+    # Sync-History
+    def add_sync_entry(self, workflow_id: Optional[int], server_id: Optional[int],
+                       direction: str, status: str = "success", details: str = "",
+                       imported: int = 0, skipped: int = 0, errors: int = 0) -> int: ...
+    def remote_workflows(self, server_id: int, workflow_ids) -> dict[int, dict]: ...
+    def record_pushes(self, entries: list[dict]) -> int: ...
+    def get_sync_history(self, workflow_id: Optional[int] = None,
+                         server_id: Optional[int] = None, limit: int = 50,
+                         direction: Optional[str] = None) -> list[dict]: ...
+    def get_sync_history_page(self, workflow_id: Optional[int] = None,
+                              server_id: Optional[int] = None,
+                              direction: Optional[str] = None, limit: int = 50,
+                              cursor: Optional[str] = None) -> tuple[list[dict], Optional[str]]: ...
+    def rollup_sync_history(self, retention_days: Optional[int] = None) -> dict: ...
+    def get_sync_stats(self, server_id: Optional[int] = None, direction: Optional[str] = None,
+                       days: int = 30) -> list[dict]: ...
+
+    # Templates, Versionen
+    def add_template(self, name: str, template_json: str, description: str = "",
+                     category: str = "general", placeholders: Optional[list] = None) -> int: ...
+    def get_template(self, template_id: int) -> Optional[dict]: ...
+    def list_templates(self, category: Optional[str] = None) -> list[dict]: ...
+    def add_version(self, workflow_id: int, workflow_json: Union[str, WorkflowAnalysis],
+                    change_note: str = "") -> int: ...
+    def get_versions(self, workflow_id: int) -> list[dict]: ...
+    def get_version(self, workflow_id: int, version_number: int) -> Optional[dict]: ...
+
+
+# ── Memory ────────────────────────────────────────────────────────────────
+
+class MemoryDatabase(Database):
+    """Database im Arbeitsspeicher (memdb-VFS), z.B. fuer Tests und Benchmarks.
+
+    Alle Threads teilen dieselbe Datenbank; sie lebt, solange das Objekt
+    existiert (auch ueber close() hinaus, wie eine Datei).
+    """
+
+    def __init__(self, name: Optional[str] = None, **options):
+        self.name = name or f"n8n-{uuid.uuid4().hex}"
+        pool = ConnectionPool(f"file:/{self.name}?vfs=memdb", uri=True,
+                              pragmas=profile_pragmas(options.get("profile", DEFAULT_PROFILE)))
+        # Haelt die Datenbank offen, auch wenn der Pool alle Verbindungen schliesst
+        self._anchor = sqlite3.connect(pool.db_path, uri=True, check_same_thread=False)
+        super().__init__(":memory:", pool=pool, **options)
+
+
+# ── Sharded ───────────────────────────────────────────────────────────────
+
+# Globale ID = (Shard << SHARD_BITS) | lokale ID; Shard 0 ist die Hauptdatei,
+# deren IDs sich dadurch nicht aendern. Mit 32 Bit bleiben IDs bis server_id
+# 2**21 im sicheren Integer-Bereich von JavaScript (Web-UI).
+SHARD_BITS = 32
+_LOCAL_MASK = (1 << SHARD_BITS) - 1
+_MAX_LOCAL_ID = (1 << 62) - 1
+
+
+def _gid(shard: int, local_id: Optional[int]) -> Optional[int]:
+    if local_id is None:
+        return None
+    return (shard << SHARD_BITS) | local_id
+
+
+def _split(gid: int) -> tuple[int, int]:
+    return gid >> SHARD_BITS, gid & _LOCAL_MASK
+
+
+class ShardedDatabase:
+    """Workflow-Daten pro server_id in eigener SQLite-Datei.
+
+    Die Hauptdatei haelt Server, Templates, node_catalog, meta und alle
+    Workflows ohne server_id. Workflows eines Servers samt Versionen, Nodes,
+    FTS und Sync-Historie liegen in <db>.shards/server_<id>.db -- Pulls und
+    Pushes verschiedener Server warten so nicht auf dieselbe Schreibsperre.
+
+    IDs sind global eindeutig (siehe SHARD_BITS). Listen, Suche und
+    Statistiken fragen alle Shards ab und fuehren die Ergebnisse zusammen.
+    Sync-Eintraege liegen beim Workflow (Fremdschluessel); Shards enthalten
+    dafuer Stub-Zeilen der referenzierten Server (ohne URL und API-Key).
+    Lokale Workflows, die ein Push an einen Server bindet, bleiben in der
+    Hauptdatei; Pulls suchen (server_id, n8n_id) dort und im Shard.
+    """
+
+    # Methoden, die nur die Hauptdatei betreffen
+    _MAIN_METHODS = frozenset((
+        "list_node_catalog", "get_meta", "set_meta",
+        "add_server", "get_server", "get_server_by_name", "list_servers",
+        "update_server", "get_default_server", "set_default_server",
+        "add_template", "get_template", "list_templates",
+    ))
+
+    def __init__(self, db_path, **options):
+        self.main = Database(db_path, **options)
+        self.db_path = self.main.db_path
+        self.shard_dir = self.db_path.with_suffix(".shards")
+        self.sync_retention_days = self.main.sync_retention_days
+        self._options = options
+        self._lock = threading.Lock()
+        self._stubs: set[tuple[int, int]] = set()
+        self._shards: dict[int, Database] = {}
+        self._scan()
+
+    def __getattr__(self, name: str):
+        if name in self._MAIN_METHODS:
+            return getattr(self.main, name)
+        raise AttributeError(name)
+
+    def close(self):
+        self.main.close()
+        for db in self._shards.values():
+            db.close()
+
+    # ── Shards ───────────────────────────────────────────────────────────────
+
+    def _scan(self):
+        """Oeffnet noch nicht geoeffnete Shard-Dateien.
+
+        Auch solche, die ein anderer Prozess seit dem Start angelegt hat
+        (z.B. ein CLI-pull neben der laufenden API).
+        """
+        for path in sorted(self.shard_dir.glob("server_*.db")):
+            key = int(path.stem.split("_", 1)[1])
+            if key not in self._shards:
+                self._shard(key)
+
+    def _has_shard(self, key: int) -> bool:
+        """Existiert der Shard (geoeffnet oder als Datei)? Legt keinen neuen an."""
+        if key in self._shards:
+            return True
+        if not (self.shard_dir / f"server_{key}.db").exists():
+            return False
+        self._shard(key)
+        return True
+
+    def _shard(self, key: int) -> Database:
+        """Database eines Shards (0 = Hauptdatei), wird bei Bedarf angelegt."""
+        if key == 0:
+            return self.main
+        db = self._shards.get(key)
+        if db is None:
+            with self._lock:
+                db = self._shards.get(key)
+                if db is None:
+                    db = Database(self.shard_dir / f"server_{key}.db", **self._options)
+                    self._shards[key] = db
+        return db
+
+    def _all(self) -> list[tuple[int, Database]]:
+        """Alle Shards in ID-Reihenfolge, Hauptdatei zuerst."""
+        self._scan()
+        with self._lock:
+            shards = sorted(self._shards.items())
+        return [(0, self.main)] + shards
+
+    def _for_server(self, server_id: Optional[int]) -> list[tuple[int, Database]]:
+        """Shards, die Workflows eines Servers enthalten koennen (inkl. Altbestand)."""
+        if server_id is None:
+            return self._all()
+        shards = [(0, self.main)]
+        if self._has_shard(server_id):
+            shards.append((server_id, self._shards[server_id]))
+        return shards
+
+    def _ensure_server(self, key: int, server_id: Optional[int]):
+        """Stub-Zeile in servers des Shards, damit Fremdschluessel greifen."""
+        if key == 0 or server_id is None or (key, server_id) in self._stubs:
+            return
+        with self._shard(key)._connect() as conn:
+            conn.execute("INSERT OR IGNORE INTO servers (id, name, url) VALUES (?, ?, '')",
+                         (server_id, f"server_{server_id}"))
+            conn.commit()
+        self._stubs.add((key, server_id))
+
+    @staticmethod
+    def _globalize(key: int, rows: list[dict], *fields: str) -> list[dict]:
+        for r in rows:
+            for field in fields:
+                if field in r:
+                    r[field] = _gid(key, r[field])
+        return rows
+
+    @staticmethod
+    def _local_cursor(key: int, cursor: Optional[str]) -> Optional[str]:
+        """Globaler Keyset-Cursor (zeit, gid) -> Cursor fuer einen Shard.
+
+        Innerhalb eines Shards steigen globale IDs mit den lokalen, die
+        Grenze bei gleichem Zeitstempel haengt also nur vom Shard ab.
+        """
+        if not cursor:
+            return None
+        stamp, gid = Database._decode_cursor(cursor)
+        cursor_key, local_id = _split(gid)
+        if key < cursor_key:
+            local_id = _MAX_LOCAL_ID
+        elif key > cursor_key:
+            local_id = 0
+        return Database._encode_cursor(stamp, local_id)
+
+    @staticmethod
+    def _merge_page(pages: list[tuple[list[dict], Optional[str]]], limit: int,
+                    order: str) -> tuple[list[dict], Optional[str]]:
+        """Seiten der Shards (je bis limit, absteigend) zu einer globalen Seite."""
+        rows = sorted((r for page, _ in pages for r in page),
+                      key=lambda r: (r[order], r["id"]), reverse=True)
+        more = len(rows) > limit or any(nxt for _, nxt in pages)
+        rows = rows[:limit]
+        next_cursor = None
+        if more and rows:
+            next_cursor = Database._encode_cursor(rows[-1][order], rows[-1]["id"])
+        return rows, next_cursor
+
+    # ── Workflows ────────────────────────────────────────────────────────────
+
+    def add_workflow(self, name: str, workflow_json: Union[str, WorkflowAnalysis],
+                     description: str = "", server_id: Optional[int] = None,
+                     n8n_id: str = "", source: str = "local") -> int:
+        key = server_id or 0
+        self._ensure_server(key, server_id)
+        local_id = self._shard(key).add_workflow(name, workflow_json, description=description,
+                                                 server_id=server_id, n8n_id=n8n_id,
+                                                 source=source)
+        return _gid(key, local_id)
+
+    def get_workflow(self, workflow_id: int) -> Optional[dict]:
+        key, local_id = _split(workflow_id)
+        if key and not self._has_shard(key):
+            return None
+        row = self._shard(key).get_workflow(local_id)
+        return self._globalize(key, [row], "id")[0] if row else None
+
+    def list_workflows(self, server_id: Optional[int] = None, source: Optional[str] = None,
+                       summary: bool = False) -> list[dict]:
+        rows = []
+        for key, db in self._for_server(server_id):
+            rows += self._globalize(key, db.list_workflows(server_id=server_id, source=source,
+                                                           summary=summary), "id")
+        rows.sort(key=lambda r: (r["updated_at"], r["id"]), reverse=True)
+        return rows
+
+    def list_workflows_page(self, limit: int = 50, cursor: Optional[str] = None,
+                            server_id: Optional[int] = None, source: Optional[str] = None,
+                            summary: bool = True) -> tuple[list[dict], Optional[str]]:
+        pages = []
+        for key, db in self._for_server(server_id):
+            rows, nxt = db.list_workflows_page(limit=limit,
+                                               cursor=self._local_cursor(key, cursor),
+                                               server_id=server_id, source=source,
+                                               summary=summary)
+            pages.append((self._globalize(key, rows, "id"), nxt))
+        return self._merge_page(pages, limit, "updated_at")
+
+    def update_workflow(self, workflow_id: int, **kwargs):
+        """Wie Database.update_workflow; server_id kann nicht den Shard wechseln.
+
+        Raises ValueError, wenn server_id in einen anderen Shard zeigen wuerde.
+        """
+        key, local_id = _split(workflow_id)
+        if "server_id" in kwargs and key and kwargs["server_id"] != key:
+            raise ValueError("server_id kann im Sharded-Backend nicht geaendert werden")
+        if key and not self._has_shard(key):
+            return
+        self._shard(key).update_workflow(local_id, **kwargs)
+
+    def delete_workflow(self, workflow_id: int):
+        key, local_id = _split(workflow_id)
+        if key and not self._has_shard(key):
+            return
+        self._shard(key).delete_workflow(local_id)
+
+    def workflow_exists_by_hash(self, content_hash: str) -> bool:
+        return any(db.workflow_exists_by_hash(content_hash) for _, db in self._all())
+
+    def existing_hashes(self, hashes) -> set[str]:
+        hashes = list(dict.fromkeys(hashes))
+        found = set()
+        for _, db in self._all():
+            found |= db.existing_hashes([h for h in hashes if h not in found])
+        return found
+
+    def server_workflow_hashes(self, server_id: int, n8n_ids) -> dict[str, str]:
+        """Shard des Servers plus Hauptdatei (lokale Workflows, die per Push gebunden wurden)."""
+        n8n_ids = list(dict.fromkeys(n8n_ids))
+        found = self.main.server_workflow_hashes(server_id, n8n_ids)
+        if server_id:
+            found.update(self._shard(server_id).server_workflow_hashes(
+                server_id, [i for i in n8n_ids if i not in found]))
+        return found
+
+    def _bound_in_main(self, server_id: int, n8n_ids) -> set[str]:
+        """n8n_ids, die in der Hauptdatei an server_id gebunden sind -- dort wird upserted."""
+        if not server_id:
+            return set()
+        return set(self.main.server_workflow_hashes(server_id, n8n_ids))
+
+    def add_workflows_bulk(self, workflows: list[dict], chunk_size: int = 500) -> int:
+        groups: dict[int, list[dict]] = {}
+        for item in workflows:
+            groups.setdefault(item.get("server_id") or 0, []).append(item)
+        count = 0
+        for key, items in groups.items():
+            self._ensure_server(key, key or None)
+            count += self._shard(key).add_workflows_bulk(items, chunk_size=chunk_size)
+        return count
+
+    def upsert_workflow(self, name: str, workflow_json: Union[str, WorkflowAnalysis],
+                        server_id: int, n8n_id: str, description: str = "",
+                        source: str = "pull") -> int:
+        key = 0 if n8n_id in self._bound_in_main(server_id, [n8n_id]) else server_id or 0
+        self._ensure_server(key, server_id)
+        local_id = self._shard(key).upsert_workflow(name, workflow_json, server_id=server_id,
+                                                    n8n_id=n8n_id, description=description,
+                                                    source=source)
+        return _gid(key, local_id)
+
+    def upsert_workflows_bulk(self, server_id: int, workflows: list[dict]) -> list[int]:
+        """Im Shard des Servers; in der Hauptdatei gebundene n8n_ids werden dort aktualisiert."""
+        in_main = self._bound_in_main(server_id, [w["n8n_id"] for w in workflows
+                                                  if w.get("n8n_id")])
+        groups: dict[int, list[int]] = {}
+        for i, item in enumerate(workflows):
+            key = 0 if item.get("n8n_id") in in_main else server_id or 0
+            groups.setdefault(key, []).append(i)
+        ids: list[int] = [0] * len(workflows)
+        for key, positions in groups.items():
+            self._ensure_server(key, server_id)
+            local_ids = self._shard(key).upsert_workflows_bulk(
+                server_id, [workflows[i] for i in positions])
+            for i, local_id in zip(positions, local_ids):
+                ids[i] = _gid(key, local_id)
+        return ids
+
+    # ── Suche, Nodes ─────────────────────────────────────────────────────────
+
+    def search_workflows(self, query: str, limit: int = 20,
+                         offset: int = 0) -> tuple[list[dict], Optional[int]]:
+        """Sucht in allen Shards und mischt nach bm25-Rang.
+
+        Die Raenge stammen aus getrennten Indizes (eigene Dokumentstatistik)
+        und sind daher nur naeherungsweise vergleichbar.
+        """
+        rows, more = [], False
+        for key, db in self._all():
+            hits, nxt = db.search_workflows(query, limit=offset + limit)
+            rows += self._globalize(key, hits, "id")
+            more = more or nxt is not None
+        rows.sort(key=lambda r: r["rank"])
+        more = more or len(rows) > offset + limit
+        return rows[offset:offset + limit], (offset + limit if more else None)
+
+    def find_workflows_by_node(self, node_type: Optional[str] = None,
+                               host: Optional[str] = None,
+                               limit: Optional[int] = None) -> list[dict]:
+        rows = []
+        for key, db in self._all():
+            rows += self._globalize(key, db.find_workflows_by_node(node_type, host, limit), "id")
+        rows.sort(key=lambda r: (r["updated_at"], r["id"]), reverse=True)
+        return rows if limit is None else rows[:int(limit)]
+
+    def node_usage(self) -> list[dict]:
+        usage: dict[str, dict] = {}
+        for _, db in self._all():
+            for r in db.node_usage():
+                entry = usage.setdefault(r["node_type"], dict(r, nodes=0, workflows=0))
+                entry["nodes"] += r["nodes"]
+                entry["workflows"] += r["workflows"]
+        return sorted(usage.values(), key=lambda r: (-r["workflows"], r["node_type"]))
+
+    # ── Wartung ──────────────────────────────────────────────────────────────
+
+    def get_stats(self) -> dict:
+        stats = self.main.get_stats()
+        for _, db in self._all()[1:]:
+            shard = db.get_stats()
+            for field in ("workflows", "active", "blob_bytes", "blob_stored_bytes"):
+                stats[field] += shard[field]
+            for field in ("by_source", "by_server", "by_trigger"):
+                for k, v in shard[field].items():
+                    stats[field][k] = stats[field].get(k, 0) + v
+            for k, v in shard["last_sync"].items():
+                stats["last_sync"][k] = max(stats["last_sync"].get(k, v), v)
+        return stats
+
+    def check_stats(self, repair: bool = False) -> list[dict]:
+        """Wie Database.check_stats, Abweichungen zusaetzlich mit shard."""
+        diffs = []
+        for key, db in self._all():
+            diffs += [dict(d, shard=key) for d in db.check_stats(repair=repair)]
+        return diffs
+
+    def iter_workflow_payloads(self, after_id: int = 0, batch_size: int = 500):
+        """Wie Database.iter_workflow_payloads, Shard fuer Shard in ID-Reihenfolge."""
+        start_key, start_local = _split(after_id)
+        for key, db in self._all():
+            if key < start_key:
+                continue
+            local_after = start_local if key == start_key else 0
+            for batch in db.iter_workflow_payloads(after_id=local_after, batch_size=batch_size):
+                yield self._globalize(key, batch, "id")
+
+    def apply_reindex(self, items: list[tuple], checkpoint_key: Optional[str] = None,
+                      checkpoint: Optional[int] = None):
+        """Schreibt pro Shard, den Checkpoint danach in die Hauptdatei.
+
+        Anders als bei einer Datei ist das nicht eine Transaktion; ein Abbruch
+        dazwischen fuehrt hoechstens zu erneuter (idempotenter) Verarbeitung.
+        """
+        groups: dict[int, list[tuple]] = {}
+        for item in items:
+            key, local_id = _split(item[0])
+            groups.setdefault(key, []).append((local_id, *item[1:]))
+        for key, group in groups.items():
+            self._shard(key).apply_reindex(group)
+        if checkpoint_key is not None:
+            self.main.set_meta(checkpoint_key, str(checkpoint))
+
+    def recompress(self, compression: Optional[str] = None, batch_size: int = 500) -> dict:
+        result = {"rows": 0, "changed": 0, "bytes_before": 0, "bytes_after": 0}
+        for _, db in self._all():
+            for k, v in db.recompress(compression, batch_size=batch_size).items():
+                result[k] += v
+        return result
+
+    def vacuum(self):
+        for _, db in self._all():
+            db.vacuum()
+
+    # ── Sync-History ─────────────────────────────────────────────────────────
+
+    def add_sync_entry(self, workflow_id: Optional[int], server_id: Optional[int],
+                       direction: str, status: str = "success", details: str = "",
+                       imported: int = 0, skipped: int = 0, errors: int = 0) -> int:
+        """Eintrag im Shard des Workflows, ohne Workflow im Shard des Servers."""
+        if workflow_id is not None:
+            key, local_id = _split(workflow_id)
+        else:
+            key, local_id = server_id or 0, None
+        self._ensure_server(key, server_id)
+        entry_id = self._shard(key).add_sync_entry(local_id, server_id, direction,
+                                                   status=status, details=details,
+                                                   imported=imported, skipped=skipped,
+                                                   errors=errors)
+        return _gid(key, entry_id)
+
+    def remote_workflows(self, server_id: int, workflow_ids) -> dict[int, dict]:
+        """Der Cache liegt im Shard des Workflows."""
+        groups: dict[int, list[int]] = {}
+        for gid in workflow_ids:
+            key, local_id = _split(gid)
+            groups.setdefault(key, []).append(local_id)
+        found = {}
+        for key, local_ids in groups.items():
+            if key and not self._has_shard(key):
+                continue
+            for local_id, entry in self._shard(key).remote_workflows(server_id, local_ids).items():
+                found[_gid(key, local_id)] = entry
+        return found
+
+    def record_pushes(self, entries: list[dict]) -> int:
+        """Pro Shard des Workflows eine Transaktion.
+
+        Eine Bindung an einen anderen Server als den des Shards wuerde den
+        Workflow verschieben (s. update_workflow) und entfaellt; Sync-Eintrag
+        und Remote-Cache werden trotzdem geschrieben.
+        """
+        groups: dict[int, list[dict]] = {}
+        for e in entries:
+            key, local_id = _split(e["workflow_id"])
+            e = {**e, "workflow_id": local_id}
+            if e.get("n8n_id") and key and e["server_id"] != key:
+                del e["n8n_id"]
+            self._ensure_server(key, e["server_id"])
+            groups.setdefault(key, []).append(e)
+        return sum(self._shard(key).record_pushes(group) for key, group in groups.items())
+
+    def get_sync_history(self, workflow_id: Optional[int] = None,
+                         server_id: Optional[int] = None, limit: int = 50,
+                         direction: Optional[str] = None) -> list[dict]:
+        rows, _ = self.get_sync_history_page(workflow_id=workflow_id, server_id=server_id,
+                                             direction=direction, limit=limit)
+        return rows
+
+    def get_sync_history_page(self, workflow_id: Optional[int] = None,
+                              server_id: Optional[int] = None,
+                              direction: Optional[str] = None, limit: int = 50,
+                              cursor: Optional[str] = None) -> tuple[list[dict], Optional[str]]:
+        shards, local_wf = self._all(), None
+        if workflow_id is not None:
+            key, local_wf = _split(workflow_id)
+            shards = [(k, db) for k, db in shards if k == key]
+        pages = []
+        for key, db in shards:
+            rows, nxt = db.get_sync_history_page(workflow_id=local_wf, server_id=server_id,
+                                                 direction=direction, limit=limit,
+                                                 cursor=self._local_cursor(key, cursor))
+            pages.append((self._globalize(key, rows, "id", "workflow_id"), nxt))
+        return self._merge_page(pages, limit, "synced_at")
+
+    def rollup_sync_history(self, retention_days: Optional[int] = None) -> dict:
+        result = {"days": 0, "entries": 0}
+        for _, db in self._all():
+            for k, v in db.rollup_sync_history(retention_days).items():
+                result[k] += v
+        return result
+
+    def get_sync_stats(self, server_id: Optional[int] = None, direction: Optional[str] = None,
+                       days: int = 30) -> list[dict]:
+        merged: dict[tuple, dict] = {}
+        counters = ("entries", "error_entries", "imported", "skipped", "errors")
+        for _, db in self._all():
+            for r in db.get_sync_stats(server_id=server_id, direction=direction, days=days):
+                key = (r["day"], r["server_id"], r["direction"])
+                if key not in merged:
+                    merged[key] = r
+                    continue
+                for field in counters:
+                    merged[key][field] += r[field]
+        rows = sorted(merged.values(), key=lambda r: (r["server_id"], r["direction"]))
+        rows.sort(key=lambda r: r["day"], reverse=True)
+        for r in rows:
+            r["error_rate"] = round(r["error_entries"] / r["entries"], 4) if r["entries"] else 0.0
+        return rows
+
+    # ── Versionen ────────────────────────────────────────────────────────────
+
+    def add_version(self, workflow_id: int, workflow_json: Union[str, WorkflowAnalysis],
+                    change_note: str = "") -> int:
+        key, local_id = _split(workflow_id)
+        return _gid(key, self._shard(key).add_version(local_id, workflow_json,
+                                                      change_note=change_note))
+
+    def get_versions(self, workflow_id: int) -> list[dict]:
+        key, local_id = _split(workflow_id)
+        if key and not self._has_shard(key):
+            return []
+        return self._globalize(key, self._shard(key).get_versions(local_id),
+                               "id", "workflow_id")
+
+    def get_version(self, workflow_id: int, version_number: int) -> Optional[dict]:
+        key, local_id = _split(workflow_id)
+        if key and not self._has_shard(key):
+            return None
+        row = self._shard(key).get_version(local_id, version_number)
+        return self._globalize(key, [row], "id", "workflow_id")[0] if row else None
+
+
+BACKENDS = {"sqlite": Database, "memory": MemoryDatabase, "sharded": ShardedDatabase}
+
+
+def open_backend(backend: str, db_path: Union[str, Path], **options) -> StorageBackend:
+    """Backend nach Name. Raises ValueError bei unbekanntem Backend."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unbekanntes Storage-Backend: {backend} "
+                         f"(erlaubt: {', '.join(BACKENDS)})")
+    if backend == "memory":
+        return MemoryDatabase(**options)
+    return BACKENDS[backend](db_path, **options)
@@ -0,0 +1,470 @@
+"""Pull: Workflows eines n8n-Servers streamend in die Datenbank uebernehmen.
+
+PullIngest puffert hoechstens batch_size Workflows und schreibt jeden Batch
+in einer Transaktion -- der Speicherbedarf bleibt flach, egal wie viele
+Workflows der Server hat. pull_workflows() verbindet das mit
+N8nClient.iter_workflows(); die async Route treibt PullIngest selbst.
+
+Inkrementell: servers.pull_watermark haelt das groesste updatedAt des letzten
+fehlerfreien Pulls. Aeltere Workflows werden ohne Parsen, Hashen und
+DB-Zugriff verworfen; full=True ignoriert die Watermark.
+
+pull_all() zieht mehrere Server gleichzeitig (AsyncN8nClient); alle
+Schreibzugriffe laufen ueber einen einzigen Writer-Thread. push_batch()
+pusht viele Workflows auf einen oder mehrere Server mit begrenzt vielen
+Workern und schreibt die Ergebnisse batchweise. Pushes und Pulls merken
+sich in remote_workflows den content_hash pro (Server, n8n_id);
+unveraenderte Workflows werden ohne Request uebersprungen.
+"""
+import asyncio
+import json
+import threading
+import time
+from itertools import product
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional
+
+from n8nManager.core.n8n_client import N8nApiError, aclose_clients, get_async_client
+from n8nManager.core.workflow_parser import WorkflowAnalysis, deploy_hash
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_CONCURRENCY = 4  # Server gleichzeitig
+DEFAULT_PER_SERVER = 1  # gleichzeitige Pulls pro n8n-Instanz (gleiche URL)
+DEFAULT_PUSH_CONCURRENCY = 8  # gleichzeitige Pushes insgesamt
+
+_writer: Optional[ThreadPoolExecutor] = None
+_writer_lock = threading.Lock()
+
+
+def _writer_pool() -> ThreadPoolExecutor:
+    """Der eine Writer-Thread fuer pull_all und push_batch (auch ueber Aufrufe hinweg)."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="n8n-sync-writer")
+        return _writer
+
+
+def _timestamp(value) -> Optional[datetime]:
+    """updatedAt der n8n API (ISO 8601) -> datetime mit Zeitzone; None wenn unbrauchbar."""
+    if not value:
+        return None
+    try:
+        stamp = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return stamp if stamp.tzinfo else stamp.replace(tzinfo=timezone.utc)
+
+
+def watermark(server: Optional[dict], full: bool = False) -> str:
+    """Startpunkt eines Pulls: pull_watermark des Servers, leer bei full."""
+    if full or not server:
+        return ""
+    return server.get("pull_watermark") or ""
+
+
+class PullIngest:
+    """Puffert gezogene Workflows und schreibt sie batchweise.
+
+    Workflows mit updatedAt vor since zaehlen als unchanged und werden nicht
+    gepuffert. Beim Schreiben wird die lokale Zeile mit gleichem
+    (server_id, n8n_id) aktualisiert (updated), sonst neu angelegt
+    (imported); identische Inhalte und Hashes anderer Zeilen zaehlen als
+    skipped. high_water ist das groesste gesehene updatedAt. Workflows, die
+    sich nicht schreiben lassen, landen in failed ({n8n_id, updatedAt,
+    error}) und begrenzen next_watermark().
+    """
+
+    def __init__(self, db, server_id: int, batch_size: int = DEFAULT_BATCH_SIZE,
+                 source: str = "pull", since: str = ""):
+        self.db = db
+        self.server_id = server_id
+        self.batch_size = max(1, int(batch_size))
+        self.source = source
+        self.since = since
+        self.high_water = since
+        self.stats = {"total": 0, "imported": 0, "updated": 0, "skipped": 0, "unchanged": 0,
+                      "failed": 0}
+        self.failed: list[dict] = []
+        self._since = self._high = _timestamp(since)
+        self._low_failed: Optional[tuple[datetime, str]] = None
+        self._buffer: list[dict] = []
+
+    def add(self, workflow: dict) -> bool:
+        """Puffert einen Workflow (Rohdaten der n8n API). True = Puffer voll, flush() faellig."""
+        self.stats["total"] += 1
+        changed = _timestamp(workflow.get("updatedAt"))
+        if changed is not None:
+            if self._high is None or changed > self._high:
+                self._high, self.high_water = changed, workflow["updatedAt"]
+            # Strikt aelter: Workflows mit genau der Watermark werden erneut geprueft
+            if self._since is not None and changed < self._since:
+                self.stats["unchanged"] += 1
+                return False
+        self._buffer.append(workflow)
+        return len(self._buffer) >= self.batch_size
+
+    def take(self) -> list[dict]:
+        """Gibt den Puffer zurueck und leert ihn (zum Schreiben in einem anderen Thread)."""
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    def flush(self):
+        """Analysiert den Puffer und schreibt neue Workflows in einer Transaktion."""
+        self.write(self.take())
+
+    def next_watermark(self) -> str:
+        """high_water, hoechstens das updatedAt des aeltesten nicht geschriebenen Workflows.
+
+        Der wird beim naechsten Pull also erneut geprueft, aeltere nicht.
+        """
+        if self._low_failed is not None and (self._high is None
+                                             or self._low_failed[0] < self._high):
+            return self._low_failed[1]
+        return self.high_water
+
+    def write(self, batch: list[dict]):
+        """Schreibt einen Batch in einer Transaktion.
+
+        Scheitert sie, wird jeder Workflow einzeln geschrieben; was auch dann
+        scheitert, landet in failed -- ein kaputter Workflow blockiert so
+        weder den Rest des Batches noch die Watermark.
+        """
+        if not batch:
+            return
+        try:
+            self._write(batch)
+        except Exception as e:
+            if len(batch) > 1:
+                for wf in batch:
+                    self.write([wf])
+                return
+            wf = batch[0]
+            self.stats["failed"] += 1
+            self.failed.append({"n8n_id": str(wf.get("id", "")),
+                                "updatedAt": wf.get("updatedAt"), "error": str(e)})
+            changed = _timestamp(wf.get("updatedAt"))
+            if changed is not None and (self._low_failed is None
+                                        or changed < self._low_failed[0]):
+                self._low_failed = (changed, wf["updatedAt"])
+
+    def _write(self, batch: list[dict]):
+        """Hash-Pruefung und upsert_workflows_bulk; Zaehler erst nach dem Schreiben."""
+        counts = {"imported": 0, "updated": 0, "skipped": 0}
+        analyses = [WorkflowAnalysis(wf) for wf in batch]
+        known = self.db.server_workflow_hashes(self.server_id,
+                                               (str(wf.get("id", "")) for wf in batch))
+        existing = self.db.existing_hashes(a.content_hash for a in analyses)
+        items = []
+        for wf, analysis in zip(batch, analyses):
+            n8n_id = str(wf.get("id", ""))
+            if n8n_id in known:
+                if known[n8n_id] == analysis.content_hash:
+                    counts["skipped"] += 1
+                    continue
+                counts["updated"] += 1
+            elif analysis.content_hash in existing:
+                counts["skipped"] += 1
+                continue
+            else:
+                counts["imported"] += 1
+            existing.add(analysis.content_hash)
+            if n8n_id:
+                known[n8n_id] = analysis.content_hash
+            items.append({"name": wf.get("name", "Import"), "workflow_json": analysis,
+                          "n8n_id": n8n_id, "source": self.source})
+        if items:
+            self.db.upsert_workflows_bulk(self.server_id, items)
+        for key, value in counts.items():
+            self.stats[key] += value
+
+
+def error_text(error: Exception) -> str:
+    """Meldung eines abgebrochenen Pulls; unerwartete Fehler mit Typname."""
+    return str(error) if isinstance(error, N8nApiError) else f"{type(error).__name__}: {error}"
+
+
+def failed_message(ingest: PullIngest) -> Optional[str]:
+    """Meldung zu nicht geschriebenen Workflows (None, wenn alle geschrieben wurden)."""
+    if not ingest.failed:
+        return None
+    ids = ", ".join(f["n8n_id"] for f in ingest.failed[:10])
+    more = f" (+{len(ingest.failed) - 10})" if len(ingest.failed) > 10 else ""
+    return (f"{len(ingest.failed)} Workflows nicht gespeichert (n8n_id {ids}{more}): "
+            f"{ingest.failed[0]['error']}")
+
+
+def finish_pull(db, ingest: PullIngest, error: Optional[str] = None, errors: int = 0):
+    """Schreibt den Sync-Eintrag eines Pulls und rueckt die Watermark vor.
+
+    errors sind Abbrueche beim Lesen: dann bleibt die Watermark stehen --
+    nicht gelesene Seiten koennten aeltere Aenderungen enthalten. Nicht
+    geschriebene Workflows (ingest.failed) zaehlen als Fehler, die Watermark
+    rueckt aber bis zum aeltesten von ihnen vor (next_watermark).
+    """
+    s = ingest.stats
+    details = (f"imported={s['imported']}, updated={s['updated']}, "
+               f"skipped={s['skipped']}, unchanged={s['unchanged']}")
+    for message in (error, failed_message(ingest)):
+        if message:
+            details += f": {message}"
+    total_errors = errors + s["failed"]
+    db.add_sync_entry(None, ingest.server_id, "pull", "error" if total_errors else "success",
+                      details, imported=s["imported"] + s["updated"],
+                      skipped=s["skipped"] + s["unchanged"], errors=total_errors)
+    mark = ingest.next_watermark()
+    if not errors and mark != ingest.since:
+        db.update_server(ingest.server_id, pull_watermark=mark)
+
+
+def pull_workflows(db, client, server_id: int, batch_size: int = DEFAULT_BATCH_SIZE,
+                   full: bool = False) -> dict:
+    """Zieht alle Workflows eines Servers (alle Seiten) und importiert sie streamend.
+
+    Inkrementell ab der Watermark, full=True zieht alles. Schreibt den
+    Sync-Eintrag und gibt {total, imported, updated, skipped, unchanged,
+    failed, error} zurueck. Bricht eine Seite ab, bleiben die bis dahin
+    gelesenen Workflows importiert und error enthaelt die Meldung (sonst
+    None); nicht geschriebene Workflows zaehlt failed.
+    """
+    ingest = PullIngest(db, server_id, batch_size=batch_size,
+                        since=watermark(db.get_server(server_id), full))
+    error = None
+    try:
+        for workflow in client.iter_workflows():
+            if ingest.add(workflow):
+                ingest.flush()
+    except Exception as e:  # z.B. kaputte Seite: Gelesenes trotzdem schreiben und buchen
+        error = error_text(e)
+    ingest.flush()
+    finish_pull(db, ingest, error, errors=1 if error else 0)
+    return {**ingest.stats, "error": error}
+
+
+# ── Mehrere Server ───────────────────────────────────────────────────────
+
+
+def _report(server: dict) -> dict:
+    return {"server_id": server["id"], "server": server["name"], "fetched": 0,
+            "imported": 0, "updated": 0, "skipped": 0, "unchanged": 0, "failed": 0,
+            "errors": 0, "elapsed": 0.0, "error": None}
+
+
+async def pull_all(db, servers: list[dict], batch_size: int = DEFAULT_BATCH_SIZE,
+                   concurrency: int = DEFAULT_CONCURRENCY,
+                   per_server: int = DEFAULT_PER_SERVER, full: bool = False,
+                   get_client=get_async_client) -> list[dict]:
+    """Zieht alle servers gleichzeitig und gibt pro Server einen Bericht zurueck.
+
+    Hoechstens concurrency Server laufen parallel, pro n8n-Instanz (gleiche
+    URL) hoechstens per_server. Die Fetcher legen volle Batches in eine
+    begrenzte Queue, ein einzelner Writer-Thread schreibt sie -- SQLite
+    sieht nie konkurrierende Schreiber. Pro Server wird ein Sync-Eintrag
+    geschrieben. Bericht: {server_id, server, fetched, imported, updated,
+    skipped, unchanged, failed, errors, elapsed, error}.
+    """
+    loop = asyncio.get_running_loop()
+    writer_pool = _writer_pool()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(2, 2 * concurrency))
+    gate = asyncio.Semaphore(max(1, concurrency))
+    hosts: dict[str, asyncio.Semaphore] = {}
+    reports = [_report(srv) for srv in servers]
+    started: dict[int, float] = {}
+
+    async def fetch(server: dict, report: dict):
+        ingest = PullIngest(db, server["id"], batch_size=batch_size,
+                            since=watermark(server, full))
+        host = hosts.setdefault(server["url"].rstrip("/"), asyncio.Semaphore(max(1, per_server)))
+        # Erst die Instanz, dann der globale Slot -- Wartende blockieren keinen Slot
+        async with host, gate:
+            started[server["id"]] = time.perf_counter()
+            try:
+                client = await get_client(server)
+                async for wf in client.iter_workflows():
+                    if ingest.add(wf):
+                        await queue.put((report, ingest, ingest.take()))
+            except Exception as e:  # z.B. kaputte Seite: nur dieser Server scheitert
+                report["error"] = error_text(e)
+                report["errors"] += 1
+            await queue.put((report, ingest, ingest.take()))
+            report["fetched"] = ingest.stats["total"]
+            # Markiert das Ende des Servers, der Writer schreibt den Sync-Eintrag
+            await queue.put((report, ingest, None))
+
+    def finish(report: dict, ingest: PullIngest):
+        for key in ("imported", "updated", "skipped", "unchanged", "failed"):
+            report[key] = ingest.stats[key]
+        finish_pull(db, ingest, report["error"], errors=report["errors"])
+        report["errors"] += ingest.stats["failed"]
+        report["error"] = report["error"] or failed_message(ingest)
+
+    async def writer():
+        while (item := await queue.get()) is not None:
+            report, ingest, batch = item
+            try:
+                if batch is None:
+                    await loop.run_in_executor(writer_pool, finish, report, ingest)
+                    report["elapsed"] = round(time.perf_counter() - started[report["server_id"]], 3)
+                else:
+                    await loop.run_in_executor(writer_pool, ingest.write, batch)
+            except Exception as e:  # Schreibfehler eines Batches: Server melden, weiterlaufen
+                report["errors"] += 1
+                report["error"] = report["error"] or f"DB-Fehler: {e}"
+
+    writer_task = asyncio.create_task(writer())
+    try:
+        await asyncio.gather(*(fetch(srv, rep) for srv, rep in zip(servers, reports)))
+        await queue.put(None)
+        await writer_task
+    finally:
+        writer_task.cancel()
+    return reports
+
+
+def _run(coro_fn, *args, **options):
+    """Synchroner Einstieg fuer die CLI: eigener Event-Loop, Clients danach schliessen."""
+    async def main():
+        try:
+            return await coro_fn(*args, **options)
+        finally:
+            await aclose_clients()
+    return asyncio.run(main())
+
+
+def run_pull_all(db, servers: list[dict], **options) -> list[dict]:
+    """pull_all() fuer die CLI."""
+    return _run(pull_all, db, servers, **options)
+
+
+# ── Push ─────────────────────────────────────────────────────────────────
+
+
+def select_workflows(db, ids: Optional[list[int]] = None,
+                     tag: Optional[str] = None) -> tuple[list[dict], list[int]]:
+    """Workflows fuer einen Batch-Push: ids, alle mit tag, ohne beides alle.
+
+    Gibt (workflows inkl. workflow_json, nicht gefundene ids) zurueck.
+    """
+    if ids:
+        workflows, missing = [], []
+        for workflow_id in dict.fromkeys(ids):
+            wf = db.get_workflow(workflow_id)
+            if wf:
+                workflows.append(wf)
+            else:
+                missing.append(workflow_id)
+    else:
+        workflows, missing = db.list_workflows(), []
+    if tag:
+        workflows = [wf for wf in workflows if tag in json.loads(wf.get("tags") or "[]")]
+    return workflows, missing
+
+
+async def push_batch(db, workflows: list[dict], servers: list[dict],
+                     concurrency: int = DEFAULT_PUSH_CONCURRENCY,
+                     batch_size: int = DEFAULT_BATCH_SIZE, verify: bool = False,
+                     force: bool = False, get_client=get_async_client) -> list[dict]:
+    """Pusht jeden Workflow auf jeden Server und gibt pro Push ein Ergebnis zurueck.
+
+    Hoechstens concurrency Pushes laufen gleichzeitig; Grenzen pro Server
+    setzt der RateLimiter des Clients. Die Remote-ID ist die n8n_id des
+    Workflows auf dem Server, an den er gebunden ist (ungebundene binden an
+    den ersten Server), sonst die aus dem Remote-Cache; ohne sie wird neu
+    angelegt. Stimmt der Remote-Cache mit content_hash ueberein, wird ohne
+    Request uebersprungen (action=skip). verify holt stattdessen den
+    Remote-Stand und vergleicht deploy_hash(); force pusht immer.
+    n8n_ids, Remote-Cache und Sync-Eintraege schreibt record_pushes() je
+    batch_size Ergebnisse in einer Transaktion (ein Writer-Thread).
+    Ergebnis: {workflow_id, name, server_id, server, action, n8n_id,
+    status, error, elapsed} in der Reihenfolge Workflow x Server.
+    """
+    loop = asyncio.get_running_loop()
+    writer_pool = _writer_pool()
+    jobs = list(product(workflows, servers))
+    results: list[dict] = [{} for _ in jobs]
+    pending: list[tuple[dict, dict]] = []
+    home = servers[0]["id"] if servers else None
+    ids = [wf["id"] for wf in workflows]
+    cache: dict[int, dict] = {}
+
+    async def flush():
+        batch = pending[:]
+        pending.clear()
+        try:
+            await loop.run_in_executor(writer_pool, db.record_pushes, [e for _, e in batch])
+        except Exception as e:  # Push ist erfolgt, nur die lokale Buchung fehlt
+            for result, _ in batch:
+                result["status"] = "error"
+                result["error"] = result["error"] or f"DB-Fehler: {e}"
+
+    async def push_one(wf: dict, server: dict, result: dict):
+        bound = wf.get("server_id")
+        binds = bound == server["id"] or (bound is None and server["id"] == home)
+        cached = cache[server["id"]].get(wf["id"])
+        remote_id = (wf.get("n8n_id") if binds else "") or (cached or {}).get("n8n_id", "")
+        result.update(workflow_id=wf["id"], name=wf["name"], server_id=server["id"],
+                      server=server["name"], action="update" if remote_id else "create",
+                      n8n_id=remote_id, status="error", error=None)
+        start = time.perf_counter()
+        # Remote-Cache: gleicher Stand bereits auf dem Server -> kein Request
+        skip = (not force and not verify and cached is not None
+                and cached["n8n_id"] == remote_id and cached["content_hash"] == wf["content_hash"])
+        response = {}
+        if not skip:
+            try:
+                client = await get_client(server)
+                data = json.loads(wf["workflow_json"])
+                if remote_id and verify and not force:
+                    remote = await client.get_workflow(remote_id)
+                    if remote.get("status_code") == 404:  # remote geloescht: neu anlegen
+                        remote_id = ""
+                    elif remote.get("error"):
+                        response = remote
+                    else:
+                        skip = deploy_hash(remote) == deploy_hash(data)
+                if not skip and not response:
+                    if remote_id:
+                        response = await client.update_workflow(remote_id, data)
+                    else:
+                        response = await client.create_workflow(data)
+            except (N8nApiError, ValueError) as e:
+                response = {"error": True, "detail": str(e)}
+        result["elapsed"] = round(time.perf_counter() - start, 3)
+        entry = {"workflow_id": wf["id"], "server_id": server["id"]}
+        if response.get("error"):
+            result["error"] = response.get("detail") or "Push fehlgeschlagen"
+            entry.update(status="error", details=json.dumps(response), errors=1)
+        else:
+            n8n_id = remote_id if skip else str(response.get("id", "")) or remote_id
+            result.update(status="success", n8n_id=n8n_id,
+                          action="skip" if skip else "update" if remote_id else "create")
+            entry.update(status="success", remote_id=n8n_id, content_hash=wf["content_hash"])
+            if skip:
+                entry.update(details=f"unveraendert, n8n_id={n8n_id}", skipped=1)
+            else:
+                entry.update(details=f"n8n_id={n8n_id}", imported=1)
+            if binds and n8n_id != wf.get("n8n_id"):
+                entry["n8n_id"] = n8n_id
+        pending.append((result, entry))
+        if len(pending) >= batch_size:
+            await flush()
+
+    queue = iter(zip(jobs, results))
+
+    async def worker():
+        # Ein gemeinsamer Iterator: jeder Worker holt sich den naechsten Push
+        for (wf, server), result in queue:
+            await push_one(wf, server, result)
+
+    for server in servers:
+        cache[server["id"]] = await loop.run_in_executor(
+            writer_pool, db.remote_workflows, server["id"], ids)
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(jobs))))))
+    await flush()
+    return results
+
+
+def run_push_batch(db, workflows: list[dict], servers: list[dict], **options) -> list[dict]:
+    """push_batch() fuer die CLI."""
+    return _run(push_batch, db, workflows, servers, **options)
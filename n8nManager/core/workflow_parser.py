@@ -1,7 +1,11 @@
 """Parsing und Validierung von n8n Workflow JSON."""
 import json
 import hashlib
-from typing import Optional
+from typing import Optional, Union
+from urllib.parse import urlsplit
+
+# Parameter, die pro Node in workflow_nodes.params landen (fuer Abfragen)
+HOT_PARAMETERS = ("url", "method", "resource", "operation", "channel", "model")
 
 
 def validate_workflow(data: dict) -> tuple[bool, str]:
@@ -40,16 +44,38 @@ def compute_content_hash(workflow_json: str) -> str:
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
+# Felder, die ein Push auf dem Server setzt; id, updatedAt, versionId usw. vergibt n8n
+DEPLOY_FIELDS = ("name", "nodes", "connections", "settings", "staticData", "pinData")
+
+
+def deploy_hash(data: dict) -> str:
+    """SHA-256 ueber DEPLOY_FIELDS, vergleicht lokalen und Remote-Stand.
+
+    Leere Werte ({}, [], None) zaehlen als fehlend -- n8n ergaenzt z.B. settings.
+    """
+    content = {k: data[k] for k in DEPLOY_FIELDS if data.get(k) not in (None, {}, [])}
+    normalized = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def extract_metadata(data: dict) -> dict:
-    """Extrahiert Metadaten aus n8n Workflow dict."""
-    nodes = data.get("nodes", [])
+    """Extrahiert Metadaten aus n8n Workflow dict.
+
+    Nodes und Tags, die keine dicts sind, werden uebersprungen; nodes ohne
+    Liste zaehlt als leer.
+    """
+    nodes = data.get("nodes")
+    nodes = [n for n in nodes if isinstance(n, dict)] if isinstance(nodes, list) else []
     trigger_type = ""
     for node in nodes:
-        ntype = node.get("type", "")
+        ntype = node.get("type")
+        if not isinstance(ntype, str):
+            continue
         if "trigger" in ntype.lower() or "webhook" in ntype.lower():
             trigger_type = ntype
             break
-    tags = [t.get("name", "") for t in data.get("tags", [])] if isinstance(data.get("tags"), list) else []
+    tags = data.get("tags")
+    tags = [t.get("name", "") for t in tags if isinstance(t, dict)] if isinstance(tags, list) else []
     return {
         "node_count": len(nodes),
         "trigger_type": trigger_type,
@@ -58,6 +84,94 @@ def extract_metadata(data: dict) -> dict:
     }
 
 
+class WorkflowAnalysis:
+    """Workflow, der genau einmal geparst bzw. serialisiert wird.
+
+    Nimmt ein dict oder einen JSON-String (optional mit bereits geparstem
+    dict) und liefert JSON-String, Content-Hash, node_count, trigger_type,
+    tags, die Suchtexte (node_names, node_types, param_text) und die Zeilen
+    fuer workflow_nodes (nodes) in einem Durchgang. Die Schreib-APIs der
+    Database akzeptieren das Objekt direkt anstelle des JSON-Strings.
+    """
+
+    def __init__(self, workflow: Union[dict, str], data: Optional[dict] = None):
+        if isinstance(workflow, str):
+            self.json = workflow
+            if data is None:
+                try:
+                    data = json.loads(workflow)
+                except (json.JSONDecodeError, TypeError):
+                    data = None
+        else:
+            data = workflow
+            self.json = json.dumps(workflow, ensure_ascii=False)
+        self.data = data if isinstance(data, dict) else None
+
+        if data is not None:
+            normalized = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        else:
+            normalized = self.json  # Ungueltiges JSON: Rohtext hashen
+        self.content_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+        meta = extract_metadata(self.data) if self.data is not None else {}
+        self.node_count = meta.get("node_count", 0)
+        self.trigger_type = meta.get("trigger_type", "")
+        self.tags = meta.get("tags", [])
+
+        # Suchtext fuer den Volltext-Index
+        nodes = self.data.get("nodes", []) if self.data is not None else []
+        nodes = [n for n in nodes if isinstance(n, dict)] if isinstance(nodes, list) else []
+        self.node_names = "\n".join(str(n.get("name", "")) for n in nodes)
+        self.node_types = "\n".join(str(n.get("type", "")) for n in nodes)
+        values = []
+        for node in nodes:
+            _flatten_values(node.get("parameters"), values)
+        self.param_text = "\n".join(values)
+
+        # Zeilen fuer workflow_nodes: (position, name, type, typeVersion, host, params)
+        self.nodes = [_node_row(i, n) for i, n in enumerate(nodes)]
+
+
+def _node_row(position: int, node: dict) -> tuple:
+    params = node.get("parameters")
+    params = params if isinstance(params, dict) else {}
+    hot = {k: params[k] for k in HOT_PARAMETERS
+           if isinstance(params.get(k), (str, int, float)) and params.get(k) != ""}
+    version = node.get("typeVersion")
+    if not isinstance(version, (int, float)) or isinstance(version, bool):
+        version = None
+    return (position, str(node.get("name", "")), str(node.get("type", "")), version,
+            extract_host(hot.get("url", "")),
+            json.dumps(hot, ensure_ascii=False) if hot else "{}")
+
+
+def extract_host(url) -> str:
+    """Hostname aus einem URL-Parameter; leer bei Expressions und ungueltigen Werten."""
+    if not isinstance(url, str) or not url or url.startswith("="):
+        return ""
+    if "://" not in url:
+        url = "//" + url
+    try:
+        return (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+def _flatten_values(value, out: list):
+    """Sammelt alle skalaren Werte (Strings, Zahlen) einer verschachtelten Struktur."""
+    if isinstance(value, dict):
+        for v in value.values():
+            _flatten_values(v, out)
+    elif isinstance(value, list):
+        for v in value:
+            _flatten_values(v, out)
+    elif isinstance(value, str):
+        if value:
+            out.append(value)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        out.append(str(value))
+
+
 def workflow_to_vis_graph(data: dict) -> dict:
     """Konvertiert n8n Workflow in vis.js Graph-Daten (nodes + edges)."""
     vis_nodes = []
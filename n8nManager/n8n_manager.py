@@ -6,12 +6,18 @@ CLI Entry Point mit argparse Subcommands.
 
 Verwendung:
     python -m n8nManager list
-    python -m n8nManager import <file.json>
+    python -m n8nManager search <begriffe> [--limit 20] [--offset 0]
+    python -m n8nManager nodes [--type NODE_TYPE] [--host HOST]
+    python -m n8nManager import <file.json|dir|glob> [...]
     python -m n8nManager export <workflow_id> [--format json|md]
-    python -m n8nManager push <workflow_id> [--server NAME]
-    python -m n8nManager pull [--server NAME]
-    python -m n8nManager status
-    python -m n8nManager servers [--add NAME URL APIKEY]
+    python -m n8nManager push <workflow_id> [--server NAME] [--verify | --force]
+    python -m n8nManager push --all | --tag TAG | --ids ID [...] [--server NAME ...] [--concurrency 8]
+    python -m n8nManager pull [--server NAME | --all [--concurrency 4]] [--full] [--batch-size 200]
+    python -m n8nManager status [--check [--repair]]
+    python -m n8nManager history [--server NAME] [--stats [--days 30]] [--rollup]
+    python -m n8nManager compress [--codec zlib|zstd|none] [--vacuum]
+    python -m n8nManager reindex [--dry-run] [--jobs N] [--restart]
+    python -m n8nManager servers [--add NAME URL APIKEY | --limit NAME] [--rate N] [--max-in-flight N]
     python -m n8nManager config [--show | --set KEY VALUE]
     python -m n8nManager serve [--port 8100]
     python -m n8nManager setup --host HOST --ssh-key PATH [--port 5678]
@@ -19,6 +25,7 @@ Verwendung:
 import argparse
 import json
 import sys
+import time
 from pathlib import Path
 
 PACKAGE_DIR = Path(__file__).resolve().parent
@@ -31,12 +38,12 @@ VERSION = "0.1.0"
 
 def cmd_list(args):
     """Alle lokalen Workflows auflisten."""
-    from n8nManager.core.config import load_config, get_db_path
-    from n8nManager.core.database import Database
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
 
     config = load_config()
-    db = Database(get_db_path(config))
-    workflows = db.list_workflows()
+    db = open_database(config)
+    workflows = db.list_workflows(summary=True)
 
     if not workflows:
         print("Keine Workflows vorhanden.")
@@ -52,40 +59,103 @@ def cmd_list(args):
     return 0
 
 
-def cmd_import(args):
-    """n8n JSON-Datei importieren."""
-    from n8nManager.core.config import load_config, get_db_path
-    from n8nManager.core.database import Database
-    from n8nManager.core.workflow_parser import load_workflow_file, compute_content_hash
+def cmd_search(args):
+    """Workflows per Volltextsuche finden."""
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
 
     config = load_config()
-    db = Database(get_db_path(config))
-
-    data, err = load_workflow_file(args.file)
-    if not data:
-        print(f"Fehler: {err}")
+    db = open_database(config)
+    try:
+        results, next_offset = db.search_workflows(" ".join(args.query),
+                                                   limit=args.limit, offset=args.offset)
+    except ValueError as e:
+        print(f"Fehler: {e}")
         return 1
 
-    wf_json = json.dumps(data, ensure_ascii=False)
-    content_hash = compute_content_hash(wf_json)
+    if not results:
+        print("Keine Treffer.")
+        return 0
+
+    print(f"{'ID':<5} {'Name':<35} {'Nodes':<7} Treffer")
+    print("-" * 90)
+    for wf in results:
+        snippet = " ".join(wf["snippet"].split())[:60]
+        print(f"{wf['id']:<5} {wf['name'][:34]:<35} {wf['node_count']:<7} {snippet}")
+    if next_offset is not None:
+        print(f"\nWeitere Treffer: --offset {next_offset}")
+    return 0
+
+
+def cmd_nodes(args):
+    """Node-Nutzung pro Typ oder Workflows mit bestimmtem Node-Typ/Host."""
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
 
-    if db.workflow_exists_by_hash(content_hash):
-        print("Workflow existiert bereits (Duplikat).")
+    config = load_config()
+    db = open_database(config)
+
+    if not args.type and not args.host:
+        usage = db.node_usage()
+        if not usage:
+            print("Keine Nodes vorhanden.")
+            return 0
+        print(f"{'Node-Typ':<45} {'Name':<20} {'Workflows':>9} {'Nodes':>7}")
+        print("-" * 85)
+        for u in usage:
+            print(f"{u['node_type'][:44]:<45} {u['display_name'][:19]:<20} "
+                  f"{u['workflows']:>9} {u['nodes']:>7}")
         return 0
 
-    name = data.get("name", Path(args.file).stem)
-    wf_id = db.add_workflow(name=name, workflow_json=wf_json, source="import")
-    print(f"Workflow '{name}' importiert (ID: {wf_id})")
+    workflows = db.find_workflows_by_node(node_type=args.type, host=args.host)
+    if not workflows:
+        print("Keine passenden Workflows.")
+        return 0
+    print(f"{'ID':<5} {'Name':<35} {'Nodes':<7} {'Treffer':<8} {'Quelle'}")
+    print("-" * 70)
+    for wf in workflows:
+        print(f"{wf['id']:<5} {wf['name'][:34]:<35} {wf['node_count']:<7} "
+              f"{wf['matching_nodes']:<8} {wf['source']}")
     return 0
 
 
+def cmd_import(args):
+    """n8n JSON-Dateien, Verzeichnisse oder Globs importieren."""
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
+    from n8nManager.core.bulk_import import bulk_import
+
+    config = load_config()
+    db = open_database(config)
+
+    def progress(stats):
+        rate = stats["documents"] / stats["elapsed"] if stats["elapsed"] else 0
+        print(f"\r  {stats['documents']} gelesen, {stats['imported']} importiert "
+              f"({rate:,.0f}/s)", end="", flush=True)
+
+    stats = bulk_import(db, args.files, jobs=args.jobs, batch_size=args.batch_size,
+                        progress=progress)
+    if stats["documents"]:
+        print()
+
+    rate = stats["documents"] / stats["elapsed"] if stats["elapsed"] else 0
+    print(f"{stats['imported']} Workflows importiert, {stats['duplicates']} Duplikate, "
+          f"{stats['invalid']} ungueltig ({stats['files']} Dateien, "
+          f"{stats['elapsed']:.1f}s, {rate:,.0f} Workflows/s)")
+    for err in stats["errors"][:10]:
+        print(f"  Fehler: {err}")
+    if len(stats["errors"]) > 10:
+        print(f"  ... {len(stats['errors']) - 10} weitere Fehler")
+    return 1 if stats["invalid"] and not stats["imported"] else 0
+
+
 def cmd_export(args):
     """Workflow als JSON oder Markdown exportieren."""
-    from n8nManager.core.config import load_config, get_db_path
-    from n8nManager.core.database import Database
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
 
     config = load_config()
-    db = Database(get_db_path(config))
+    db = open_database(config)
 
     wf = db.get_workflow(args.workflow_id)
     if not wf:
@@ -112,14 +182,27 @@ def cmd_export(args):
     return 0
 
 
+def _track_circuits(db):
+    """Circuit-Breaker-Wechsel der n8n-Clients in servers.status schreiben."""
+    from n8nManager.core.n8n_client import circuit_status_listener, set_circuit_listener
+    set_circuit_listener(circuit_status_listener(lambda: db))
+
+
 def cmd_push(args):
     """Workflow auf n8n-Server pushen."""
-    from n8nManager.core.config import load_config, get_db_path
-    from n8nManager.core.database import Database
-    from n8nManager.core.n8n_client import N8nClient
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
+    from n8nManager.core.sync import run_push_batch
 
     config = load_config()
-    db = Database(get_db_path(config))
+    db = open_database(config)
+    _track_circuits(db)
+
+    if args.all or args.tag or args.ids or len(args.server or []) > 1:
+        return _push_batch(db, config, args)
+    if args.workflow_id is None:
+        print("Workflow-ID, --ids, --tag oder --all angeben.")
+        return 1
 
     wf = db.get_workflow(args.workflow_id)
     if not wf:
@@ -127,7 +210,7 @@ def cmd_push(args):
         return 1
 
     if args.server:
-        srv = db.get_server_by_name(args.server)
+        srv = db.get_server_by_name(args.server[0])
     else:
         srv = db.get_default_server()
 
@@ -135,38 +218,74 @@ def cmd_push(args):
         print("Kein Server konfiguriert. Nutze: n8nManager servers --add NAME URL APIKEY")
         return 1
 
-    client = N8nClient(base_url=srv["url"], api_key=srv["api_key"])
-    wf_data = json.loads(wf["workflow_json"])
+    result = run_push_batch(db, [wf], [srv], verify=args.verify, force=args.force)[0]
+    if result["error"]:
+        print(f"Push fehlgeschlagen: {result['error']}")
+        return 1
+    action = {"create": "erstellt", "update": "aktualisiert", "skip": "unveraendert"}[result["action"]]
+    print(f"Workflow '{wf['name']}' {action} auf {srv['name']} (n8n_id={result['n8n_id']})")
+    return 0
 
-    if wf.get("n8n_id"):
-        result = client.update_workflow(wf["n8n_id"], wf_data)
-        action = "aktualisiert"
-    else:
-        result = client.create_workflow(wf_data)
-        action = "erstellt"
 
-    if result.get("error"):
-        print(f"Push fehlgeschlagen: {result.get('detail', 'Unbekannter Fehler')}")
-        db.add_sync_entry(wf["id"], srv["id"], "push", "error", json.dumps(result))
+def _push_batch(db, config: dict, args) -> int:
+    """push --all/--tag/--ids: Worker-Pool ueber alle Ziel-Server, Tabelle pro Push."""
+    from n8nManager.core.sync import DEFAULT_PUSH_CONCURRENCY, run_push_batch, select_workflows
+
+    servers = []
+    for name in args.server or []:
+        srv = db.get_server_by_name(name)
+        if not srv:
+            print(f"Server '{name}' nicht gefunden.")
+            return 1
+        servers.append(srv)
+    if not servers:
+        srv = db.get_default_server()
+        if not srv:
+            print("Kein Server konfiguriert. Nutze: n8nManager servers --add NAME URL APIKEY")
+            return 1
+        servers.append(srv)
+
+    ids = (args.ids or []) + ([args.workflow_id] if args.workflow_id is not None else [])
+    workflows, missing = select_workflows(db, ids=ids or None, tag=args.tag)
+    for workflow_id in missing:
+        print(f"Workflow {workflow_id} nicht gefunden.")
+    if not workflows:
+        print("Keine Workflows zum Pushen.")
         return 1
 
-    n8n_id = str(result.get("id", ""))
-    if n8n_id:
-        db.update_workflow(wf["id"], n8n_id=n8n_id, server_id=srv["id"])
-    db.add_sync_entry(wf["id"], srv["id"], "push", "success", f"n8n_id={n8n_id}")
-    print(f"Workflow '{wf['name']}' {action} auf {srv['name']} (n8n_id={n8n_id})")
-    return 0
+    concurrency = args.concurrency or config.get("n8n", {}).get("push_concurrency",
+                                                                DEFAULT_PUSH_CONCURRENCY)
+    start = time.perf_counter()
+    results = run_push_batch(db, workflows, servers, concurrency=concurrency,
+                             verify=args.verify, force=args.force)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'ID':<6} {'Name':<30} {'Server':<16} {'Aktion':<7} {'n8n_id':<18} {'Dauer':>8}  Status")
+    print("-" * 100)
+    for r in results:
+        status = "ok" if r["status"] == "success" else f"Fehler: {r['error'].splitlines()[0]}"
+        print(f"{r['workflow_id']:<6} {r['name'][:29]:<30} {r['server'][:15]:<16} {r['action']:<7} "
+              f"{r['n8n_id'][:17]:<18} {r['elapsed'] * 1000:>5.0f} ms  {status}")
+    failed = sum(r["status"] != "success" for r in results)
+    skipped = sum(r["action"] == "skip" for r in results)
+    print(f"\n{len(results) - failed} von {len(results)} Pushes erfolgreich, davon {skipped} "
+          f"unveraendert ({len(workflows)} Workflows, {len(servers)} Server) in {elapsed:.1f} s")
+    return 1 if failed or missing else 0
 
 
 def cmd_pull(args):
     """Workflows vom n8n-Server ziehen."""
-    from n8nManager.core.config import load_config, get_db_path
-    from n8nManager.core.database import Database
-    from n8nManager.core.n8n_client import N8nClient
-    from n8nManager.core.workflow_parser import compute_content_hash
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
+    from n8nManager.core.n8n_client import get_client
+    from n8nManager.core.sync import pull_workflows
 
     config = load_config()
-    db = Database(get_db_path(config))
+    db = open_database(config)
+    _track_circuits(db)
+
+    if args.all:
+        return _pull_all(db, config, args)
 
     if args.server:
         srv = db.get_server_by_name(args.server)
@@ -177,66 +296,216 @@ def cmd_pull(args):
         print("Kein Server konfiguriert.")
         return 1
 
-    client = N8nClient(base_url=srv["url"], api_key=srv["api_key"])
-    result = client.list_workflows()
-
-    if result.get("error"):
-        print(f"Pull fehlgeschlagen: {result.get('detail')}")
+    result = pull_workflows(db, get_client(srv), srv["id"], batch_size=args.batch_size,
+                            full=args.full)
+    summary = (f"{result['imported']} neu, {result['updated']} aktualisiert, "
+               f"{result['skipped']} uebersprungen, {result['unchanged']} unveraendert")
+    if result["error"]:
+        print(f"Pull fehlgeschlagen: {result['error']} (bis dahin {summary})")
+        return 1
+    print(f"{srv['name']}: {summary} ({result['total']} total auf Server)")
+    if result["failed"]:
+        print(f"{result['failed']} Workflows nicht gespeichert, siehe history --server {srv['name']}")
         return 1
+    return 0
 
-    workflows = result.get("data", [])
-    imported = 0
-    for wf in workflows:
-        wf_json = json.dumps(wf, ensure_ascii=False)
-        content_hash = compute_content_hash(wf_json)
-        if db.workflow_exists_by_hash(content_hash):
-            continue
-        db.add_workflow(
-            name=wf.get("name", "Import"),
-            workflow_json=wf_json,
-            n8n_id=str(wf.get("id", "")),
-            server_id=srv["id"],
-            source="pull",
-        )
-        imported += 1
 
-    print(f"{imported} Workflows von {srv['name']} importiert ({len(workflows)} total auf Server)")
-    return 0
+def _pull_all(db, config: dict, args) -> int:
+    """pull --all: alle Server gleichzeitig, Bericht pro Server."""
+    from n8nManager.core.sync import DEFAULT_CONCURRENCY, DEFAULT_PER_SERVER, run_pull_all
+
+    servers = db.list_servers()
+    if not servers:
+        print("Kein Server konfiguriert.")
+        return 1
+    n8n_cfg = config.get("n8n", {})
+    concurrency = args.concurrency or n8n_cfg.get("pull_concurrency", DEFAULT_CONCURRENCY)
+    start = time.perf_counter()
+    reports = run_pull_all(db, servers, batch_size=args.batch_size, concurrency=concurrency,
+                           per_server=n8n_cfg.get("pull_per_server", DEFAULT_PER_SERVER),
+                           full=args.full)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Server':<20} {'Geholt':>7} {'Neu':>6} {'Aktual.':>8} {'Uebersp.':>9} "
+          f"{'Unveraendert':>13} {'Fehler':>7} {'Dauer':>8}")
+    print("-" * 86)
+    for r in reports:
+        print(f"{r['server'][:20]:<20} {r['fetched']:>7} {r['imported']:>6} {r['updated']:>8} "
+              f"{r['skipped']:>9} {r['unchanged']:>13} {r['errors']:>7} {r['elapsed']:>6.1f} s")
+    for r in reports:
+        if r["error"]:
+            print(f"  {r['server']}: {r['error']}")
+    print(f"\n{len(reports)} Server in {elapsed:.1f} s")
+    return 1 if any(r["errors"] for r in reports) else 0
 
 
 def cmd_status(args):
     """System-Status anzeigen."""
     from n8nManager.core.config import load_config, get_db_path
-    from n8nManager.core.database import Database
+    from n8nManager.core.database import open_database
 
     config = load_config()
-    db = Database(get_db_path(config))
-    workflows = db.list_workflows()
+    db = open_database(config)
+
+    if args.check or args.repair:
+        diffs = db.check_stats(repair=args.repair)
+        if not diffs:
+            print("Zaehler konsistent.")
+            return 0
+        print(f"{'Art':<18} {'Schluessel':<32} {'Gespeichert':>20} {'Ist':>20}")
+        for d in diffs:
+            print(f"{d['kind']:<18} {d['key'][:32]:<32} {d['stored']!s:>20} {d['actual']!s:>20}")
+        if args.repair:
+            print(f"\n{len(diffs)} Zaehler korrigiert.")
+            return 0
+        print(f"\n{len(diffs)} Abweichungen (korrigieren mit --repair).")
+        return 1
+
+    stats = db.get_stats()
     servers = db.list_servers()
 
     print(f"n8nManager v{VERSION}")
-    print(f"Workflows: {len(workflows)}")
-    print(f"Server:    {len(servers)}")
+    print(f"Workflows: {stats['workflows']} ({stats['active']} aktiv)")
+    print(f"Server:    {stats['servers']}")
+    print(f"Blobs:     {stats['blob_bytes'] / 1024:.0f} KB "
+          f"({stats['blob_stored_bytes'] / 1024:.0f} KB gespeichert)")
     print(f"DB:        {get_db_path(config)}")
     print(f"API-Port:  {config.get('api_port', 8100)}")
     print(f"BACH:      {'Ja' if config.get('bach', {}).get('enabled') else 'Nein'}")
 
+    if stats["by_source"]:
+        print("\nNach Quelle:")
+        for source, count in sorted(stats["by_source"].items(), key=lambda kv: -kv[1]):
+            print(f"  {source or '-'}: {count}")
+    if stats["by_trigger"]:
+        print("\nNach Trigger:")
+        for trigger, count in sorted(stats["by_trigger"].items(), key=lambda kv: -kv[1]):
+            print(f"  {trigger or '-'}: {count}")
+
     if servers:
         print("\nServer:")
         for srv in servers:
             default = " [DEFAULT]" if srv.get("is_default") else ""
-            print(f"  {srv['name']}: {srv['url']} ({srv.get('status', '?')}){default}")
+            count = stats["by_server"].get(srv["id"], 0)
+            last = stats["last_sync"].get(srv["id"], "nie")
+            print(f"  {srv['name']}: {srv['url']} ({srv.get('status', '?')}){default}"
+                  f" -- {count} Workflows, letzter Sync: {last}")
+
+    return 0
+
+
+def cmd_history(args):
+    """Sync-Historie oder Tagesstatistik anzeigen, alte Eintraege verdichten."""
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
+
+    config = load_config()
+    db = open_database(config)
+
+    server_id = None
+    if args.server:
+        srv = db.get_server_by_name(args.server)
+        if not srv:
+            print(f"Server '{args.server}' nicht gefunden.")
+            return 1
+        server_id = srv["id"]
+
+    if args.rollup:
+        if not db.sync_retention_days:
+            print("Keine Aufbewahrung gesetzt (database.sync_history_retention_days = 0), "
+                  "nichts verdichtet.")
+            return 0
+        result = db.rollup_sync_history()
+        print(f"{result['entries']} Eintraege aus {result['days']} Tagen verdichtet "
+              f"(Aufbewahrung: {db.sync_retention_days} Tage)")
+        return 0
+
+    if args.stats:
+        stats = db.get_sync_stats(server_id=server_id, days=args.days)
+        if not stats:
+            print("Keine Sync-Daten im Zeitraum.")
+            return 0
+        print(f"{'Tag':<11} {'Server':<7} {'Richtung':<9} {'Eintraege':>9} {'Fehlerquote':>12} "
+              f"{'Importiert':>10} {'Uebersprungen':>13}")
+        print("-" * 78)
+        for r in stats:
+            print(f"{r['day']:<11} {r['server_id']:<7} {r['direction']:<9} {r['entries']:>9} "
+                  f"{r['error_rate'] * 100:>11.1f}% {r['imported']:>10} {r['skipped']:>13}")
+        return 0
 
+    history = db.get_sync_history(server_id=server_id, limit=args.limit)
+    if not history:
+        print("Keine Sync-Eintraege.")
+        return 0
+    print(f"{'Zeitpunkt':<20} {'Richtung':<9} {'Status':<8} {'Workflow':<9} {'Imp.':>5} "
+          f"{'Ueb.':>5} {'Fehl.':>5}")
+    print("-" * 70)
+    for e in history:
+        wf = e["workflow_id"] if e["workflow_id"] is not None else "-"
+        print(f"{e['synced_at']:<20} {e['direction']:<9} {e['status']:<8} {wf!s:<9} "
+              f"{e['imported']:>5} {e['skipped']:>5} {e['errors']:>5}")
+    return 0
+
+
+def cmd_compress(args):
+    """Gespeichertes Workflow-JSON mit dem konfigurierten Codec (neu) komprimieren."""
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
+
+    config = load_config()
+    db = open_database(config)
+    codec = args.codec or config.get("database", {}).get("compression", "none")
+
+    try:
+        result = db.recompress(codec)
+    except ValueError as e:
+        print(f"Fehler: {e}")
+        return 1
+    if args.vacuum:
+        db.vacuum()
+
+    before, after = result["bytes_before"], result["bytes_after"]
+    saved = (1 - after / before) * 100 if before else 0
+    print(f"{result['changed']} von {result['rows']} Zeilen umgeschrieben (Codec: {codec})")
+    print(f"workflow_json: {before / 1024:,.1f} KiB -> {after / 1024:,.1f} KiB ({saved:.0f}% gespart)")
     return 0
 
 
+def cmd_reindex(args):
+    """Abgeleitete Metadaten (Hash, Nodes, Trigger, Tags) und Indizes neu berechnen."""
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
+    from n8nManager.core.reindex import reindex
+
+    config = load_config()
+    db = open_database(config)
+
+    def progress(stats):
+        rate = stats["rows"] / stats["elapsed"] if stats["elapsed"] else 0
+        print(f"\r  {stats['rows']} geprueft, {stats['changed']} geaendert "
+              f"({rate:,.0f}/s)", end="", flush=True)
+
+    stats = reindex(db, jobs=args.jobs, batch_size=args.batch_size, dry_run=args.dry_run,
+                    restart=args.restart, progress=progress)
+    if stats["rows"]:
+        print()
+    if stats["resumed_from"]:
+        print(f"Fortgesetzt nach Workflow-ID {stats['resumed_from']}")
+    verb = "wuerden sich aendern" if args.dry_run else "aktualisiert"
+    print(f"{stats['rows']} Workflows geprueft, {stats['changed']} {verb} "
+          f"({stats['elapsed']:.1f}s)")
+    for err in stats["errors"][:10]:
+        print(f"  Fehler: {err}")
+    return 1 if stats["errors"] else 0
+
+
 def cmd_servers(args):
     """Server verwalten."""
-    from n8nManager.core.config import load_config, get_db_path
-    from n8nManager.core.database import Database
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
 
     config = load_config()
-    db = Database(get_db_path(config))
+    db = open_database(config)
 
     if args.add:
         parts = args.add
@@ -245,20 +514,41 @@ def cmd_servers(args):
             return 1
         name, url = parts[0], parts[1]
         api_key = parts[2] if len(parts) > 2 else ""
-        srv_id = db.add_server(name=name, url=url, api_key=api_key, is_default=args.default)
+        srv_id = db.add_server(name=name, url=url, api_key=api_key, is_default=args.default,
+                               rate_limit=args.rate or 0, max_in_flight=args.max_in_flight or 0)
         print(f"Server '{name}' hinzugefuegt (ID: {srv_id})")
         return 0
 
+    if args.limit:
+        srv = db.get_server_by_name(args.limit)
+        if not srv:
+            print(f"Server '{args.limit}' nicht gefunden.")
+            return 1
+        updates = {}
+        if args.rate is not None:
+            updates["rate_limit"] = args.rate
+        if args.max_in_flight is not None:
+            updates["max_in_flight"] = args.max_in_flight
+        if not updates:
+            print("Verwendung: servers --limit NAME [--rate N] [--max-in-flight N]")
+            return 1
+        db.update_server(srv["id"], **updates)
+        print(f"Grenzen fuer '{args.limit}' gesetzt: {updates}")
+        return 0
+
     servers = db.list_servers()
     if not servers:
         print("Keine Server konfiguriert. Nutze: servers --add NAME URL [APIKEY]")
         return 0
 
-    print(f"{'ID':<5} {'Name':<20} {'URL':<35} {'Status':<10} {'Default'}")
-    print("-" * 75)
+    print(f"{'ID':<5} {'Name':<20} {'URL':<35} {'Status':<13} {'Req/s':>6} {'Max':>4}  {'Default'}")
+    print("-" * 95)
     for srv in servers:
         default = "Ja" if srv.get("is_default") else "-"
-        print(f"{srv['id']:<5} {srv['name']:<20} {srv['url']:<35} {srv.get('status', '?'):<10} {default}")
+        rate = f"{srv['rate_limit']:g}" if srv.get("rate_limit") else "-"
+        in_flight = srv.get("max_in_flight") or "-"
+        print(f"{srv['id']:<5} {srv['name']:<20} {srv['url']:<35} {srv.get('status', '?'):<13} "
+              f"{rate:>6} {in_flight!s:>4}  {default}")
 
     return 0
 
@@ -331,10 +621,10 @@ def cmd_setup(args):
         print(f"  4. python -m n8nManager servers --add hetzner {result['url']} <API_KEY> --default")
 
         # Automatisch als Server eintragen (ohne API-Key)
-        from n8nManager.core.config import load_config, get_db_path
-        from n8nManager.core.database import Database
+        from n8nManager.core.config import load_config
+        from n8nManager.core.database import open_database
         config = load_config()
-        db = Database(get_db_path(config))
+        db = open_database(config)
         srv_id = db.add_server(
             name=f"n8n-{args.host}",
             url=result["url"],
@@ -350,8 +640,8 @@ def cmd_setup(args):
 
 def cmd_bach_register(args):
     """Workflow in BACH registrieren."""
-    from n8nManager.core.config import load_config, get_db_path
-    from n8nManager.core.database import Database
+    from n8nManager.core.config import load_config
+    from n8nManager.core.database import open_database
     from n8nManager.export.bach_export import register_in_bach
 
     config = load_config()
@@ -361,7 +651,7 @@ def cmd_bach_register(args):
         print("Setze: config --set bach.enabled true && config --set bach.db_path <pfad>")
         return 1
 
-    db = Database(get_db_path(config))
+    db = open_database(config)
     wf = db.get_workflow(args.workflow_id)
     if not wf:
         print(f"Workflow {args.workflow_id} nicht gefunden.")
@@ -388,9 +678,28 @@ def main():
     list_p = subparsers.add_parser("list", help="Workflows auflisten")
     list_p.set_defaults(func=cmd_list)
 
+    # search
+    search_p = subparsers.add_parser("search", help="Workflows durchsuchen (Volltext)")
+    search_p.add_argument("query", nargs="+", metavar="BEGRIFF",
+                          help="Suchbegriffe (UND-verknuepft, Praefix mit *)")
+    search_p.add_argument("--limit", "-n", type=int, default=20, help="Treffer pro Seite")
+    search_p.add_argument("--offset", type=int, default=0, help="Treffer ueberspringen")
+    search_p.set_defaults(func=cmd_search)
+
+    # nodes
+    nodes_p = subparsers.add_parser("nodes", help="Node-Nutzung / Workflows nach Node-Typ")
+    nodes_p.add_argument("--type", "-t", help="Node-Typ (Praefix mit *, z.B. '@n8n/*')")
+    nodes_p.add_argument("--host", help="Host der HTTP-URL (z.B. api.example.com)")
+    nodes_p.set_defaults(func=cmd_nodes)
+
     # import
     import_p = subparsers.add_parser("import", help="n8n JSON importieren")
-    import_p.add_argument("file", help="Pfad zur JSON-Datei")
+    import_p.add_argument("files", nargs="+", metavar="PFAD",
+                          help="JSON-Datei(en), Verzeichnisse oder Globs")
+    import_p.add_argument("--jobs", "-j", type=int, default=None,
+                          help="Prozesse fuer Hash/Validierung (Default: CPU-Kerne)")
+    import_p.add_argument("--batch-size", type=int, default=500,
+                          help="Workflows pro Transaktion")
     import_p.set_defaults(func=cmd_import)
 
     # export
@@ -401,23 +710,79 @@ def main():
 
     # push
     push_p = subparsers.add_parser("push", help="Workflow auf Server pushen")
-    push_p.add_argument("workflow_id", type=int, help="Workflow-ID")
-    push_p.add_argument("--server", "-s", help="Server-Name")
+    push_p.add_argument("workflow_id", type=int, nargs="?", help="Workflow-ID")
+    push_p.add_argument("--server", "-s", action="append",
+                        help="Server-Name (mehrfach: auf mehrere Server pushen)")
+    push_p.add_argument("--all", action="store_true", help="Alle lokalen Workflows pushen")
+    push_p.add_argument("--tag", help="Alle Workflows mit diesem Tag pushen")
+    push_p.add_argument("--ids", type=int, nargs="+", help="Diese Workflow-IDs pushen")
+    push_p.add_argument("--concurrency", type=int, default=0,
+                        help="Gleichzeitige Pushes (Standard: config n8n.push_concurrency)")
+    push_p.add_argument("--verify", action="store_true",
+                        help="Remote-Stand holen und vergleichen statt dem Remote-Cache zu trauen")
+    push_p.add_argument("--force", action="store_true",
+                        help="Auch unveraenderte Workflows pushen")
     push_p.set_defaults(func=cmd_push)
 
     # pull
     pull_p = subparsers.add_parser("pull", help="Workflows vom Server ziehen")
     pull_p.add_argument("--server", "-s", help="Server-Name")
+    pull_p.add_argument("--all", action="store_true", help="Alle Server gleichzeitig ziehen")
+    pull_p.add_argument("--concurrency", type=int, default=0,
+                        help="Server gleichzeitig bei --all (Standard: config n8n.pull_concurrency)")
+    pull_p.add_argument("--full", action="store_true",
+                        help="Watermark ignorieren und alle Workflows pruefen")
+    pull_p.add_argument("--batch-size", type=int, default=200,
+                        help="Workflows pro Transaktion")
     pull_p.set_defaults(func=cmd_pull)
 
     # status
     status_p = subparsers.add_parser("status", help="System-Status")
+    status_p.add_argument("--check", action="store_true",
+                          help="Materialisierte Zaehler gegen die Tabellen pruefen")
+    status_p.add_argument("--repair", action="store_true",
+                          help="Abweichende Zaehler korrigieren (impliziert --check)")
     status_p.set_defaults(func=cmd_status)
 
+    # history
+    history_p = subparsers.add_parser("history", help="Sync-Historie")
+    history_p.add_argument("--server", "-s", help="Server-Name")
+    history_p.add_argument("--limit", "-n", type=int, default=30, help="Anzahl Eintraege")
+    history_p.add_argument("--stats", action="store_true", help="Tagesstatistik anzeigen")
+    history_p.add_argument("--days", type=int, default=30, help="Zeitraum fuer --stats")
+    history_p.add_argument("--rollup", action="store_true",
+                           help="Eintraege ausserhalb der Aufbewahrung jetzt verdichten")
+    history_p.set_defaults(func=cmd_history)
+
+    # compress
+    compress_p = subparsers.add_parser("compress", help="Workflow-JSON komprimieren")
+    compress_p.add_argument("--codec", choices=["none", "zlib", "zstd", "auto"],
+                            help="Ziel-Codec (Default: database.compression)")
+    compress_p.add_argument("--vacuum", action="store_true",
+                            help="Danach VACUUM ausfuehren, um Platz freizugeben")
+    compress_p.set_defaults(func=cmd_compress)
+
+    # reindex
+    reindex_p = subparsers.add_parser("reindex", help="Metadaten und Indizes neu berechnen")
+    reindex_p.add_argument("--dry-run", action="store_true",
+                           help="Nichts schreiben, nur geaenderte Zeilen zaehlen")
+    reindex_p.add_argument("--jobs", "-j", type=int, default=None,
+                           help="Prozesse fuer die Analyse (Default: CPU-Kerne)")
+    reindex_p.add_argument("--batch-size", type=int, default=500,
+                           help="Workflows pro Transaktion")
+    reindex_p.add_argument("--restart", action="store_true",
+                           help="Checkpoint eines abgebrochenen Laufs verwerfen")
+    reindex_p.set_defaults(func=cmd_reindex)
+
     # servers
     servers_p = subparsers.add_parser("servers", help="Server verwalten")
     servers_p.add_argument("--add", nargs="+", metavar="ARG", help="NAME URL [APIKEY]")
     servers_p.add_argument("--default", action="store_true", help="Als Default setzen")
+    servers_p.add_argument("--limit", metavar="NAME",
+                           help="Client-Grenzen eines Servers setzen (mit --rate/--max-in-flight)")
+    servers_p.add_argument("--rate", type=float, help="Requests pro Sekunde (0 = unbegrenzt)")
+    servers_p.add_argument("--max-in-flight", type=int,
+                           help="Gleichzeitige Requests (0 = unbegrenzt)")
     servers_p.set_defaults(func=cmd_servers)
 
     # config
@@ -470,7 +835,13 @@ def main():
         args.key = None
         args.value = None
 
-    return args.func(args)
+    try:
+        return args.func(args)
+    finally:
+        # Gepoolte n8n-Clients schliessen, falls der Befehl welche genutzt hat
+        n8n_client = sys.modules.get("n8nManager.core.n8n_client")
+        if n8n_client is not None:
+            n8n_client.close_clients()
 
 
 if __name__ == "__main__":
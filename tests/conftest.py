@@ -0,0 +1,77 @@
+"""Gemeinsame Fixtures: Datenbanken in tmp_path und ein n8n-Stub per httpx.MockTransport."""
+import itertools
+import json
+
+import httpx
+import pytest
+
+from n8nManager.core.n8n_client import AsyncN8nClient
+from n8nManager.core.storage import open_backend
+
+
+def workflow(name: str, nodes: int = 1, **extra) -> dict:
+    """Minimaler n8n-Workflow mit nodes Set-Nodes."""
+    return {"name": name, "connections": {},
+            "nodes": [{"name": f"Node {i}", "type": "n8n-nodes-base.set",
+                       "parameters": {"value": i}} for i in range(nodes)], **extra}
+
+
+class N8nStub:
+    """n8n-API im Speicher: POST/PUT/GET auf /workflows, zaehlt Requests pro Methode."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.store: dict[str, dict] = {}
+        self.requests: list[str] = []
+        self._next_id = 1000
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.method)
+        workflow_id = request.url.path.rsplit("/", 1)[1]
+        if request.method == "POST":
+            workflow_id, self._next_id = str(self._next_id), self._next_id + 1
+        if request.method in ("POST", "PUT"):
+            self.store[workflow_id] = {**json.loads(request.content), "id": workflow_id,
+                                       "updatedAt": "2026-01-01T00:00:00.000Z"}
+        elif workflow_id == "workflows":
+            return httpx.Response(200, json={"data": list(self.store.values()),
+                                             "nextCursor": None})
+        if workflow_id not in self.store:
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(200, json=self.store[workflow_id])
+
+    def client(self) -> AsyncN8nClient:
+        client = AsyncN8nClient(self.url, "key", retries=0)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+        return client
+
+    def get_client(self):
+        """Ersatz fuer get_async_client (Parameter get_client von pull_all/push_batch)."""
+        client = self.client()
+
+        async def get_client(server: dict) -> AsyncN8nClient:
+            return client
+        return get_client
+
+
+@pytest.fixture(params=["sqlite", "sharded"])
+def backend(request, tmp_path):
+    db = open_backend(request.param, tmp_path / "n8n.db")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = open_backend("sqlite", tmp_path / "n8n.db")
+    yield db
+    db.close()
+
+
+_hosts = itertools.count(1)
+
+
+@pytest.fixture
+def stub():
+    # Eigene URL pro Test: Breaker und Limiter sind pro URL global
+    return N8nStub(f"http://n8n-{next(_hosts)}.test")
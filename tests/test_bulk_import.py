@@ -0,0 +1,31 @@
+"""bulk_import: Exporte mit mehreren Workflows, fehlerhafte Dokumente pro Dokument."""
+import json
+
+from n8nManager.core import bulk_import as bulk
+from tests.conftest import workflow
+
+
+def test_bulk_import_counts_duplicates_and_invalid(db, tmp_path):
+    export = [workflow("A"), workflow("B"), workflow("A"), {"name": "ohne nodes"}]
+    (tmp_path / "export.json").write_text(json.dumps(export), encoding="utf-8")
+    (tmp_path / "kaputt.json").write_text("{", encoding="utf-8")
+
+    stats = bulk.bulk_import(db, [str(tmp_path / "*.json")], jobs=1)
+    assert (stats["imported"], stats["duplicates"], stats["invalid"]) == (2, 1, 2)
+    assert len(stats["errors"]) == 2
+
+
+def test_bulk_import_keeps_going_after_analysis_error(db, tmp_path, monkeypatch):
+    analyze = bulk.WorkflowAnalysis
+
+    def failing(data):
+        if data["name"] == "Boese":
+            raise RuntimeError("kaputt")
+        return analyze(data)
+    monkeypatch.setattr(bulk, "WorkflowAnalysis", failing)
+    export = [workflow("Gut"), workflow("Boese"), {**workflow("Tags"), "tags": ["a"]}]
+    (tmp_path / "export.json").write_text(json.dumps(export), encoding="utf-8")
+
+    stats = bulk.bulk_import(db, [str(tmp_path / "export.json")], jobs=1)
+    assert (stats["imported"], stats["invalid"]) == (2, 1)
+    assert stats["errors"] == [f"{tmp_path / 'export.json'}#1: RuntimeError: kaputt"]
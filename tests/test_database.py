@@ -0,0 +1,107 @@
+"""Schema-Migration, Blob-Store und Versionen der SQLite-Datenbank."""
+import json
+import sqlite3
+
+from n8nManager.core.database import SCHEMA_VERSION, Database, _migration_1
+from tests.conftest import workflow
+
+
+def _refcounts(db: Database) -> dict[str, int]:
+    with db._connect() as conn:
+        return {r["hash"]: r["refcount"]
+                for r in conn.execute("SELECT hash, refcount FROM blobs")}
+
+
+# ── Migration ────────────────────────────────────────────────────────────
+
+
+def _baseline(path) -> str:
+    """DB mit Schema-Version 1: workflow_json inline, doppelt gepullter Workflow."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    _migration_1(conn)
+    conn.execute("PRAGMA user_version = 1")
+    conn.execute("INSERT INTO servers (name, url) VALUES ('prod', 'http://prod')")
+    text = json.dumps(workflow("Alt", nodes=2))
+    for _ in range(2):
+        conn.execute("""INSERT INTO workflows (name, n8n_id, server_id, workflow_json, source)
+                        VALUES ('Alt', '7', 1, ?, 'pull')""", (text,))
+    conn.execute("""INSERT INTO workflow_versions (workflow_id, version_number, workflow_json)
+                    VALUES (2, 1, ?)""", (text,))
+    conn.commit()
+    conn.close()
+    return text
+
+
+def test_migration_from_baseline(tmp_path):
+    path = tmp_path / "alt.db"
+    text = _baseline(path)
+
+    db = Database(path)
+    with db._connect() as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION == 13
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master")}
+        stored = conn.execute("SELECT workflow_json FROM workflows").fetchall()
+    assert {"blobs", "workflows_fts", "workflow_nodes", "remote_workflows"} <= tables
+    # Inhalte liegen im Blob-Store, die Spalte ist leer
+    assert [r[0] for r in stored] == ["", ""]
+
+    # Migration 2: nur die neueste Kopie behaelt (server_id, n8n_id)
+    old, new = db.get_workflow(1), db.get_workflow(2)
+    assert (old["n8n_id"], new["n8n_id"]) == ("", "7")
+    assert json.loads(new["workflow_json"]) == json.loads(text)
+    assert json.loads(db.get_version(2, 1)["workflow_json"]) == json.loads(text)
+    # Zwei Workflows und ein Versions-Vollstand teilen einen Blob
+    assert list(_refcounts(db).values()) == [3]
+    # Migration 6: Volltextindex fuer bestehende Workflows aufgebaut
+    assert sorted(w["id"] for w in db.search_workflows("Alt")[0]) == [1, 2]
+    db.close()
+
+    # Erneutes Oeffnen migriert nichts mehr
+    Database(path).close()
+
+
+# ── Blob-Store ───────────────────────────────────────────────────────────
+
+
+def test_blob_refcount_after_update_and_delete(db):
+    a, b = json.dumps(workflow("A")), json.dumps(workflow("B"))
+    first = db.add_workflow("A", a)
+    second = db.add_workflow("A Kopie", a)
+    hash_a = db.get_workflow(first)["content_hash"]
+    assert _refcounts(db) == {hash_a: 2}
+
+    db.update_workflow(second, workflow_json=b)
+    hash_b = db.get_workflow(second)["content_hash"]
+    assert _refcounts(db) == {hash_a: 1, hash_b: 1}
+
+    # Gleicher Inhalt erneut: kein zweiter Blob, kein doppelter Zaehler
+    db.update_workflow(second, workflow_json=b)
+    assert _refcounts(db) == {hash_a: 1, hash_b: 1}
+
+    db.delete_workflow(first)
+    assert _refcounts(db) == {hash_b: 1}
+    db.delete_workflow(second)
+    assert _refcounts(db) == {}
+
+
+# ── Versionen ────────────────────────────────────────────────────────────
+
+
+def test_delta_versions_across_snapshot_boundary(tmp_path):
+    db = Database(tmp_path / "v.db", snapshot_interval=3)
+    states = []
+    data = workflow("Versioniert", nodes=20)
+    workflow_id = db.add_workflow(data["name"], json.dumps(data))
+    for i in range(7):
+        data = json.loads(json.dumps(data))
+        data["nodes"][i]["parameters"]["value"] = f"v{i}"
+        states.append(data)
+        db.add_version(workflow_id, json.dumps(data), change_note=f"v{i + 1}")
+
+    storage = {v["version_number"]: v["storage"] for v in db.get_versions(workflow_id)}
+    assert storage == {1: "full", 2: "delta", 3: "delta", 4: "full", 5: "delta",
+                       6: "delta", 7: "full"}
+    for number, expected in enumerate(states, start=1):
+        assert json.loads(db.get_version(workflow_id, number)["workflow_json"]) == expected
+    db.close()
@@ -0,0 +1,138 @@
+"""CircuitBreaker: Zustandswechsel, Listener und Proben abgebrochener Requests."""
+import asyncio
+import time
+import types
+
+import httpx
+import pytest
+
+from n8nManager.core import n8n_client
+from n8nManager.core.n8n_client import (AsyncN8nClient, CircuitBreaker, N8nClient,
+                                        set_circuit_listener)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Steuerbares time.monotonic fuer den cooldown."""
+    now = [1000.0]
+    # Nur die Sicht von n8n_client -- der Event-Loop braucht die echte Uhr
+    fake = types.SimpleNamespace(monotonic=lambda: now[0], time=time.time, sleep=time.sleep)
+    monkeypatch.setattr(n8n_client, "time", fake)
+    return now
+
+
+@pytest.fixture
+def changes():
+    seen = []
+    set_circuit_listener(lambda url, state: seen.append(state))
+    yield seen
+    set_circuit_listener(None)
+
+
+@pytest.fixture
+def half_open(clock):
+    """Offener Breaker, dessen cooldown abgelaufen ist: der naechste Request ist die Probe."""
+    breaker = CircuitBreaker("http://n8n", threshold=1, cooldown=30)
+    breaker.failure()
+    clock[0] += 30
+    return breaker
+
+
+def test_opens_after_threshold_failures(clock, changes):
+    breaker = CircuitBreaker("http://n8n", threshold=3, cooldown=30)
+    breaker.failure()
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot() == {"state": "open", "failures": 3, "retry_in": 30.0}
+    assert changes == ["open"]
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("http://n8n", threshold=2)
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_closes_on_success(clock, changes):
+    breaker = CircuitBreaker("http://n8n", threshold=1, cooldown=30)
+    breaker.failure()
+    clock[0] += 29
+    assert not breaker.allow()
+    clock[0] += 1
+    # Genau ein Probe-Request, weitere warten auf dessen Ergebnis
+    assert breaker.allow() and breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+    breaker.success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+    assert changes == ["open", "half_open", "closed"]
+
+
+def test_half_open_probe_reopens_on_failure(clock, changes):
+    breaker = CircuitBreaker("http://n8n", threshold=5, cooldown=30)
+    for _ in range(5):
+        breaker.failure()
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["retry_in"] == 30.0
+    assert changes == ["open", "half_open", "open"]
+
+
+def test_listener_errors_do_not_break_requests(clock, changes, caplog):
+    def broken(url, state):
+        raise RuntimeError("DB weg")
+    set_circuit_listener(broken)
+    breaker = CircuitBreaker("http://n8n", threshold=1)
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert "Circuit-Status nicht gespeichert: DB weg" in caplog.text
+
+
+# ── Abgebrochene Proben ──────────────────────────────────────────────────
+
+
+def test_cancelled_probe_is_released(half_open):
+    async def hang(request):
+        await asyncio.sleep(60)
+
+    async def main():
+        client = AsyncN8nClient("http://n8n", "key", breaker=half_open)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(hang))
+        task = asyncio.create_task(client.get_workflow("1"))
+        await asyncio.sleep(0.01)
+        assert half_open.state == CircuitBreaker.HALF_OPEN and not half_open.allow()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await client.aclose()
+    asyncio.run(main())
+    # Die naechste Anfrage darf wieder proben
+    assert half_open.allow()
+
+
+def test_unexpected_error_releases_probe(half_open):
+    def broken(request):
+        raise RuntimeError("kaputt")
+
+    client = N8nClient("http://n8n", "key", breaker=half_open)
+    client._client = httpx.Client(transport=httpx.MockTransport(broken))
+    with pytest.raises(RuntimeError):
+        client.get_workflow("1")
+    client.close()
+    assert half_open.allow()
+
+
+def test_release_keeps_other_requests_from_probing(half_open):
+    # Ein normaler Request, der waehrend der Probe abbricht, gibt sie nicht frei
+    assert half_open.enter() == "probe"
+    half_open.release("request")
+    assert half_open.enter() is None
+    half_open.release("probe")
+    assert half_open.enter() == "probe"
@@ -0,0 +1,23 @@
+"""reindex: Fehler pro Zeile, Checkpoint laeuft weiter."""
+import json
+
+from n8nManager.core import reindex as rx
+from n8nManager.core.reindex import CHECKPOINT_KEY, reindex
+from tests.conftest import workflow
+
+
+def test_reindex_reports_failing_rows_and_finishes(db, monkeypatch):
+    ids = [db.add_workflow(f"W{i}", json.dumps(workflow(f"W{i}", nodes=i + 1)))
+           for i in range(3)]
+    analyze = rx.WorkflowAnalysis
+
+    def failing(text):
+        if '"W1"' in text:
+            raise TypeError("kaputt")
+        return analyze(text)
+    monkeypatch.setattr(rx, "WorkflowAnalysis", failing)
+
+    stats = reindex(db, jobs=1, batch_size=1)
+    assert stats["rows"] == 3 and stats["changed"] == 0
+    assert stats["errors"] == [f"Workflow {ids[1]}: TypeError: kaputt"]
+    assert db.get_meta(CHECKPOINT_KEY) is None
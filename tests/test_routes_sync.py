@@ -0,0 +1,41 @@
+"""Route /pull/{server_id}: jeder Abbruch wird gebucht, Gelesenes geschrieben."""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from n8nManager.api import server
+from n8nManager.api.routes_sync import pull_from_server
+from n8nManager.core import n8n_client
+from tests.test_sync import remote
+
+
+class BrokenAsyncClient:
+    async def iter_workflows(self):
+        yield remote("1", "2026-01-01T00:00:00Z")
+        raise AttributeError("'list' object has no attribute 'get'")
+
+
+@pytest.fixture
+def api_db(db, monkeypatch):
+    """Globale API-DB auf die Test-DB umbiegen (nie die echte Datei oeffnen)."""
+    monkeypatch.setattr(server, "_db", db)
+    monkeypatch.setattr(server, "_adb", None)
+    yield db
+    if server._adb is not None:
+        server._adb._executor.shutdown()
+
+
+def test_pull_route_records_unexpected_errors(api_db, monkeypatch):
+    async def get_client(srv):
+        return BrokenAsyncClient()
+    monkeypatch.setattr(n8n_client, "get_async_client", get_client)
+    server_id = api_db.add_server("s1", "http://s1", "key")
+
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(pull_from_server(server_id))
+    assert raised.value.status_code == 502
+    assert raised.value.detail.startswith("AttributeError: ")
+    assert len(api_db.list_workflows(summary=True)) == 1
+    entry = api_db.get_sync_history(server_id=server_id)[0]
+    assert (entry["status"], entry["errors"]) == ("error", 1)
@@ -0,0 +1,45 @@
+"""Storage-Backends: sqlite und sharded verhalten sich gleich; Shards anderer Prozesse."""
+import asyncio
+import json
+
+from n8nManager.core.storage import _gid, open_backend
+from n8nManager.core.sync import pull_all, push_batch, select_workflows
+from tests.conftest import workflow
+
+
+def test_pull_after_push_keeps_one_row(backend, stub):
+    server = backend.get_server(backend.add_server("s1", stub.url, "key"))
+    backend.add_workflow("L", json.dumps(workflow("L")))
+    workflows, _ = select_workflows(backend)
+    results = asyncio.run(push_batch(backend, workflows, [server],
+                                     get_client=stub.get_client()))
+    assert [r["status"] for r in results] == ["success"]
+
+    asyncio.run(pull_all(backend, [backend.get_server(server["id"])], full=True,
+                         get_client=stub.get_client()))
+    rows = [(w["server_id"], w["n8n_id"], w["name"])
+            for w in backend.list_workflows(summary=True)]
+    assert rows == [(server["id"], "1000", "L")]
+
+
+def test_sharded_sees_shards_created_by_another_process(tmp_path):
+    api = open_backend("sharded", tmp_path / "n8n.db")
+    cli = open_backend("sharded", tmp_path / "n8n.db")
+    server_id = cli.add_server("s1", "http://s1", "key")
+    workflow_id = cli.add_workflow("Gezogen", json.dumps(workflow("Gezogen")),
+                                   server_id=server_id, n8n_id="7", source="pull")
+
+    assert api.get_workflow(workflow_id)["name"] == "Gezogen"
+    assert [w["id"] for w in api.list_workflows(server_id=server_id)] == [workflow_id]
+    assert [w["id"] for w in api.list_workflows(summary=True)] == [workflow_id]
+    assert api.get_stats()["workflows"] == 1
+    cli.close()
+    api.close()
+
+
+def test_sharded_lookup_does_not_create_shards(tmp_path):
+    db = open_backend("sharded", tmp_path / "n8n.db")
+    assert db.get_workflow(_gid(5, 1)) is None
+    assert db.list_workflows(server_id=5) == []
+    assert not (tmp_path / "n8n.shards" / "server_5.db").exists()
+    db.close()
@@ -0,0 +1,146 @@
+"""PullIngest, pull_workflows, pull_all und push_batch gegen einen n8n-Stub."""
+import asyncio
+import threading
+
+import pytest
+
+from n8nManager.core.sync import PullIngest, finish_pull, pull_all, pull_workflows
+from tests.conftest import workflow
+
+
+def remote(n8n_id: str, updated: str, name: str = "") -> dict:
+    """Workflow, wie ihn die n8n API liefert."""
+    return {**workflow(name or f"Remote {n8n_id}"), "id": n8n_id, "updatedAt": updated}
+
+
+class BrokenClient:
+    """Synchroner Client, dessen zweite Seite scheitert."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+    def iter_workflows(self):
+        yield remote("1", "2026-01-01T00:00:00Z")
+        raise self.error
+
+
+# ── PullIngest ───────────────────────────────────────────────────────────
+
+
+def test_pull_ingest_updates_changed_workflow(backend):
+    server_id = backend.add_server("s1", "http://s1", "key")
+    for name in ("Vorher", "Nachher"):
+        ingest = PullIngest(backend, server_id)
+        ingest.add(remote("1", "2026-01-01T00:00:00Z", name=name))
+        ingest.flush()
+    assert ingest.stats["updated"] == 1
+    assert [w["name"] for w in backend.list_workflows(summary=True)] == ["Nachher"]
+
+
+def test_pull_ingest_flushes_full_batches(db):
+    server_id = db.add_server("s1", "http://s1", "key")
+    ingest = PullIngest(db, server_id, batch_size=2)
+    assert not ingest.add(remote("1", "2026-01-01T00:00:00Z"))
+    assert ingest.add(remote("2", "2026-01-02T00:00:00Z"))
+    ingest.flush()
+    ingest.add(remote("3", "2026-01-03T00:00:00Z"))
+    ingest.flush()
+    assert ingest.stats["imported"] == 3 and not ingest.take()
+
+
+def test_pull_ingest_skips_unchanged(backend):
+    server_id = backend.add_server("s1", "http://s1", "key")
+    ingest = PullIngest(backend, server_id)
+    for wf in (remote("1", "2026-01-01T00:00:00Z"), remote("2", "2026-01-02T00:00:00Z")):
+        ingest.add(wf)
+    ingest.flush()
+    finish_pull(backend, ingest)
+    assert ingest.stats["imported"] == 2
+    assert backend.get_server(server_id)["pull_watermark"] == "2026-01-02T00:00:00Z"
+
+    # Ab der Watermark: aelteres unchanged ohne Schreiben, gleiches updatedAt erneut geprueft
+    ingest = PullIngest(backend, server_id, since="2026-01-02T00:00:00Z")
+    ingest.add(remote("1", "2026-01-01T00:00:00Z"))
+    ingest.add(remote("2", "2026-01-02T00:00:00Z"))
+    ingest.add(remote("3", "2026-01-03T00:00:00Z"))
+    ingest.flush()
+    finish_pull(backend, ingest)
+    stats = ingest.stats
+    assert (stats["unchanged"], stats["skipped"], stats["imported"]) == (1, 1, 1)
+    assert backend.get_server(server_id)["pull_watermark"] == "2026-01-03T00:00:00Z"
+    assert len(backend.list_workflows(summary=True)) == 3
+
+
+def test_watermark_stops_at_failed_workflow(db, monkeypatch):
+    server_id = db.add_server("s1", "http://s1", "key")
+    upsert = db.upsert_workflows_bulk
+
+    def failing(server_id, items):
+        if any(item["n8n_id"] == "2" for item in items):
+            raise ValueError("kaputt")
+        return upsert(server_id, items)
+    monkeypatch.setattr(db, "upsert_workflows_bulk", failing)
+
+    ingest = PullIngest(db, server_id)
+    for day in (1, 2, 3):
+        ingest.add(remote(str(day), f"2026-01-0{day}T00:00:00Z"))
+    ingest.flush()
+    finish_pull(db, ingest)
+    assert (ingest.stats["imported"], ingest.stats["failed"]) == (2, 1)
+    assert [f["n8n_id"] for f in ingest.failed] == ["2"]
+    # Der nicht geschriebene Workflow wird beim naechsten Pull erneut gelesen
+    assert db.get_server(server_id)["pull_watermark"] == "2026-01-02T00:00:00Z"
+    assert db.get_sync_history(server_id=server_id)[0]["status"] == "error"
+
+
+# ── pull_workflows ───────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("error, expected", [
+    (AttributeError("'list' object has no attribute 'get'"), "AttributeError: "),
+    (ValueError("Expecting value"), "ValueError: "),
+])
+def test_pull_workflows_records_unexpected_errors(db, error, expected):
+    server_id = db.add_server("s1", "http://s1", "key")
+    result = pull_workflows(db, BrokenClient(error), server_id, batch_size=10)
+
+    assert result["error"].startswith(expected) and result["imported"] == 1
+    assert len(db.list_workflows(summary=True)) == 1
+    entry = db.get_sync_history(server_id=server_id)[0]
+    assert (entry["status"], entry["errors"]) == ("error", 1)
+    assert expected in entry["details"]
+    # Abbruch beim Lesen: Watermark bleibt stehen
+    assert not db.get_server(server_id)["pull_watermark"]
+
+
+# ── pull_all ─────────────────────────────────────────────────────────────
+
+
+def test_pull_all_isolates_broken_server(db, stub):
+    good = db.get_server(db.add_server("gut", stub.url, "key"))
+    bad = db.get_server(db.add_server("kaputt", "http://kaputt.test", "key"))
+    stub.store["1"] = remote("1", "2026-01-01T00:00:00Z")
+    clients = {good["id"]: stub.client()}
+
+    async def get_client(server):
+        return clients[server["id"]]  # KeyError fuer den kaputten Server
+
+    reports = asyncio.run(pull_all(db, [bad, good], get_client=get_client))
+    assert reports[0]["error"].startswith("KeyError") and reports[0]["errors"] == 1
+    assert reports[1]["error"] is None and reports[1]["imported"] == 1
+    statuses = {e["server_id"]: e["status"] for e in db.get_sync_history(direction="pull")}
+    assert statuses == {bad["id"]: "error", good["id"]: "success"}
+
+
+def test_pull_all_reuses_one_writer_thread(db, stub, monkeypatch):
+    server = db.get_server(db.add_server("s1", stub.url, "key"))
+    threads = set()
+    finish = db.add_sync_entry
+
+    def record(*args, **kwargs):
+        threads.add(threading.current_thread().name)
+        return finish(*args, **kwargs)
+    monkeypatch.setattr(db, "add_sync_entry", record)
+    for _ in range(2):
+        asyncio.run(pull_all(db, [server], get_client=stub.get_client()))
+    assert len(threads) == 1 and threads.pop().startswith("n8n-sync-writer")
@@ -0,0 +1,31 @@
+"""WorkflowAnalysis: Metadaten auch aus unvollstaendigen Exporten."""
+import json
+
+import pytest
+
+from n8nManager.core.workflow_parser import WorkflowAnalysis
+from tests.conftest import workflow
+
+
+def test_analysis_extracts_metadata():
+    data = workflow("Mit Trigger", nodes=2, tags=[{"name": "prod"}])
+    data["nodes"][1]["type"] = "n8n-nodes-base.webhook"
+    wf = WorkflowAnalysis(json.dumps(data))
+    assert (wf.node_count, wf.trigger_type, wf.tags) == (2, "n8n-nodes-base.webhook", ["prod"])
+    assert wf.data == data and len(wf.nodes) == 2
+
+
+@pytest.mark.parametrize("data, node_count, tags", [
+    ({"nodes": [], "tags": ["a", {"name": "b"}]}, 0, ["b"]),
+    ({"nodes": None}, 0, []),
+    ({"nodes": "kaputt", "tags": "a"}, 0, []),
+    ({"nodes": ["x", {"name": "Set", "type": None}]}, 1, []),
+])
+def test_analysis_skips_malformed_nodes_and_tags(data, node_count, tags):
+    wf = WorkflowAnalysis(data)
+    assert (wf.node_count, wf.trigger_type, wf.tags) == (node_count, "", tags)
+
+
+def test_add_workflow_accepts_malformed_export(db):
+    workflow_id = db.add_workflow("Alt", json.dumps({"nodes": ["x"], "tags": ["a"]}))
+    assert db.get_workflow(workflow_id)["node_count"] == 0